@@ -1,70 +1,97 @@
-// 캐시 이름 설정
-const CACHE_NAME = 'bangdeng-cache-v1';
-const OFFLINE_URL = '/offline.html';
+// 서비스 워커 — 앱 셸은 설치할 때 미리 캐시하고, 내용 해시 파일명(번역 번들, 데이터 샤드)은 처음 받을 때 영구 캐시
+// 앱 셸이나 번역을 고친 뒤 python build_locales.py를 실행하면 아래 목록과 버전이 갱신됨
+// → 새 서비스 워커가 새 버전 캐시를 채운 뒤 이전 버전 캐시를 지움
 
-// 캐싱할 파일 목록
-const FILES_TO_CACHE = [
-    '/',
-    '/index.html',
-    '/css/style.css',
-    '/js/app.js',
-    '/manifest.json',
-    '/locales/en.json',
-    '/locales/bn.json',
-    // 나중에 추가할 이미지, 아이콘 등
+// <precache> 자동 생성 (python build_locales.py) — 직접 수정하지 않음
+const PRECACHE_VERSION = 'c5b6a6011524';
+const PRECACHE_FILES = [
+    '/index.html',  // b010a0530f31
+    '/offline.html',  // 9907218839db
+    '/manifest.json',  // 5ebccd014e2b
+    '/app/css/style.css',  // 077b0acf94d1
+    '/app/js/firebase-app-compat.js',  // 64bf79fac162
+    '/app/js/firebase-firestore-compat.js',  // d88842959d7b
+    '/js/countries.js',  // 4063511865af
+    '/js/locales.js',  // bb2c248d919b
+    '/js/global-app.js',  // 33a16f892b70
+    '/img/icon-192x192.png',  // 5c6ee09c0944
 ];
+// </precache>
+
+const CACHE_PREFIX = 'dengue-tracker-';
+const PRECACHE = `${CACHE_PREFIX}precache-${PRECACHE_VERSION}`;
+const RUNTIME = `${CACHE_PREFIX}runtime-v1`;       // 이름에 내용 해시가 있는 파일만 저장 (내용이 바뀌면 URL이 바뀜)
+const OFFLINE_URL = '/offline.html';
+
+// {이름}.{12자리 해시}.json(.gz/.br) — build_locales.py / export_shards.py 출력
+const HASHED_FILE = /\.[0-9a-f]{12}\.json(\.gz|\.br)?$/;
+// 버전이 URL에 고정된 외부 라이브러리 (Leaflet 등)
+const VERSIONED_CDN = /^https:\/\/unpkg\.com\/[^/]+@\d/;
 
 self.addEventListener('install', (event) => {
-  event.waitUntil(
-    caches.open(CACHE_NAME)
-      .then((cache) => {
-        console.log('[SW] 캐싱 시작');
-        return cache.addAll(FILES_TO_CACHE);
-      })
-      .then(() => self.skipWaiting())  // 새 SW 즉시 활성화
-  );
+    event.waitUntil(
+        caches.open(PRECACHE)
+            .then((cache) => cache.addAll(PRECACHE_FILES.map((url) => new Request(url, { cache: 'reload' }))))
+            .then(() => self.skipWaiting())  // 새 SW 즉시 활성화
+    );
 });
 
-// fetch 이벤트 수정 (CORS 오류 방지)
+self.addEventListener('activate', (event) => {
+    // 현재 버전이 아닌 사전 캐시 삭제
+    event.waitUntil(
+        caches.keys()
+            .then((names) => Promise.all(names
+                .filter((name) => name.startsWith(CACHE_PREFIX) && name !== PRECACHE && name !== RUNTIME)
+                .map((name) => caches.delete(name))))
+            .then(() => self.clients.claim())
+    );
+});
+
+// 캐시에 없으면 받아서 저장 (정상 응답만, CDN 스크립트의 opaque 응답 포함)
+function cacheFirst(request, cacheName) {
+    return caches.open(cacheName).then((cache) => cache.match(request).then((cached) => {
+        if (cached) return cached;
+        return fetch(request).then((response) => {
+            if (response.ok || response.type === 'opaque') {
+                cache.put(request, response.clone());
+            }
+            return response;
+        });
+    }));
+}
+
+// fetch 핸들러는 하나만 (핸들러가 여럿이면 먼저 respondWith한 쪽만 적용됨)
 self.addEventListener('fetch', (event) => {
-  // 외부 요청은 캐싱 제외 (Firebase, Leaflet 등)
-  if (event.request.url.startsWith('http') && 
-      !event.request.url.includes('localhost')) {
-    event.respondWith(fetch(event.request));
-    return;
-  }
+    const request = event.request;
+    if (request.method !== 'GET') return;
+    const url = new URL(request.url);
 
-  event.respondWith(
-    caches.match(event.request)
-      .then((response) => response || fetch(event.request))
-      .catch(() => caches.match(OFFLINE_URL))  // 오프라인 시 대체 페이지
-  );
-});
+    if (url.origin !== self.location.origin) {
+        // Firebase, 광고 등 외부 요청은 브라우저 기본 처리 (버전 고정 CDN만 캐시)
+        if (VERSIONED_CDN.test(request.url)) {
+            event.respondWith(cacheFirst(request, RUNTIME));
+        }
+        return;
+    }
 
-// 네트워크 요청 가로채기
-self.addEventListener('fetch', event => {
-    console.log('[Service Worker] Fetch', event.request.url);
-    event.respondWith(
-        caches.match(event.request)
-            .then(response => {
-                // 캐시에 있으면 캐시에서 반환
-                if (response) {
-                    return response;
-                }
-                // 캐시에 없으면 네트워크 요청
-                return fetch(event.request)
-                    .then(res => {
-                        // 응답을 복제하고 캐시에 저장
-                        return caches.open(CACHE_NAME)
-                            .then(cache => {
-                                cache.put(event.request.url, res.clone());
-                                return res;
-                            });
-                    })
-                    .catch(err => {
-                        console.log('Fetch failed:', err);
-                        // 네트워크 요청 실패 시 오프라인 페이지 등 대체 콘텐츠 제공 가능
-                    });
-            })
-    );
-});
\ No newline at end of file
+    // 페이지 이동: 사전 캐시한 index.html → 재방문은 네트워크 없이 표시
+    if (request.mode === 'navigate') {
+        const path = url.pathname === '/' ? '/index.html' : url.pathname;
+        event.respondWith(
+            caches.match(path, { cacheName: PRECACHE })
+                .then((cached) => cached || fetch(request))
+                .catch(() => caches.match(OFFLINE_URL, { cacheName: PRECACHE }))
+        );
+        return;
+    }
+
+    if (PRECACHE_FILES.includes(url.pathname)) {
+        event.respondWith(
+            caches.match(url.pathname, { cacheName: PRECACHE })
+                .then((cached) => cached || fetch(request))
+        );
+    } else if (HASHED_FILE.test(url.pathname)) {
+        event.respondWith(cacheFirst(request, RUNTIME));
+    }
+    // 그 밖의 요청(data/shards/manifest.json 등 해시 없는 파일)은 항상 네트워크
+});
@@ -0,0 +1,46 @@
+"""
+원자적 파일 쓰기
+같은 디렉터리의 임시 파일에 다 쓴 뒤 os.replace로 교체 → 도중에 중단돼도 반쯤 쓰인 파일이 남지 않고 기존 파일 유지
+"""
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+
+
+@contextmanager
+def atomic_open(path, mode='w', fsync=True, **kwargs):
+    """with atomic_open('data/x.csv', newline='', encoding='utf-8') as f: ...
+
+    with 블록이 예외 없이 끝났을 때만 path를 교체하고, 실패하면 임시 파일을 지운다.
+    fsync=False면 디스크 동기화를 생략 (프로세스 중단에는 여전히 안전, 작은 파일을 대량으로 쓸 때 사용)
+    """
+    directory = os.path.dirname(path) or '.'
+    tmp_path = os.path.join(directory, f".{os.path.basename(path)}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, mode, **kwargs) as f:
+            yield f
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def write_bytes_atomic(path, payload, fsync=True):
+    with atomic_open(path, 'wb', fsync=fsync) as f:
+        f.write(payload)
+
+
+def write_text_atomic(path, text):
+    with atomic_open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def write_json_atomic(path, data):
+    with atomic_open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
@@ -0,0 +1,99 @@
+"""
+Overpass 응답 처리 메모리 벤치마크: 기존 방식(json.loads + 리스트) vs 스트리밍 파이프라인
+실행: python benchmarks/bench_stream_memory.py 10000 100000 300000
+"""
+
+import csv
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from osm_data_collector import CSV_FIELDS, OSMDengueCollector
+from overpass_stream import ElementStream, iter_file_chunks
+
+NAMES = [
+    'City Dengue Center', 'General Hospital', 'Free Clinic Dengue',
+    'Blood Test Lab', 'Vaccination Center', 'Community Health Post'
+]
+
+
+def write_fake_response(path, count, seed=42):
+    """count개 node를 가진 Overpass 형식 JSON 파일 생성"""
+    rng = random.Random(seed)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{"version": 0.6, "generator": "bench", "elements": [\n')
+        for i in range(count):
+            element = {
+                'type': 'node',
+                'id': i,
+                'lat': rng.uniform(-10, 10),
+                'lon': rng.uniform(90, 110),
+                'tags': {'amenity': 'clinic', 'name': rng.choice(NAMES)}
+            }
+            f.write(('' if i == 0 else ',\n') + json.dumps(element))
+        f.write('\n]}')
+
+
+def run_legacy(collector, raw_path, out_path):
+    """기존 collect_country_data 방식: 전체 로드 → 리스트 → CSV"""
+    with open(raw_path, 'rb') as f:
+        data = json.loads(f.read())
+
+    facilities = []
+    for element in data['elements']:
+        facility = collector.process_facility(element, 'BENCH')
+        if facility:
+            facilities.append(facility)
+
+    with open(out_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        writer.writerows(facilities)
+    return len(facilities)
+
+
+def run_streaming(collector, raw_path, out_path):
+    """스트리밍 방식: ElementStream → 제너레이터 → CSV"""
+    elements = ElementStream(iter_file_chunks(raw_path))
+    count = 0
+    with open(out_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        for element in elements:
+            facility = collector.process_facility(element, 'BENCH')
+            if facility:
+                writer.writerow(facility)
+                count += 1
+    return count
+
+
+def measure(func, *args):
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = func(*args)
+    seconds = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, seconds, peak
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10000, 100000]
+    collector = OSMDengueCollector()
+
+    print(f"{'elements':>10}{'mode':>11}{'kept':>9}{'seconds':>10}{'peak MB':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            raw_path = os.path.join(tmp, f'raw_{size}.json')
+            out_path = os.path.join(tmp, 'out.csv')
+            write_fake_response(raw_path, size)
+
+            for mode, func in (('legacy', run_legacy), ('streaming', run_streaming)):
+                kept, seconds, peak = measure(func, collector, raw_path, out_path)
+                print(f"{size:>10}{mode:>11}{kept:>9}{seconds:>10.2f}{peak / 1024 / 1024:>10.1f}")
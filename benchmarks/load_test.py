@@ -0,0 +1,229 @@
+"""
+로컬 조회 API(facility_api.py) 부하 테스트 — 초당 요청 수와 지연 시간 백분위(p50/p90/p99)
+
+keep-alive 연결 N개로 bbox / nearest / search / countries 요청을 seed 고정 비율로 섞어 보내고,
+일부는 이전 응답의 ETag로 If-None-Match 재검증 요청을 보낸다. 외부 라이브러리 없이 asyncio 소켓만 사용.
+
+실행:
+    python benchmarks/load_test.py --serve --synthetic=100000        → 서버를 직접 띄워서 측정 후 종료
+    python benchmarks/load_test.py --url=http://127.0.0.1:8080 --concurrency=64 --duration=20
+    python benchmarks/load_test.py --serve --out=load_output.json
+"""
+
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import time
+from urllib.parse import urlencode, urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from country_registry import COUNTRIES
+
+SCHEMA_VERSION = 1
+FACILITY_TYPES = ['vaccine', 'blood_test', 'aid', 'dengue_center']
+SEARCH_WORDS = ['dengue', 'clinic', 'hospital', 'center', 'test', 'city', 'health', 'free', 'de']
+
+
+def request_mix(count, seed=0):
+    """(경로, 쿼리 dict) 목록 — bbox 40%, nearest 35%, search 15%, 국가/타입 목록 10%"""
+    rng = random.Random(seed)
+    countries = list(COUNTRIES)
+    requests = []
+    for _ in range(count):
+        country = rng.choice(countries)
+        west, south, east, north = COUNTRIES[country]['bbox']
+        lat, lng = rng.uniform(south, north), rng.uniform(west, east)
+        roll = rng.random()
+        if roll < 0.4:
+            span = rng.choice([0.05, 0.2, 1.0])
+            query = {'bbox': f"{lng - span:.3f},{lat - span:.3f},{lng + span:.3f},{lat + span:.3f}",
+                     'limit': rng.choice([50, 100, 500])}
+            if rng.random() < 0.3:
+                query['type'] = rng.choice(FACILITY_TYPES)
+            requests.append(('/facilities', query))
+        elif roll < 0.75:
+            query = {'lat': f"{lat:.4f}", 'lng': f"{lng:.4f}", 'k': rng.choice([1, 5, 10, 20])}
+            if rng.random() < 0.3:
+                query['type'] = rng.choice(FACILITY_TYPES)
+            requests.append(('/nearest', query))
+        elif roll < 0.9:
+            query = {'q': rng.choice(SEARCH_WORDS)[:rng.randint(2, 8)], 'country': country}
+            if rng.random() < 0.5:
+                query.update(lat=f"{lat:.3f}", lng=f"{lng:.3f}")
+            requests.append(('/search', query))
+        else:
+            requests.append((rng.choice(['/countries', '/types']), {}))
+    return requests
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+async def read_response(reader):
+    """응답 → (상태 코드, 헤더 dict, 본문 바이트 수)"""
+    head = await reader.readuntil(b'\r\n\r\n')
+    lines = head.decode('latin-1').split('\r\n')
+    status = int(lines[0].split(' ', 2)[1])
+    headers = {}
+    for line in lines[1:]:
+        name, sep, value = line.partition(':')
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+    length = int(headers.get('content-length') or 0)
+    if length:
+        await reader.readexactly(length)
+    return status, headers, length
+
+
+class LoadTest:
+    def __init__(self, url, concurrency=32, duration=10.0, revalidate=0.2, seed=0):
+        parts = urlsplit(url)
+        self.host = parts.hostname or '127.0.0.1'
+        self.port = parts.port or 80
+        self.concurrency = concurrency
+        self.duration = duration
+        self.revalidate = revalidate
+        self.seed = seed
+        self.requests = request_mix(20000, seed)
+        self.latencies = []
+        self.statuses = {}
+        self.bytes = 0
+        self.errors = 0
+
+    async def worker(self, number, deadline):
+        rng = random.Random(self.seed * 1000 + number)
+        etags = {}      # 이 연결에서 받은 ETag (재검증용)
+        reader = writer = None
+        while time.perf_counter() < deadline:
+            path, query = rng.choice(self.requests)
+            target = f"{path}?{urlencode(query)}" if query else path
+            lines = [f"GET {target} HTTP/1.1", f"Host: {self.host}:{self.port}", "Accept-Encoding: gzip"]
+            if target in etags and rng.random() < self.revalidate:
+                lines.append(f"If-None-Match: {etags[target]}")
+            try:
+                if writer is None:
+                    reader, writer = await asyncio.open_connection(self.host, self.port)
+                started = time.perf_counter()
+                writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+                status, headers, length = await read_response(reader)
+                self.latencies.append(time.perf_counter() - started)
+            except (ConnectionError, asyncio.IncompleteReadError, OSError):
+                self.errors += 1
+                if writer is not None:
+                    writer.close()
+                reader = writer = None
+                continue
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+            self.bytes += length
+            if 'etag' in headers:
+                etags[target] = headers['etag']
+            if headers.get('connection', '').lower() == 'close':
+                writer.close()
+                reader = writer = None
+        if writer is not None:
+            writer.close()
+
+    async def run_async(self):
+        deadline = time.perf_counter() + self.duration
+        started = time.perf_counter()
+        await asyncio.gather(*(self.worker(i, deadline) for i in range(self.concurrency)))
+        return time.perf_counter() - started
+
+    def run(self):
+        seconds = asyncio.run(self.run_async())
+        latencies = sorted(self.latencies)
+        ms = lambda value: None if value is None else round(value * 1000, 3)
+        return {
+            'requests': len(latencies),
+            'seconds': round(seconds, 3),
+            'requests_per_second': round(len(latencies) / seconds, 1) if seconds else None,
+            'latency_ms': {
+                'p50': ms(percentile(latencies, 0.50)),
+                'p90': ms(percentile(latencies, 0.90)),
+                'p99': ms(percentile(latencies, 0.99)),
+                'max': ms(latencies[-1] if latencies else None)
+            },
+            'statuses': {str(status): count for status, count in sorted(self.statuses.items())},
+            'bytes': self.bytes,
+            'errors': self.errors
+        }
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port, synthetic, timeout=300):
+    """facility_api.py를 하위 프로세스로 실행하고 /health가 응답할 때까지 대기"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    command = [sys.executable, os.path.join(root, 'facility_api.py'), f"--port={port}"]
+    if synthetic:
+        command.append(f"--synthetic={synthetic}")
+    process = subprocess.Popen(command, cwd=root)
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"서버가 종료됨 (코드 {process.returncode})")
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=1) as sock:
+                sock.sendall(b"GET /health HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n")
+                if sock.recv(64).startswith(b'HTTP/1.1 200'):
+                    return process
+        except OSError:
+            time.sleep(0.5)
+    process.terminate()
+    raise RuntimeError("서버 시작 대기 시간 초과")
+
+
+if __name__ == "__main__":
+    options = dict(arg[2:].partition('=')[::2] for arg in sys.argv[1:] if arg.startswith('--'))
+    server = None
+    url = options.get('url') or "http://127.0.0.1:8080"
+    if 'serve' in options:
+        port = free_port()
+        server = start_server(port, options.get('synthetic') or 100000)
+        url = f"http://127.0.0.1:{port}"
+
+    try:
+        test = LoadTest(
+            url,
+            concurrency=int(options.get('concurrency') or 32),
+            duration=float(options.get('duration') or 10),
+            revalidate=float(options.get('revalidate') or 0.2),
+            seed=int(options.get('seed') or 0)
+        )
+        result = test.run()
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    report = {
+        'schema': SCHEMA_VERSION,
+        'url': url,
+        'concurrency': test.concurrency,
+        'duration': test.duration,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'result': result
+    }
+    print(f"⏱️ {result['requests_per_second']:,.0f} req/s, p50 {result['latency_ms']['p50']}ms, "
+          f"p99 {result['latency_ms']['p99']}ms, 오류 {result['errors']}")
+    if options.get('out'):
+        with open(options['out'], 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+        print(f"💾 {options['out']}")
+    else:
+        print(json.dumps(report, indent=2, sort_keys=True))
@@ -0,0 +1,257 @@
+"""
+전체 파이프라인 벤치마크 (분류 / 파싱 / 중복 제거 / 공간 검색 / 이름 검색 / 시설 테이블 / 내보내기 / 업로드 / 전송 포맷 / 버전 패치)
+
+데이터는 dengue_only_data.SyntheticFacilityGenerator로 seed 고정 생성하므로 실행마다 같은 입력을 쓴다.
+결과는 정렬된 키의 JSON으로 저장해 실행 간 비교(회귀 검출)에 쓴다.
+
+실행:
+    python benchmarks/run_benchmarks.py --size=100000 --out=bench_output.json
+    python benchmarks/run_benchmarks.py --size=100000 --compare=bench_output.json   → 20% 이상 느려지면 종료 코드 1
+    python benchmarks/run_benchmarks.py --only=dedup,spatial_query
+"""
+
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dataset_versions import apply_patch, canonical_records, dataset_hash, diff_records, encode_patch
+from dengue_only_data import SyntheticFacilityGenerator, write_overpass_payload
+from export_shards import ShardExporter
+from facility_classifier import FacilityClassifier, MultiDiseaseClassifier
+from facility_dedup import FacilityDeduplicator
+from facility_index import FacilityIndex
+from facility_search import FacilitySearchIndex, fold_name
+from facility_table import FacilityTable
+from firestore_common import FakeFirestoreClient
+from firestore_uploader import FirestoreUploader
+from overpass_stream import ElementStream, iter_file_chunks
+from wire_format import decode_facilities, encode_facilities
+
+SCHEMA_VERSION = 1
+
+
+def near_duplicates(facilities, rate, seed):
+    """rate 비율만큼 좌표를 약간 옮기고 이름을 바꾼 중복 레코드 추가"""
+    rng = random.Random(seed)
+    duplicates = []
+    for facility in facilities:
+        if rng.random() < rate:
+            duplicates.append(dict(
+                facility,
+                name=facility['name'].upper() + '.',
+                lat=facility['lat'] + rng.uniform(-0.0002, 0.0002),
+                lng=facility['lng'] + rng.uniform(-0.0002, 0.0002),
+                osm_id='',
+                source='synthetic'
+            ))
+    return facilities + duplicates
+
+
+class BenchmarkSuite:
+    def __init__(self, size=100000, seed=0, repeat=3, workdir=None):
+        self.size = size
+        self.seed = seed
+        self.repeat = repeat
+        self.workdir = workdir
+        self.generator = SyntheticFacilityGenerator(seed=seed)
+        self.facilities = list(self.generator.facilities(size))
+
+    def cases(self):
+        """(이름, 준비 함수, 측정 함수) — 준비 결과가 측정 함수의 인자, 측정 함수는 처리 항목 수 반환"""
+        workdir = self.workdir
+        facilities = self.facilities
+        subset = facilities[:max(1, self.size // 10)]
+
+        def prepare_classify():
+            return FacilityClassifier(), [{'name': f['name']} for f in facilities]
+
+        def prepare_classify_multi():
+            return MultiDiseaseClassifier(), [{'name': f['name']} for f in facilities]
+
+        def prepare_parse():
+            path = os.path.join(workdir, 'overpass.json')
+            if not os.path.exists(path):
+                write_overpass_payload(path, self.generator.overpass_elements(self.size))
+            return (path,)
+
+        def run_parse(path):
+            return sum(1 for _ in ElementStream(iter_file_chunks(path)))
+
+        def prepare_dedup():
+            return FacilityDeduplicator(), near_duplicates(facilities, 0.1, self.seed)
+
+        def prepare_spatial_query():
+            index = FacilityIndex.build(facilities, os.path.join(workdir, 'index.fcol'))
+            rng = random.Random(self.seed)
+            points = [(f['lat'] + rng.uniform(-0.1, 0.1), f['lng'] + rng.uniform(-0.1, 0.1))
+                      for f in rng.sample(facilities, min(1000, len(facilities)))]
+            return index, points
+
+        def run_spatial_query(index, points):
+            for lat, lng in points:
+                index.nearest(lat, lng, k=5)
+            return len(points)
+
+        def prepare_name_search():
+            index = FacilitySearchIndex(facilities)
+            rng = random.Random(self.seed)
+            queries = []
+            for f in rng.sample(facilities, min(1000, len(facilities))):
+                # 이름 앞부분 토큰 1~2개를 입력 도중처럼 잘라서, 절반은 위치 포함
+                tokens = fold_name(f['name']).split()[:rng.randint(1, 2)]
+                tokens[-1] = tokens[-1][:max(2, len(tokens[-1]) - 2)]
+                location = (f['lat'], f['lng']) if rng.random() < 0.5 else (None, None)
+                queries.append((' '.join(tokens),) + location)
+            return index, queries
+
+        def run_name_search(index, queries):
+            for query, lat, lng in queries:
+                index.search(query, lat, lng)
+            return len(queries)
+
+        def prepare_dataset_patch():
+            # 1%를 수정/삭제하고 같은 수를 추가한 다음 버전
+            before = canonical_records(facilities)
+            rng = random.Random(self.seed)
+            after = dict(before)
+            keys = rng.sample(sorted(before), max(2, len(before) // 50))
+            for key in keys[:len(keys) // 2]:
+                after[key] = dict(after[key], name=after[key]['name'] + ' 2')
+            for key in keys[len(keys) // 2:]:
+                del after[key]
+            for i, facility in enumerate(self.generator.facilities(len(keys) // 2)):
+                after[f"node/{10 ** 12 + i}"] = dict(facility, osm_id=f"node/{10 ** 12 + i}")
+            after = canonical_records(after.values())
+            return before, after
+
+        def run_dataset_patch(before, after):
+            patch = encode_patch(1, 2, dataset_hash(before), dataset_hash(after), diff_records(before, after))
+            apply_patch(before, patch)
+            return len(before)
+
+        def run_dedup(deduplicator, rows):
+            deduplicator.deduplicate(rows)
+            return len(rows)
+
+        def run_spatial_build(rows):
+            index = FacilityIndex.build(rows, os.path.join(workdir, 'build.fcol'))
+            index.close()
+            return len(rows)
+
+        def run_wire_encode(rows):
+            encode_facilities(rows)
+            return len(rows)
+
+        def run_table(rows):
+            table = FacilityTable.from_facilities(rows)
+            for country in table.country_counts():
+                table.type_counts(country)
+            return len(rows)
+
+        def run_export(exporter, rows):
+            exporter.export({'bench': rows})
+            return len(rows)
+
+        def run_upload(rows):
+            uploader = FirestoreUploader(FakeFirestoreClient())
+            uploader.upload(rows)
+            return len(rows)
+
+        return [
+            ('classify', prepare_classify, lambda classifier, tags: len(classifier.classify_many(tags))),
+            ('classify_multi', prepare_classify_multi, lambda classifier, tags: len(classifier.classify_many(tags))),
+            ('parse', prepare_parse, run_parse),
+            ('dedup', prepare_dedup, run_dedup),
+            ('spatial_build', lambda: (facilities,), run_spatial_build),
+            ('spatial_query', prepare_spatial_query, run_spatial_query),
+            ('name_search', prepare_name_search, run_name_search),
+            ('table', lambda: (facilities,), run_table),
+            ('export', lambda: (ShardExporter(os.path.join(workdir, 'shards')), subset), run_export),
+            ('upload', lambda: (facilities,), run_upload),
+            ('dataset_patch', prepare_dataset_patch, run_dataset_patch),
+            ('wire_encode', lambda: (facilities,), run_wire_encode),
+            ('wire_decode', lambda: (encode_facilities(facilities),), lambda data: len(decode_facilities(data))),
+        ]
+
+    def run(self, only=None):
+        results = {}
+        for name, prepare, func in self.cases():
+            if only and name not in only:
+                continue
+            args = prepare()
+            best = None
+            for _ in range(self.repeat):
+                started = time.perf_counter()
+                items = func(*args)
+                seconds = time.perf_counter() - started
+                best = seconds if best is None else min(best, seconds)
+            results[name] = {
+                'items': items,
+                'seconds': round(best, 6),
+                'items_per_second': round(items / best, 1) if best else None
+            }
+            print(f"⏱️ {name:14} {items:>10} items {best:>9.3f}s {items / best if best else 0:>14,.0f}/s")
+        return results
+
+    def report(self, results):
+        return {
+            'schema': SCHEMA_VERSION,
+            'size': self.size,
+            'seed': self.seed,
+            'repeat': self.repeat,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'results': results
+        }
+
+
+def compare(current, baseline, threshold=0.2):
+    """기준 결과보다 threshold 이상 느려진 항목 목록"""
+    regressions = []
+    if baseline.get('size') != current['size'] or baseline.get('seed') != current['seed']:
+        print("⚠️ 기준 결과와 size/seed가 달라 비교가 정확하지 않을 수 있습니다")
+    for name, result in current['results'].items():
+        before = baseline.get('results', {}).get(name)
+        if not before or not before.get('seconds'):
+            continue
+        change = result['seconds'] / before['seconds'] - 1
+        marker = '🔴' if change > threshold else '🟢'
+        print(f"{marker} {name:14} {before['seconds']:>9.3f}s → {result['seconds']:>9.3f}s ({change:+.1%})")
+        if change > threshold:
+            regressions.append(name)
+    return regressions
+
+
+if __name__ == "__main__":
+    options = dict(arg[2:].partition('=')[::2] for arg in sys.argv[1:] if arg.startswith('--'))
+    only = set(options['only'].split(',')) if options.get('only') else None
+
+    with tempfile.TemporaryDirectory() as workdir:
+        suite = BenchmarkSuite(
+            size=int(options.get('size') or 100000),
+            seed=int(options.get('seed') or 0),
+            repeat=int(options.get('repeat') or 3),
+            workdir=workdir
+        )
+        report = suite.report(suite.run(only))
+
+    if options.get('out'):
+        with open(options['out'], 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+        print(f"💾 {options['out']}")
+    else:
+        print(json.dumps(report, indent=2, sort_keys=True))
+
+    if options.get('compare'):
+        with open(options['compare'], encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, float(options.get('threshold') or 0.2))
+        if regressions:
+            print(f"❌ 성능 저하: {', '.join(regressions)}")
+            sys.exit(1)
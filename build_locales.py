@@ -0,0 +1,190 @@
+"""
+웹 클라이언트 언어 번들 + 서비스 워커 사전 캐시 목록 빌드
+
+- app/locales/*.json → 공백 없는 JSON으로 줄여 내용 해시를 파일명에 넣은 번들(app/locales/build/{lang}.{hash}.json)
+  언어를 바꿀 때만 받고, 파일명이 내용으로 정해지므로 한 번 받으면 영구 캐시
+- js/locales.js 생성: 언어 → 번들 경로, 기본 언어(en) 문자열은 파일 안에 포함
+  → 첫 화면은 번역 파일을 기다리지 않음
+- app/service-worker.js의 사전 캐시 블록(// <precache> ~ // </precache>) 갱신:
+  앱 셸 파일 목록과 내용 해시로 만든 캐시 버전 → 파일이 바뀌면 서비스 워커가 새 캐시를 만들고 이전 캐시를 지움
+
+locales/*.json이나 앱 셸 파일(index.html, js/, css)을 고친 뒤 실행:
+    python build_locales.py
+"""
+
+import glob
+import hashlib
+import json
+import os
+import re
+import sys
+
+from atomic_io import write_bytes_atomic, write_text_atomic
+from export_shards import content_hash, encode_json
+
+DEFAULT_LOCALE_DIR = 'app/locales'
+DEFAULT_BUNDLE_DIR = 'app/locales/build'
+DEFAULT_JS_PATH = 'js/locales.js'
+SERVICE_WORKER_PATH = 'app/service-worker.js'
+DEFAULT_LANG = 'en'
+
+# 설치할 때 미리 캐시하는 앱 셸 (사이트 루트 기준, js/locales.js는 생성 후 해시)
+PRECACHE_FILES = [
+    'index.html',
+    'offline.html',
+    'manifest.json',
+    'app/css/style.css',
+    'app/js/firebase-app-compat.js',
+    'app/js/firebase-firestore-compat.js',
+    'js/countries.js',
+    'js/locales.js',
+    'js/global-app.js',
+    'img/icon-192x192.png',
+]
+
+PRECACHE_BLOCK = re.compile(r'// <precache>.*?// </precache>\n', re.S)
+
+
+def load_locales(locale_dir=DEFAULT_LOCALE_DIR):
+    """언어 코드 → 번역 dict"""
+    locales = {}
+    for path in sorted(glob.glob(os.path.join(locale_dir, '*.json'))):
+        with open(path, encoding='utf-8') as f:
+            locales[os.path.splitext(os.path.basename(path))[0]] = json.load(f)
+    return locales
+
+
+def check_keys(locales, default_lang=DEFAULT_LANG):
+    """기본 언어와 키가 다른 언어 → (빠진 키, 기본 언어에 없는 키) (빠진 키는 클라이언트에서 기본 언어로 대체)"""
+    reference = set(locales.get(default_lang, {}))
+    problems = {}
+    for lang, strings in locales.items():
+        missing, extra = sorted(reference - set(strings)), sorted(set(strings) - reference)
+        if missing or extra:
+            problems[lang] = (missing, extra)
+    return problems
+
+
+def write_bundles(locales, bundle_dir=DEFAULT_BUNDLE_DIR):
+    """언어별 번들 저장 → 언어 코드 → 경로 (이전 해시의 번들은 삭제)"""
+    os.makedirs(bundle_dir, exist_ok=True)
+    bundles = {}
+    for lang, strings in locales.items():
+        payload = encode_json(strings)
+        path = os.path.join(bundle_dir, f"{lang}.{content_hash(payload)}.json")
+        if not os.path.exists(path):
+            write_bytes_atomic(path, payload, fsync=False)
+        bundles[lang] = path.replace(os.sep, '/')
+
+    current = {os.path.basename(path) for path in bundles.values()}
+    for path in glob.glob(os.path.join(bundle_dir, '*.json')):
+        if os.path.basename(path) not in current:
+            os.remove(path)
+    return bundles
+
+
+def render_js(locales, bundles, default_lang=DEFAULT_LANG):
+    """번들 목록 + 기본 언어 문자열 → js/locales.js 내용"""
+    bundle_lines = ',\n'.join(f"    {json.dumps(lang)}: {json.dumps(path)}" for lang, path in bundles.items())
+    return f"""// 자동 생성 파일 — 수정하지 말고 app/locales/*.json을 고친 뒤 python build_locales.py 실행
+// 언어별 번역 번들 (내용 해시 파일명, 언어를 바꿀 때만 로드)
+const LOCALE_BUNDLES = {{
+{bundle_lines}
+}};
+
+// 기본 언어는 첫 화면에서 바로 쓰도록 포함
+const DEFAULT_LANG = {json.dumps(default_lang)};
+const DEFAULT_LOCALE = {json.dumps(locales.get(default_lang, {}), ensure_ascii=False, indent=4, sort_keys=True)};
+
+const localeCache = {{}};
+
+// 언어 코드 → 번역 dict (빠진 키는 기본 언어, 없는 언어는 기본 언어)
+function loadLocale(lang) {{
+    if (lang === DEFAULT_LANG || !LOCALE_BUNDLES[lang]) {{
+        return Promise.resolve(DEFAULT_LOCALE);
+    }}
+    if (!localeCache[lang]) {{
+        localeCache[lang] = fetch(LOCALE_BUNDLES[lang])
+            .then(response => {{
+                if (!response.ok) throw new Error(`번역 파일 로드 실패: ${{response.status}}`);
+                return response.json();
+            }})
+            .then(strings => Object.assign({{}}, DEFAULT_LOCALE, strings))
+            .catch(error => {{
+                delete localeCache[lang];
+                throw error;
+            }});
+    }}
+    return localeCache[lang];
+}}
+
+if (typeof module !== 'undefined') {{
+    module.exports = {{ LOCALE_BUNDLES, DEFAULT_LANG, DEFAULT_LOCALE, loadLocale }};
+}}
+"""
+
+
+def precache_manifest(files=PRECACHE_FILES):
+    """[(URL, 내용 해시)] + 전체 버전 (파일 하나라도 바뀌면 버전이 바뀜)"""
+    entries = []
+    for path in files:
+        with open(path, 'rb') as f:
+            entries.append(('/' + path, content_hash(f.read())))
+    version = hashlib.sha256(''.join(f"{url} {revision}\n" for url, revision in entries).encode()).hexdigest()[:12]
+    return entries, version
+
+
+def update_service_worker(entries, version, path=SERVICE_WORKER_PATH):
+    """서비스 워커의 사전 캐시 블록 교체 → 내용이 바뀌었으면 True"""
+    with open(path, encoding='utf-8') as f:
+        source = f.read()
+    if not PRECACHE_BLOCK.search(source):
+        raise ValueError(f"{path}에 // <precache> ~ // </precache> 블록이 없습니다")
+
+    lines = ['// <precache> 자동 생성 (python build_locales.py) — 직접 수정하지 않음',
+             f"const PRECACHE_VERSION = '{version}';",
+             'const PRECACHE_FILES = [']
+    lines.extend(f"    '{url}',  // {revision}" for url, revision in entries)
+    lines.extend(['];', '// </precache>'])
+    block = '\n'.join(lines) + '\n'
+
+    updated = PRECACHE_BLOCK.sub(lambda match: block, source)
+    if updated == source:
+        return False
+    write_text_atomic(path, updated)
+    return True
+
+
+def build(locale_dir=DEFAULT_LOCALE_DIR, bundle_dir=DEFAULT_BUNDLE_DIR, js_path=DEFAULT_JS_PATH):
+    locales = load_locales(locale_dir)
+    if DEFAULT_LANG not in locales:
+        raise ValueError(f"{locale_dir}/{DEFAULT_LANG}.json이 없습니다")
+    for lang, (missing, extra) in check_keys(locales).items():
+        if missing:
+            print(f"⚠️ {lang}: 빠진 키 {len(missing)}개 ({', '.join(missing[:5])}) → {DEFAULT_LANG}로 대체")
+        if extra:
+            print(f"⚠️ {lang}: {DEFAULT_LANG}에 없는 키 {len(extra)}개 ({', '.join(extra[:5])})")
+
+    bundles = write_bundles(locales, bundle_dir)
+    write_text_atomic(js_path, render_js(locales, bundles))
+    entries, version = precache_manifest()
+    changed = update_service_worker(entries, version)
+    return {
+        'languages': len(bundles),
+        'bundle_bytes': sum(os.path.getsize(path) for path in bundles.values()),
+        'source_bytes': sum(os.path.getsize(path) for path in glob.glob(os.path.join(locale_dir, '*.json'))),
+        'precache_files': len(entries),
+        'precache_version': version,
+        'service_worker_changed': changed
+    }
+
+
+if __name__ == "__main__":
+    try:
+        summary = build()
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    print(f"✅ 언어 번들 {summary['languages']}개: {summary['source_bytes']:,} → {summary['bundle_bytes']:,} bytes")
+    state = "갱신" if summary['service_worker_changed'] else "변경 없음"
+    print(f"📦 사전 캐시 {summary['precache_files']}개 파일, 버전 {summary['precache_version']} ({state})")
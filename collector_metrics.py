@@ -0,0 +1,224 @@
+"""
+수집기 실행 계측 (단계별 시간 / 카운터 / 예외 종류별 개수 / 선택적 cProfile)
+
+실행이 끝나면 JSON 보고서와 Prometheus 텍스트 포맷 파일을 남겨,
+느린 실행이 Overpass(HTTP) 때문인지 파싱/필터링/디스크 쓰기 때문인지 구분할 수 있게 한다.
+
+단계(stage): query_build, http, parse, filter, write
+"""
+
+import cProfile
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from atomic_io import write_json_atomic, write_text_atomic
+
+DEFAULT_METRICS_DIR = 'data/metrics'
+METRIC_PREFIX = 'dengue_collector'
+
+_HELP = {
+    'stage_seconds_total': '단계별 누적 소요 시간(초)',
+    'stage_calls_total': '단계별 측정 횟수',
+    'exceptions_total': '예외 종류별 발생 횟수',
+    'run_seconds': '마지막 실행 전체 소요 시간(초)',
+    'last_run_timestamp_seconds': '마지막 실행 종료 시각 (유닉스 시간)'
+}
+
+
+def _escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _labels(pairs):
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape_label(value)}"' for key, value in pairs) + '}'
+
+
+def _format_value(value):
+    """샘플 값 → 문자열 (정수는 그대로, 실수는 반올림 없이: {:g}는 유효숫자 6자리라 큰 카운터/유닉스 시각이 틀어짐)"""
+    if isinstance(value, int):
+        return str(value)
+    value = float(value)
+    if math.isnan(value):
+        return 'NaN'
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    return repr(value)
+
+
+class RunMetrics:
+    """한 번의 수집 실행 동안 쌓이는 계측 값 (국가별 스레드에서 동시에 사용 가능)"""
+
+    def __init__(self, profile=False, metrics_dir=DEFAULT_METRICS_DIR):
+        self.profile_enabled = profile
+        self.metrics_dir = metrics_dir
+        self.started = time.time()
+        self.stage_seconds = {}     # (stage, country) → 초
+        self.stage_calls = {}       # (stage, country) → 횟수
+        self.counters = {}          # (name, country) → 값
+        self.exceptions = {}        # (kind, where, country) → 횟수
+        self.profiles = []
+        self._lock = threading.Lock()
+
+    # ---------- 기록 ----------
+
+    def add_time(self, stage, seconds, country='', calls=1):
+        key = (stage, country)
+        with self._lock:
+            self.stage_seconds[key] = self.stage_seconds.get(key, 0.0) + seconds
+            self.stage_calls[key] = self.stage_calls.get(key, 0) + calls
+
+    @contextmanager
+    def timer(self, stage, country=''):
+        """with metrics.timer('http', 'bangladesh'): ..."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(stage, time.perf_counter() - started, country)
+
+    def iter_timed(self, iterable, stage, country=''):
+        """이터러블을 그대로 내보내면서 next()에 걸린 시간만 stage에 기록 (제너레이터 파이프라인용)"""
+        iterator = iter(iterable)
+        total = 0.0
+        calls = 0
+        perf_counter = time.perf_counter
+        try:
+            while True:
+                started = perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                finally:
+                    total += perf_counter() - started
+                    calls += 1
+                yield item
+        finally:
+            self.add_time(stage, total, country, calls)
+
+    def add(self, name, value=1, country=''):
+        key = (name, country)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def exception(self, error, where, country=''):
+        """예외를 종류(클래스 이름)별로 집계"""
+        key = (type(error).__name__, where, country)
+        with self._lock:
+            self.exceptions[key] = self.exceptions.get(key, 0) + 1
+
+    @contextmanager
+    def profile(self, name):
+        """profile=True일 때만 cProfile로 감싸고 결과를 .prof 파일로 저장
+
+        파이썬 프로파일러는 동시에 하나만 켤 수 있으므로 이미 켜져 있으면 건너뛴다.
+        (--profile 실행 시 국가를 순차 수집하는 이유)
+        """
+        if not self.profile_enabled:
+            yield
+            return
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            yield
+            return
+        try:
+            yield
+        finally:
+            profiler.disable()
+            os.makedirs(self.metrics_dir, exist_ok=True)
+            path = os.path.join(self.metrics_dir, f"{name}.prof")
+            profiler.dump_stats(path)
+            with self._lock:
+                self.profiles.append(path)
+
+    # ---------- 출력 ----------
+
+    def to_dict(self):
+        with self._lock:
+            stages = {}
+            for (stage, country), seconds in sorted(self.stage_seconds.items()):
+                stages.setdefault(country or '_total', {})[stage] = {
+                    'seconds': round(seconds, 6),
+                    'calls': self.stage_calls.get((stage, country), 0)
+                }
+            counters = {}
+            for (name, country), value in sorted(self.counters.items()):
+                counters.setdefault(country or '_total', {})[name] = value
+            exceptions = [
+                {'kind': kind, 'where': where, 'country': country, 'count': count}
+                for (kind, where, country), count in sorted(self.exceptions.items())
+            ]
+            return {
+                'started': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(self.started)),
+                'seconds': round(time.time() - self.started, 3),
+                'stages': stages,
+                'counters': counters,
+                'exceptions': exceptions,
+                'profiles': list(self.profiles)
+            }
+
+    def to_prometheus(self):
+        """Prometheus 텍스트 포맷 (node_exporter textfile collector로 수집 가능)"""
+        lines = []
+
+        def metric(name, kind, samples):
+            full_name = f"{METRIC_PREFIX}_{name}"
+            lines.append(f"# HELP {full_name} {_HELP.get(name, name)}")
+            lines.append(f"# TYPE {full_name} {kind}")
+            for labels, value in samples:
+                lines.append(f"{full_name}{_labels(labels)} {_format_value(value)}")
+
+        with self._lock:
+            metric('stage_seconds_total', 'counter', [
+                ([('country', country), ('stage', stage)], seconds)
+                for (stage, country), seconds in sorted(self.stage_seconds.items())
+            ])
+            metric('stage_calls_total', 'counter', [
+                ([('country', country), ('stage', stage)], calls)
+                for (stage, country), calls in sorted(self.stage_calls.items())
+            ])
+
+            names = sorted({name for name, _ in self.counters})
+            for name in names:
+                lines.append(f"# HELP {METRIC_PREFIX}_{name}_total 수집 카운터: {name}")
+                lines.append(f"# TYPE {METRIC_PREFIX}_{name}_total counter")
+                for (counter, country), value in sorted(self.counters.items()):
+                    if counter == name:
+                        lines.append(f"{METRIC_PREFIX}_{name}_total{_labels([('country', country)])} {_format_value(value)}")
+
+            metric('exceptions_total', 'counter', [
+                ([('country', country), ('kind', kind), ('where', where)], count)
+                for (kind, where, country), count in sorted(self.exceptions.items())
+            ])
+
+        metric('run_seconds', 'gauge', [([], time.time() - self.started)])
+        metric('last_run_timestamp_seconds', 'gauge', [([], time.time())])
+        return '\n'.join(lines) + '\n'
+
+    def write(self, name='collector'):
+        """{metrics_dir}/{name}_{시각}.json 보고서 + {name}.prom 파일 저장 → (json 경로, prom 경로)"""
+        os.makedirs(self.metrics_dir, exist_ok=True)
+        stamp = time.strftime('%Y%m%d_%H%M%S', time.gmtime(self.started))
+        json_path = os.path.join(self.metrics_dir, f"{name}_{stamp}.json")
+        prom_path = os.path.join(self.metrics_dir, f"{name}.prom")
+
+        write_json_atomic(json_path, self.to_dict())
+        write_text_atomic(prom_path, self.to_prometheus())
+        return json_path, prom_path
+
+    def print_stage_summary(self):
+        """국가 합계 기준 단계별 소요 시간 출력"""
+        totals = {}
+        with self._lock:
+            for (stage, _), seconds in self.stage_seconds.items():
+                totals[stage] = totals.get(stage, 0.0) + seconds
+        if totals:
+            print("⏱️ 단계별 시간: " + ', '.join(f"{stage} {seconds:.2f}s" for stage, seconds in sorted(totals.items())))
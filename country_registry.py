@@ -0,0 +1,396 @@
+"""
+국가 정보 단일 출처 (수집기 / GlobalDengueSystem / 합성 데이터 / 웹 클라이언트 공통)
+
+- COUNTRIES: 국가 코드 → 이름, 현지 이름, 국기, ISO 코드, 수집 bbox, 지도 중심/줌, UI 언어, 현지어, 통화
+- js/countries.js는 이 파일에서 생성 (python country_registry.py --js), 직접 수정하지 않음
+- CountryLocator: 좌표 → 국가 코드
+  data/boundaries/*.geojson 국경 폴리곤이 있으면 단순화한 폴리곤으로 판정하고,
+  없거나 폴리곤 밖(해안선 단순화 오차 등)이면 bbox가 겹칠 때 면적이 가장 작은 국가로 판정
+
+사용법:
+    python country_registry.py --js                 → js/countries.js 생성
+    python country_registry.py 23.81 90.41          → 좌표의 국가
+    python country_registry.py --bench              → 조회 속도 측정
+"""
+
+import glob
+import json
+import math
+import os
+import random
+import sys
+import time
+
+from atomic_io import write_text_atomic
+
+DEFAULT_BOUNDARY_DIR = 'data/boundaries'
+DEFAULT_JS_PATH = 'js/countries.js'
+
+# 국가 코드 → 정보 (bbox: 수집 범위 [west, south, east, north], languages: 웹 UI 언어)
+COUNTRIES = {
+    'bangladesh': {
+        'name': 'Bangladesh', 'local_name': 'বাংলাদেশ', 'flag': '🇧🇩', 'iso2': 'BD',
+        'bbox': [88.0, 20.0, 92.1, 26.6], 'center': [23.6850, 90.3563], 'zoom': 7,
+        'languages': ['en', 'bn', 'ko'], 'local_lang': 'bn', 'currency': 'BDT'
+    },
+    'thailand': {
+        'name': 'Thailand', 'local_name': 'ประเทศไทย', 'flag': '🇹🇭', 'iso2': 'TH',
+        'bbox': [97.3, 5.6, 105.6, 20.5], 'center': [15.8700, 100.9925], 'zoom': 6,
+        'languages': ['en', 'th', 'ko'], 'local_lang': 'th', 'currency': 'THB'
+    },
+    'vietnam': {
+        'name': 'Vietnam', 'local_name': 'Việt Nam', 'flag': '🇻🇳', 'iso2': 'VN',
+        'bbox': [102.14, 8.18, 109.46, 23.39], 'center': [14.0583, 108.2772], 'zoom': 6,
+        'languages': ['en', 'vi', 'ko'], 'local_lang': 'vi', 'currency': 'VND'
+    },
+    'indonesia': {
+        'name': 'Indonesia', 'local_name': 'Indonesia', 'flag': '🇮🇩', 'iso2': 'ID',
+        'bbox': [95.0, -11.0, 141.0, 6.0], 'center': [-0.7893, 113.9213], 'zoom': 5,
+        'languages': ['en', 'id', 'ko'], 'local_lang': 'id', 'currency': 'IDR'
+    },
+    'philippines': {
+        'name': 'Philippines', 'local_name': 'Pilipinas', 'flag': '🇵🇭', 'iso2': 'PH',
+        'bbox': [116.0, 4.0, 126.0, 21.0], 'center': [12.8797, 121.7740], 'zoom': 6,
+        'languages': ['en', 'tl', 'ko'], 'local_lang': 'tl', 'currency': 'PHP'
+    },
+    'malaysia': {
+        'name': 'Malaysia', 'local_name': 'Malaysia', 'flag': '🇲🇾', 'iso2': 'MY',
+        'bbox': [100.0, 0.5, 120.0, 7.5], 'center': [4.2105, 101.9758], 'zoom': 6,
+        'languages': ['en', 'ms', 'ko'], 'local_lang': 'ms', 'currency': 'MYR'
+    },
+    'singapore': {
+        'name': 'Singapore', 'local_name': '新加坡', 'flag': '🇸🇬', 'iso2': 'SG',
+        'bbox': [103.6, 1.2, 104.1, 1.5], 'center': [1.3521, 103.8198], 'zoom': 11,
+        'languages': ['en', 'zh', 'ko'], 'local_lang': 'zh', 'currency': 'SGD'
+    },
+    'laos': {
+        'name': 'Laos', 'local_name': 'ລາວ', 'flag': '🇱🇦', 'iso2': 'LA',
+        'bbox': [100.1, 13.9, 107.7, 22.5], 'center': [19.8563, 102.4955], 'zoom': 6,
+        'languages': ['en', 'lo', 'ko'], 'local_lang': 'lo', 'currency': 'LAK'
+    },
+    'cambodia': {
+        'name': 'Cambodia', 'local_name': 'កម្ពុជា', 'flag': '🇰🇭', 'iso2': 'KH',
+        'bbox': [102.3, 10.4, 107.6, 14.7], 'center': [12.5657, 104.9910], 'zoom': 7,
+        'languages': ['en', 'km', 'ko'], 'local_lang': 'km', 'currency': 'KHR'
+    },
+    'myanmar': {
+        'name': 'Myanmar', 'local_name': 'မြန်မာ', 'flag': '🇲🇲', 'iso2': 'MM',
+        'bbox': [92.2, 9.5, 101.2, 28.5], 'center': [21.9162, 95.9560], 'zoom': 6,
+        'languages': ['en', 'my', 'ko'], 'local_lang': 'my', 'currency': 'MMK'
+    },
+    'india': {
+        'name': 'India', 'local_name': 'भारत', 'flag': '🇮🇳', 'iso2': 'IN',
+        'bbox': [68.7, 6.7, 97.25, 35.5], 'center': [20.5937, 78.9629], 'zoom': 5,
+        'languages': ['en', 'hi', 'ko'], 'local_lang': 'hi', 'currency': 'INR'
+    },
+    'sri_lanka': {
+        'name': 'Sri Lanka', 'local_name': 'ශ්\u200dරී ලංකා', 'flag': '🇱🇰', 'iso2': 'LK',
+        'bbox': [79.6, 5.9, 81.9, 9.8], 'center': [7.8731, 80.7718], 'zoom': 7,
+        'languages': ['en', 'si', 'ko'], 'local_lang': 'si', 'currency': 'LKR'
+    },
+    'pakistan': {
+        'name': 'Pakistan', 'local_name': 'پاکستان', 'flag': '🇵🇰', 'iso2': 'PK',
+        'bbox': [60.9, 23.6, 77.0, 37.0], 'center': [30.3753, 69.3451], 'zoom': 5,
+        'languages': ['en', 'ur', 'ko'], 'local_lang': 'ur', 'currency': 'PKR'
+    },
+    'brazil': {
+        'name': 'Brazil', 'local_name': 'Brasil', 'flag': '🇧🇷', 'iso2': 'BR',
+        'bbox': [-74.0, -33.0, -34.0, 5.3], 'center': [-14.2350, -51.9253], 'zoom': 4,
+        'languages': ['en', 'pt', 'ko'], 'local_lang': 'pt', 'currency': 'BRL'
+    },
+    'colombia': {
+        'name': 'Colombia', 'local_name': 'Colombia', 'flag': '🇨🇴', 'iso2': 'CO',
+        'bbox': [-79.0, -4.2, -66.9, 13.4], 'center': [4.5709, -74.2973], 'zoom': 5,
+        'languages': ['en', 'es', 'ko'], 'local_lang': 'es', 'currency': 'COP'
+    },
+    'venezuela': {
+        'name': 'Venezuela', 'local_name': 'Venezuela', 'flag': '🇻🇪', 'iso2': 'VE',
+        'bbox': [-73.4, 0.6, -59.8, 12.2], 'center': [6.4238, -66.5897], 'zoom': 6,
+        'languages': ['en', 'es', 'ko'], 'local_lang': 'es', 'currency': 'VES'
+    },
+    'peru': {
+        'name': 'Peru', 'local_name': 'Perú', 'flag': '🇵🇪', 'iso2': 'PE',
+        'bbox': [-84.0, -18.3, -68.6, 0.2], 'center': [-9.1900, -75.0152], 'zoom': 5,
+        'languages': ['en', 'es', 'ko'], 'local_lang': 'es', 'currency': 'PEN'
+    },
+    'ecuador': {
+        'name': 'Ecuador', 'local_name': 'Ecuador', 'flag': '🇪🇨', 'iso2': 'EC',
+        'bbox': [-92.0, -5.0, -75.2, 2.3], 'center': [-1.8312, -78.1834], 'zoom': 6,
+        'languages': ['en', 'es', 'ko'], 'local_lang': 'es', 'currency': 'USD'
+    },
+    'mexico': {
+        'name': 'Mexico', 'local_name': 'México', 'flag': '🇲🇽', 'iso2': 'MX',
+        'bbox': [-118.5, 14.5, -86.7, 32.7], 'center': [23.6345, -102.5528], 'zoom': 5,
+        'languages': ['en', 'es', 'ko'], 'local_lang': 'es', 'currency': 'MXN'
+    },
+    'argentina': {
+        'name': 'Argentina', 'local_name': 'Argentina', 'flag': '🇦🇷', 'iso2': 'AR',
+        'bbox': [-73.6, -55.1, -53.6, -21.8], 'center': [-38.4161, -63.6167], 'zoom': 4,
+        'languages': ['en', 'es', 'ko'], 'local_lang': 'es', 'currency': 'ARS'
+    },
+    'nigeria': {
+        'name': 'Nigeria', 'local_name': 'Najeriya', 'flag': '🇳🇬', 'iso2': 'NG',
+        'bbox': [2.7, 4.3, 14.7, 13.9], 'center': [9.0820, 8.6753], 'zoom': 6,
+        'languages': ['en', 'ha', 'ko'], 'local_lang': 'ha', 'currency': 'NGN'
+    },
+    'kenya': {
+        'name': 'Kenya', 'local_name': 'Kenya', 'flag': '🇰🇪', 'iso2': 'KE',
+        'bbox': [33.8, -4.7, 41.9, 5.0], 'center': [-0.0236, 37.9062], 'zoom': 6,
+        'languages': ['en', 'sw', 'ko'], 'local_lang': 'sw', 'currency': 'KES'
+    },
+    'tanzania': {
+        'name': 'Tanzania', 'local_name': 'Tanzania', 'flag': '🇹🇿', 'iso2': 'TZ',
+        'bbox': [29.3, -11.7, 40.4, 0.9], 'center': [-6.3690, 34.8888], 'zoom': 6,
+        'languages': ['en', 'sw', 'ko'], 'local_lang': 'sw', 'currency': 'TZS'
+    },
+    'uganda': {
+        'name': 'Uganda', 'local_name': 'Uganda', 'flag': '🇺🇬', 'iso2': 'UG',
+        'bbox': [29.6, -1.5, 35.0, 4.2], 'center': [1.3733, 32.2903], 'zoom': 7,
+        'languages': ['en', 'lg', 'ko'], 'local_lang': 'lg', 'currency': 'UGX'
+    },
+    'australia': {
+        'name': 'Australia', 'local_name': 'Australia', 'flag': '🇦🇺', 'iso2': 'AU',
+        'bbox': [113.3, -43.7, 153.6, -10.7], 'center': [-25.2744, 133.7751], 'zoom': 4,
+        'languages': ['en', 'ko'], 'local_lang': 'en', 'currency': 'AUD'
+    },
+    'fiji': {
+        'name': 'Fiji', 'local_name': 'Viti', 'flag': '🇫🇯', 'iso2': 'FJ',
+        'bbox': [177.9, -19.5, -178.4, -16.0], 'center': [-16.7784, 179.4144], 'zoom': 8,
+        'languages': ['en', 'fj', 'ko'], 'local_lang': 'fj', 'currency': 'FJD'
+    },
+    'papua_new_guinea': {
+        'name': 'Papua New Guinea', 'local_name': 'Papua Niugini', 'flag': '🇵🇬', 'iso2': 'PG',
+        'bbox': [140.8, -11.6, 156.0, -1.0], 'center': [-6.3149, 143.9555], 'zoom': 6,
+        'languages': ['en', 'tpi', 'ko'], 'local_lang': 'tpi', 'currency': 'PGK'
+    }
+}
+
+# js/countries.js에 내보낼 필드 (JS 쪽 이름)
+JS_FIELDS = {
+    'name': 'name', 'center': 'center', 'zoom': 'zoom', 'languages': 'languages',
+    'local_lang': 'localLang', 'local_name': 'localName', 'flag': 'flag', 'iso2': 'iso2', 'bbox': 'bbox'
+}
+
+
+def country_info(country_code):
+    return COUNTRIES.get(country_code)
+
+
+def country_bboxes():
+    """국가 코드 → 수집 bbox [west, south, east, north]"""
+    return {code: info['bbox'] for code, info in COUNTRIES.items()}
+
+
+def country_by_iso2(iso2):
+    """'BD' → 'bangladesh' (없으면 None)"""
+    iso2 = (iso2 or '').upper()
+    for code, info in COUNTRIES.items():
+        if info['iso2'] == iso2:
+            return code
+    return None
+
+
+def render_js():
+    """COUNTRIES → js/countries.js 내용"""
+    lines = [
+        '// 자동 생성 파일 — 수정하지 말고 country_registry.py를 고친 뒤 python country_registry.py --js 실행',
+        '// 국가 정보',
+        'const COUNTRIES = {'
+    ]
+    entries = []
+    for code, info in COUNTRIES.items():
+        fields = ', '.join(f"{js_name}: {json.dumps(info[field], ensure_ascii=False)}" for field, js_name in JS_FIELDS.items())
+        entries.append(f"    '{code}': {{ {fields} }}")
+    lines.append(',\n'.join(entries))
+    lines.append('};')
+    lines.append('')
+    lines.append("if (typeof module !== 'undefined') {")
+    lines.append('    module.exports = { COUNTRIES };')
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def write_js(path=DEFAULT_JS_PATH):
+    write_text_atomic(path, render_js())
+    return path
+
+
+# ---------- 좌표 → 국가 ----------
+
+def _bbox_parts(bbox):
+    """날짜변경선을 넘는 bbox(west > east)를 두 부분으로"""
+    west, south, east, north = bbox
+    if west <= east:
+        return [(west, south, east, north)]
+    return [(west, south, 180.0, north), (-180.0, south, east, north)]
+
+
+def simplify_ring(points, tolerance):
+    """Douglas-Peucker 단순화 (tolerance는 도 단위, 0이면 그대로)"""
+    if tolerance <= 0 or len(points) < 5:
+        return points
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        (x1, y1), (x2, y2) = points[first], points[last]
+        dx, dy = x2 - x1, y2 - y1
+        length = math.hypot(dx, dy)
+        farthest, index = 0.0, None
+        for i in range(first + 1, last):
+            x, y = points[i]
+            if length:
+                distance = abs(dy * (x - x1) - dx * (y - y1)) / length
+            else:
+                distance = math.hypot(x - x1, y - y1)
+            if distance > farthest:
+                farthest, index = distance, i
+        if index is not None and farthest > tolerance:
+            keep[index] = True
+            stack.append((first, index))
+            stack.append((index, last))
+    simplified = [point for point, kept in zip(points, keep) if kept]
+    return simplified if len(simplified) >= 4 else points
+
+
+class _Polygon:
+    """폴리곤 한 조각 (바깥 고리 + 구멍), 변을 위도 띠(band)별로 나눠 두어 판정 시 해당 띠의 변만 검사"""
+    __slots__ = ('country', 'bbox', 'south', 'band_size', 'bands')
+
+    def __init__(self, country, rings, band_size):
+        self.country = country
+        self.band_size = band_size
+        xs = [x for ring in rings for x, _ in ring]
+        ys = [y for ring in rings for _, y in ring]
+        self.bbox = (min(xs), min(ys), max(xs), max(ys))
+        self.south = self.bbox[1]
+        self.bands = {}
+        for ring in rings:
+            for (x1, y1), (x2, y2) in zip(ring, ring[1:] + ring[:1]):
+                if y1 == y2:
+                    continue
+                low, high = min(y1, y2), max(y1, y2)
+                for band in range(self._band(low), self._band(high) + 1):
+                    self.bands.setdefault(band, []).append((x1, y1, x2, y2))
+
+    def _band(self, y):
+        return int((y - self.south) // self.band_size)
+
+    def contains(self, lng, lat):
+        west, south, east, north = self.bbox
+        if not (west <= lng <= east and south <= lat <= north):
+            return False
+        # 짝홀 규칙 광선 투사 (구멍도 같은 규칙으로 처리됨)
+        inside = False
+        for x1, y1, x2, y2 in self.bands.get(self._band(lat), ()):
+            if (y1 > lat) != (y2 > lat) and lng < x1 + (lat - y1) * (x2 - x1) / (y2 - y1):
+                inside = not inside
+        return inside
+
+
+def _feature_country(properties):
+    """GeoJSON feature 속성 → 국가 코드 (country / ISO_A2 / iso_a2 / ISO3166-1 중 하나)"""
+    for key in ('country', 'code'):
+        if properties.get(key) in COUNTRIES:
+            return properties[key]
+    for key in ('ISO_A2', 'iso_a2', 'ISO3166-1', 'ISO3166-1:alpha2', 'iso2'):
+        code = country_by_iso2(properties.get(key))
+        if code:
+            return code
+    return None
+
+
+class CountryLocator:
+    """좌표 → 국가 코드, 격자 셀마다 후보 폴리곤/bbox 목록을 미리 만들어 두고 조회"""
+
+    def __init__(self, boundary_dir=DEFAULT_BOUNDARY_DIR, cell_size=1.0, tolerance=0.01, band_size=0.25):
+        self.cell_size = cell_size
+        self.cols = math.ceil(360 / cell_size)
+        self.polygons = {}     # 셀 → [_Polygon]
+        self.bboxes = {}       # 셀 → [(면적, 국가, bbox 조각)] 면적 오름차순
+        self.polygon_count = 0
+
+        for code, info in COUNTRIES.items():
+            area = sum((east - west) * (north - south) for west, south, east, north in _bbox_parts(info['bbox']))
+            for part in _bbox_parts(info['bbox']):
+                for cell in self._cells(part):
+                    self.bboxes.setdefault(cell, []).append((area, code, part))
+        for candidates in self.bboxes.values():
+            candidates.sort()
+
+        for path in sorted(glob.glob(os.path.join(boundary_dir, '*.geojson'))):
+            self.load_geojson(path, tolerance, band_size)
+
+    @property
+    def has_boundaries(self):
+        return self.polygon_count > 0
+
+    def _cell(self, lng, lat):
+        return int((lat + 90) // self.cell_size), int((lng + 180) // self.cell_size) % self.cols
+
+    def _cells(self, bbox):
+        west, south, east, north = bbox
+        iy0, ix0 = self._cell(west, south)
+        iy1, ix1 = self._cell(min(east, 180 - 1e-9), north)
+        for iy in range(iy0, iy1 + 1):
+            for ix in range(ix0, ix1 + 1):
+                yield iy, ix
+
+    def load_geojson(self, path, tolerance=0.01, band_size=0.25):
+        """국경 GeoJSON(FeatureCollection, Polygon/MultiPolygon) 추가, 등록된 국가만 사용"""
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        features = data.get('features', [data])
+        for feature in features:
+            country = _feature_country(feature.get('properties') or {})
+            geometry = feature.get('geometry') or {}
+            if country is None or geometry.get('type') not in ('Polygon', 'MultiPolygon'):
+                continue
+            parts = geometry['coordinates'] if geometry['type'] == 'MultiPolygon' else [geometry['coordinates']]
+            for part in parts:
+                rings = [simplify_ring([(float(x), float(y)) for x, y, *_ in ring[:-1] or ring], tolerance) for ring in part]
+                rings = [ring for ring in rings if len(ring) >= 3]
+                if not rings:
+                    continue
+                polygon = _Polygon(country, rings, band_size)
+                for cell in self._cells(polygon.bbox):
+                    self.polygons.setdefault(cell, []).append(polygon)
+                self.polygon_count += 1
+
+    def locate(self, lat, lng, fallback=True):
+        """좌표 → 국가 코드 (어느 국가에도 속하지 않으면 None, fallback=False면 폴리곤으로만 판정)"""
+        cell = self._cell(lng, lat)
+        for polygon in self.polygons.get(cell, ()):
+            if polygon.contains(lng, lat):
+                return polygon.country
+        if not fallback:
+            return None
+        for _, code, (west, south, east, north) in self.bboxes.get(cell, ()):
+            if west <= lng <= east and south <= lat <= north:
+                return code
+        return None
+
+    def locate_many(self, points):
+        return [self.locate(lat, lng) for lat, lng in points]
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+
+    if '--js' in sys.argv:
+        print(f"✅ {write_js()} 생성 ({len(COUNTRIES)}개국)")
+    elif '--bench' in sys.argv:
+        locator = CountryLocator()
+        rng = random.Random(0)
+        points = [(rng.uniform(-45, 40), rng.uniform(-120, 180)) for _ in range(100000)]
+        started = time.perf_counter()
+        found = sum(1 for code in locator.locate_many(points) if code)
+        seconds = time.perf_counter() - started
+        mode = f"폴리곤 {locator.polygon_count}개" if locator.has_boundaries else "bbox"
+        print(f"⏱️ {len(points)}개 좌표 ({mode}): {seconds / len(points) * 1e6:.2f}µs/건, 국가 판정 {found}개")
+    elif len(args) == 2:
+        print(CountryLocator().locate(float(args[0]), float(args[1])))
+    else:
+        for code, info in COUNTRIES.items():
+            print(f"{info['flag']} {code:<18}{info['iso2']:<4}{info['name']}")
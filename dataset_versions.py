@@ -0,0 +1,379 @@
+"""
+데이터셋 버전 + 버전 간 차분 패치 (오프라인 클라이언트 동기화용)
+
+수집/동기화/내보내기를 실행할 때마다 국가별 시설 목록이 바뀌었으면 번호를 하나 올린 버전을 만들고,
+직전 버전과의 차분(추가된 시설, 바뀐 필드만, 삭제된 id)을 바이너리 패치로 저장한다.
+오래된 사본을 가진 클라이언트는 국가 전체 대신 N → N+1 → ... → 최신 패치(보통 수 KB)만 받으면 된다.
+
+- 시설 식별: osm_id (없으면 좌표+이름)
+- 스냅샷: 식별자 순으로 정렬한 전송 포맷(wire_format.py, .fwire) → 파일 해시 = 데이터셋 해시
+- 패치 적용 후 결과 해시가 패치에 적힌 목표 해시와 다르면 실패 (적용 전 해시도 확인)
+
+출력 구조 (data/shards/versions/{국가}/, 정적 샤드와 함께 배포):
+    index.json                         ← 버전 목록 (해시 없는 파일, 짧게 캐시)
+    v{번호}.{해시}.fwire               ← 스냅샷 (최근 KEEP_SNAPSHOTS개만 유지)
+    {이전}-{번호}.{해시}.fpatch        ← 직전 버전 → 이 버전 패치 (모두 유지)
+
+패치 구조:
+    MAGIC(4) | 이전 버전 | 버전 | 이전 해시 | 목표 해시
+    | 삭제 id 표 | 변경 수 | (id, 필드 비트마스크, 바뀐 값들)... | 추가 시설(.fwire) 길이 + 본문
+    (정수는 varint, 좌표는 1e-6도 정수의 zigzag varint, 문자열은 길이 varint + UTF-8)
+
+사용법:
+    python dataset_versions.py bangladesh                       → 버전 목록
+    python dataset_versions.py --commit bangladesh              → data/bangladesh_facilities.fcol로 버전 생성
+    python dataset_versions.py --verify bangladesh              → 스냅샷/패치 체인 해시 검증
+    python dataset_versions.py --sync=3 bangladesh              → 버전 3에서 최신까지 받을 패치와 크기
+    python dataset_versions.py --apply --out=new.fwire v3.x.fwire 3-4.y.fpatch 4-5.z.fpatch
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+
+from atomic_io import write_bytes_atomic
+from wire_format import (COORD_SCALE, decode_facilities, encode_facilities, read_string, read_table,
+                         read_varint, unzigzag, write_string, write_table, write_varint, zigzag)
+
+DEFAULT_VERSION_DIR = 'data/shards/versions'
+KEEP_SNAPSHOTS = 5
+PATCH_MAGIC = b'FDP\x01'
+# 패치에서 비교하는 필드 (osm_id는 식별자라 바뀌면 삭제 + 추가)
+VERSION_FIELDS = ['name', 'lat', 'lng', 'type', 'country']
+COORD_FIELDS = ('lat', 'lng')
+
+
+def content_hash(payload):
+    return hashlib.sha256(payload).hexdigest()[:12]
+
+
+def facility_key(facility):
+    """시설 식별자 (osm_id, 없으면 좌표+이름)"""
+    return facility['osm_id'] or f"@{facility['lat']:.6f},{facility['lng']:.6f},{facility['name']}"
+
+
+def canonical_records(facilities):
+    """시설 이터러블 → {식별자: 시설} (전송 포맷으로 왕복해 클라이언트가 받는 값과 같게 맞춤, 같은 id는 나중 것)"""
+    rows = decode_facilities(encode_facilities(list(facilities)))
+    return {facility_key(row): row for row in rows}
+
+
+def encode_snapshot(records):
+    return encode_facilities([records[key] for key in sorted(records)])
+
+
+def read_snapshot(payload):
+    return {facility_key(row): row for row in decode_facilities(payload)}
+
+
+def dataset_hash(records):
+    return content_hash(encode_snapshot(records))
+
+
+def diff_records(before, after):
+    """{'added': [시설], 'changed': [(id, {필드: 새 값})], 'removed': [id]} (id 순)"""
+    added, changed = [], []
+    for key in sorted(after):
+        row, old = after[key], before.get(key)
+        if old is None:
+            added.append(row)
+            continue
+        fields = {field: row[field] for field in VERSION_FIELDS if row[field] != old[field]}
+        if fields:
+            changed.append((key, fields))
+    removed = sorted(key for key in before if key not in after)
+    return {'added': added, 'changed': changed, 'removed': removed}
+
+
+def encode_patch(base_version, version, base_hash, target_hash, changes):
+    out = bytearray(PATCH_MAGIC)
+    write_varint(out, base_version)
+    write_varint(out, version)
+    write_string(out, base_hash)
+    write_string(out, target_hash)
+    write_table(out, changes['removed'])
+
+    write_varint(out, len(changes['changed']))
+    for key, fields in changes['changed']:
+        write_string(out, key)
+        write_varint(out, sum(1 << i for i, field in enumerate(VERSION_FIELDS) if field in fields))
+        for field in VERSION_FIELDS:
+            if field not in fields:
+                continue
+            if field in COORD_FIELDS:
+                write_varint(out, zigzag(round(fields[field] * COORD_SCALE)))
+            else:
+                write_string(out, fields[field])
+
+    added = encode_facilities(changes['added'])
+    write_varint(out, len(added))
+    out += added
+    return bytes(out)
+
+
+def decode_patch(payload):
+    """bytes → {'base_version', 'version', 'base_hash', 'target_hash', 'added', 'changed', 'removed'}"""
+    if payload[:len(PATCH_MAGIC)] != PATCH_MAGIC:
+        raise ValueError("데이터셋 패치(.fpatch) 파일이 아닙니다")
+
+    pos = len(PATCH_MAGIC)
+    base_version, pos = read_varint(payload, pos)
+    version, pos = read_varint(payload, pos)
+    base_hash, pos = read_string(payload, pos)
+    target_hash, pos = read_string(payload, pos)
+    removed, pos = read_table(payload, pos)
+
+    count, pos = read_varint(payload, pos)
+    changed = []
+    for _ in range(count):
+        key, pos = read_string(payload, pos)
+        mask, pos = read_varint(payload, pos)
+        fields = {}
+        for i, field in enumerate(VERSION_FIELDS):
+            if not mask & (1 << i):
+                continue
+            if field in COORD_FIELDS:
+                value, pos = read_varint(payload, pos)
+                fields[field] = unzigzag(value) / COORD_SCALE
+            else:
+                fields[field], pos = read_string(payload, pos)
+        changed.append((key, fields))
+
+    length, pos = read_varint(payload, pos)
+    added = decode_facilities(payload[pos:pos + length])
+    return {
+        'base_version': base_version, 'version': version, 'base_hash': base_hash, 'target_hash': target_hash,
+        'added': added, 'changed': changed, 'removed': removed
+    }
+
+
+def apply_patch(records, payload, verify=True):
+    """패치 적용 → 새 {식별자: 시설} (원본은 그대로), verify면 적용 전/후 해시 확인"""
+    patch = decode_patch(payload)
+    if verify and dataset_hash(records) != patch['base_hash']:
+        raise ValueError(f"패치 기준 데이터가 다릅니다 (v{patch['base_version']} {patch['base_hash']} 필요)")
+
+    result = dict(records)
+    for key in patch['removed']:
+        if result.pop(key, None) is None:
+            raise ValueError(f"삭제할 시설이 없습니다: {key}")
+    for key, fields in patch['changed']:
+        if key not in result:
+            raise ValueError(f"수정할 시설이 없습니다: {key}")
+        result[key] = dict(result[key], **fields)
+    for row in patch['added']:
+        result[facility_key(row)] = row
+
+    if verify and dataset_hash(result) != patch['target_hash']:
+        raise ValueError(f"패치 적용 결과 해시 불일치 (v{patch['version']} {patch['target_hash']} 기대)")
+    return result
+
+
+class DatasetStore:
+    """국가별 버전 목록 + 스냅샷 + 패치 (data/shards/versions/{국가}/)"""
+
+    def __init__(self, root=DEFAULT_VERSION_DIR, keep_snapshots=KEEP_SNAPSHOTS):
+        self.root = root
+        self.keep_snapshots = keep_snapshots
+
+    def path(self, country, filename):
+        return os.path.join(self.root, country, filename)
+
+    def load_index(self, country):
+        path = self.path(country, 'index.json')
+        if not os.path.exists(path):
+            return {'country': country, 'latest': 0, 'hash': None, 'versions': []}
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+
+    def save_index(self, country, index):
+        # 클라이언트가 매번 받는 파일이므로 공백 없이
+        payload = json.dumps(index, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        write_bytes_atomic(self.path(country, 'index.json'), payload)
+
+    def read(self, country, filename):
+        with open(self.path(country, filename), 'rb') as f:
+            return f.read()
+
+    def commit(self, country, facilities, source=None):
+        """현재 시설 목록을 버전으로 기록 → (버전 항목, 새로 만들었는지) (최신 버전과 같은 데이터면 기존 항목)"""
+        records = canonical_records(facilities)
+        snapshot = encode_snapshot(records)
+        digest = content_hash(snapshot)
+        index = self.load_index(country)
+        versions = index['versions']
+        latest = versions[-1] if versions else None
+        if latest is not None and latest['hash'] == digest:
+            return latest, False
+
+        os.makedirs(os.path.join(self.root, country), exist_ok=True)
+        number = index['latest'] + 1
+        entry = {
+            'version': number,
+            'hash': digest,
+            'count': len(records),
+            'created': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+            'source': source,
+            'snapshot': f"v{number}.{digest}.fwire",
+            'snapshot_bytes': len(snapshot),
+            'patch': None
+        }
+        write_bytes_atomic(self.path(country, entry['snapshot']), snapshot)
+
+        # 직전 스냅샷이 남아 있을 때만 패치 생성 (없으면 이 버전부터는 전체 다운로드)
+        if latest is not None and latest.get('snapshot') and os.path.exists(self.path(country, latest['snapshot'])):
+            base = read_snapshot(self.read(country, latest['snapshot']))
+            changes = diff_records(base, records)
+            patch = encode_patch(latest['version'], number, latest['hash'], digest, changes)
+            entry.update(
+                patch=f"{latest['version']}-{number}.{content_hash(patch)}.fpatch",
+                patch_bytes=len(patch),
+                added=len(changes['added']),
+                changed=len(changes['changed']),
+                removed=len(changes['removed'])
+            )
+            write_bytes_atomic(self.path(country, entry['patch']), patch)
+
+        versions.append(entry)
+        index.update(latest=number, hash=digest)
+        self.prune(country, index)
+        self.save_index(country, index)
+        return entry, True
+
+    def prune(self, country, index):
+        """최근 keep_snapshots개를 뺀 스냅샷 삭제 (패치는 유지)"""
+        with_snapshot = [entry for entry in index['versions'] if entry.get('snapshot')]
+        for entry in with_snapshot[:-self.keep_snapshots]:
+            path = self.path(country, entry['snapshot'])
+            if os.path.exists(path):
+                os.remove(path)
+            entry['snapshot'] = None
+
+    def patch_chain(self, country, from_version):
+        """from_version → 최신까지 적용할 패치 항목 목록 (중간에 패치가 없으면 None → 전체 다운로드)"""
+        chain = [entry for entry in self.load_index(country)['versions'] if entry['version'] > from_version]
+        if any(entry['patch'] is None for entry in chain):
+            return None
+        return chain
+
+    def checkout(self, country, version=None):
+        """버전의 {식별자: 시설} — 그 이전의 가장 가까운 스냅샷에 패치를 차례로 적용 (해시 검증 포함)"""
+        versions = self.load_index(country)['versions']
+        version = version or (versions[-1]['version'] if versions else 0)
+        bases = [entry for entry in versions if entry['version'] <= version and entry.get('snapshot')]
+        if not bases:
+            raise ValueError(f"{country} v{version} 이전 스냅샷이 없습니다")
+
+        base = bases[-1]
+        records = read_snapshot(self.read(country, base['snapshot']))
+        for entry in versions:
+            if base['version'] < entry['version'] <= version:
+                if entry['patch'] is None:
+                    raise ValueError(f"{country} v{entry['version']} 패치가 없습니다")
+                records = apply_patch(records, self.read(country, entry['patch']))
+        return records
+
+    def verify(self, country):
+        """스냅샷 파일 해시 + 가장 오래된 스냅샷에서 최신까지 패치 체인 재생 → 오류 목록"""
+        errors = []
+        versions = self.load_index(country)['versions']
+        for entry in versions:
+            if entry.get('snapshot'):
+                payload = self.read(country, entry['snapshot'])
+                if content_hash(payload) != entry['hash']:
+                    errors.append(f"v{entry['version']} 스냅샷 해시 불일치")
+
+        bases = [entry for entry in versions if entry.get('snapshot')]
+        if not bases:
+            return errors + ["스냅샷이 없습니다"]
+        records = read_snapshot(self.read(country, bases[0]['snapshot']))
+        for entry in versions:
+            if entry['version'] <= bases[0]['version']:
+                continue
+            if entry['patch'] is None:
+                # 패치가 끊긴 지점부터는 그 버전 스냅샷에서 다시 시작
+                if not entry.get('snapshot'):
+                    errors.append(f"v{entry['version']} 패치와 스냅샷이 모두 없습니다")
+                    break
+                records = read_snapshot(self.read(country, entry['snapshot']))
+                continue
+            try:
+                records = apply_patch(records, self.read(country, entry['patch']))
+            except (OSError, ValueError) as e:
+                errors.append(f"v{entry['version']} 패치: {e}")
+                break
+        return errors
+
+
+def read_records_file(path):
+    """.fwire 스냅샷 또는 수집기 출력(.fcol/.csv) → {식별자: 시설}"""
+    if path.endswith('.fwire'):
+        with open(path, 'rb') as f:
+            return read_snapshot(f.read())
+    from facility_store import iter_facility_file
+    return canonical_records(iter_facility_file(path))
+
+
+if __name__ == "__main__":
+    options = dict(arg[2:].partition('=')[::2] for arg in sys.argv[1:] if arg.startswith('--'))
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    store = DatasetStore(options.get('root') or DEFAULT_VERSION_DIR)
+
+    if 'apply' in options:
+        records = read_records_file(args[0])
+        for path in args[1:]:
+            with open(path, 'rb') as f:
+                payload = f.read()
+            try:
+                records = apply_patch(records, payload)
+            except ValueError as e:
+                print(f"❌ {path}: {e}")
+                sys.exit(1)
+            patch = decode_patch(payload)
+            print(f"🧩 v{patch['base_version']} → v{patch['version']}: 추가 {len(patch['added'])}, "
+                  f"수정 {len(patch['changed'])}, 삭제 {len(patch['removed'])} ({len(payload):,} bytes)")
+        snapshot = encode_snapshot(records)
+        print(f"✅ {len(records)}개 시설, 해시 {content_hash(snapshot)} 검증 완료")
+        if options.get('out'):
+            write_bytes_atomic(options['out'], snapshot)
+            print(f"💾 {options['out']}")
+    elif 'commit' in options:
+        from export_shards import find_country_files
+        files = find_country_files()
+        for country in args or sorted(files):
+            if country not in files:
+                print(f"⚠️ 수집 데이터 없음: {country}")
+                continue
+            entry, created = store.commit(country, read_records_file(files[country]).values(), source='manual')
+            state = "생성" if created else "변경 없음"
+            print(f"🏷️ {country} v{entry['version']} ({entry['hash']}, {entry['count']}개 시설) {state}")
+    elif 'verify' in options:
+        failed = False
+        for country in args:
+            errors = store.verify(country)
+            for error in errors:
+                print(f"❌ {country}: {error}")
+            failed = failed or bool(errors)
+            if not errors:
+                print(f"✅ {country} 버전 체인 검증 통과")
+        sys.exit(1 if failed else 0)
+    elif 'sync' in options:
+        country = args[0]
+        chain = store.patch_chain(country, int(options['sync']))
+        latest = store.load_index(country)['versions'][-1]
+        if chain is None:
+            print(f"📦 패치가 끊겨 전체 다운로드 필요: {latest['snapshot']} ({latest['snapshot_bytes']:,} bytes)")
+        else:
+            for entry in chain:
+                print(f"  {entry['patch']}  {entry['patch_bytes']:,} bytes")
+            print(f"🔄 v{options['sync']} → v{latest['version']}: 패치 {len(chain)}개, "
+                  f"{sum(entry['patch_bytes'] for entry in chain):,} bytes (전체 {latest['snapshot_bytes']:,} bytes)")
+    else:
+        for country in args:
+            for entry in store.load_index(country)['versions']:
+                patch = f"+{entry['added']} ~{entry['changed']} -{entry['removed']} {entry['patch_bytes']:,}B" \
+                    if entry['patch'] else "패치 없음"
+                print(f"v{entry['version']:<4} {entry['hash']}  {entry['count']:>7}개  {entry['created']}  "
+                      f"{entry['source'] or '':<10} {patch}")
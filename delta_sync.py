@@ -0,0 +1,294 @@
+"""
+증분 동기화 (바뀐 시설만 받아 업로드)
+
+국가/타일별 마지막 동기화 시각(watermark)을 data/sync/watermarks.json에 저장하고,
+다음 실행에서는 Overpass `newer:` 필터로 그 이후 새로 생기거나 수정된 element만 본문째 받는다.
+삭제(또는 태그가 바뀌어 조건에서 빠진 시설)는 같은 쿼리의 `out ids` 목록(type/id만)과
+지난 스냅샷(data/{국가}_facilities.fcol)을 비교해 찾는다.
+
+결과:
+    data/sync/{국가}_changes_{시각}.json   → added / modified / deleted (뎅기열), diseases: 다른 질병별 변경
+    data/{국가}_facilities.csv/.fcol        → 변경을 반영한 새 스냅샷 (다른 질병은 data/{질병}/...)
+    data/shards/versions/{국가}/            → 새 데이터셋 버전 + 직전 버전과의 패치 (dataset_versions.py)
+
+사용법:
+    python delta_sync.py bangladesh
+    python delta_sync.py --all
+    python delta_sync.py --full bangladesh   → watermark 무시하고 전체 비교
+    python delta_sync.py --diseases=malaria bangladesh   → 뎅기열과 함께 다른 질병 스냅샷도 갱신 (all 가능)
+    python firestore_uploader.py --changes data/sync/bangladesh_changes_*.json
+"""
+
+import json
+import os
+import sys
+import time
+
+from atomic_io import write_json_atomic
+from facility_store import iter_facility_file
+from facility_classifier import DISEASES
+from osm_data_collector import OSMDengueCollector, TileRetry, output_paths
+from overpass_query import build_delta_query
+from overpass_tiles import plan_tiles, subdivide_tile, tile_key, tile_size
+
+DEFAULT_SYNC_DIR = 'data/sync'
+# 값이 달라지면 modified로 보는 필드
+COMPARE_FIELDS = ('name', 'lat', 'lng', 'type')
+
+
+class WatermarkStore:
+    """{국가: {타일 키: Overpass 데이터 기준 시각}}"""
+
+    def __init__(self, path=os.path.join(DEFAULT_SYNC_DIR, 'watermarks.json')):
+        self.path = path
+        self.data = {}
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                self.data = json.load(f)
+
+    def get(self, country, tile):
+        return self.data.get(country, {}).get(tile_key(tile))
+
+    def update(self, country, marks):
+        self.data.setdefault(country, {}).update(marks)
+
+    def forget(self, country):
+        self.data.pop(country, None)
+
+    def drop(self, country, keys):
+        """분할된 타일의 watermark 삭제 (이후에는 하위 타일 watermark 사용)"""
+        for key in keys:
+            self.data.get(country, {}).pop(key, None)
+
+    def has_subtiles(self, country, tile, tolerance=1e-3):
+        """타일 안에 들어가는 더 작은 타일의 watermark가 있으면 True (지난 실행에서 분할된 타일)"""
+        west, south, east, north = tile
+        for key in self.data.get(country, {}):
+            w, s, e, n = (float(value) for value in key.split(','))
+            if (e - w) < (east - west) - tolerance and west - tolerance <= w and e <= east + tolerance \
+                    and south - tolerance <= s and n <= north + tolerance:
+                return True
+        return False
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        write_json_atomic(self.path, self.data)
+
+
+def snapshot_path(country, disease='dengue'):
+    """지난 수집 결과 파일 (.fcol 우선, 없으면 .csv, 둘 다 없으면 None)"""
+    csv_path, store_path = output_paths(country, disease)
+    for path in (store_path, csv_path):
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def load_snapshot(country, disease='dengue'):
+    """osm_id → 시설 dict (osm_id가 없는 행은 비교 대상이 아니므로 제외)"""
+    path = snapshot_path(country, disease)
+    if path is None:
+        return {}
+    return {row['osm_id']: row for row in iter_facility_file(path) if row.get('osm_id')}
+
+
+def changed_fields(before, after):
+    changed = []
+    for field in COMPARE_FIELDS:
+        old, new = before.get(field), after.get(field)
+        if field in ('lat', 'lng'):
+            if abs(float(old) - float(new)) > 1e-7:
+                changed.append(field)
+        elif str(old or '') != str(new or ''):
+            changed.append(field)
+    return changed
+
+
+def diff_facilities(snapshot, changed, current_ids):
+    """지난 스냅샷과 비교 → {'added', 'modified', 'deleted'}
+
+    changed: 이번에 본문을 받은 시설 (osm_id → 시설, 뎅기열과 무관해진 element는 None)
+    current_ids: 지금 쿼리 조건에 맞는 전체 osm_id
+    """
+    added, modified, deleted = [], [], []
+    for osm_id, facility in changed.items():
+        before = snapshot.get(osm_id)
+        if facility is None:
+            continue
+        if before is None:
+            added.append(facility)
+        else:
+            fields = changed_fields(before, facility)
+            if fields:
+                modified.append({'osm_id': osm_id, 'changed': fields, 'facility': facility})
+
+    for osm_id, before in snapshot.items():
+        if osm_id not in current_ids or (osm_id in changed and changed[osm_id] is None):
+            deleted.append(before)
+    return {'added': added, 'modified': modified, 'deleted': deleted}
+
+
+class DeltaSync:
+    def __init__(self, collector=None, sync_dir=DEFAULT_SYNC_DIR, full=False):
+        self.collector = collector or OSMDengueCollector()
+        # 변경 내역 최상위(added/modified/deleted)와 Firestore 업로드는 뎅기열 기준
+        if 'dengue' not in self.collector.diseases:
+            raise ValueError("증분 동기화는 dengue를 포함한 질병 목록이 필요합니다")
+        self.sync_dir = sync_dir
+        self.full = full
+        self.watermarks = WatermarkStore(os.path.join(sync_dir, 'watermarks.json'))
+
+    def fetch_tile(self, tile, country_code, since):
+        """타일 하나의 (현재 osm_id 집합, 바뀐 element 목록, 데이터 기준 시각) (분할이 필요하면 TileRetry)
+
+        수집기와 같은 경로(응답 캐시, element 수/remark 검사)로 받고 쿼리만 증분 쿼리로 바꿈
+        """
+        collector = self.collector
+        query = build_delta_query(tile, collector.classifier.keywords, since)
+
+        ids, elements = set(), []
+        tile_elements = collector.iter_tile(tile, country_code, query=query)
+        while True:
+            try:
+                element = next(tile_elements)
+            except StopIteration as done:
+                stream = done.value
+                break
+            # out ids 출력은 type/id만, out body/out tags는 태그 포함
+            if 'tags' in element:
+                elements.append(element)
+            else:
+                ids.add(f"{element['type']}/{element['id']}")
+
+        collector.metrics.add('delta_elements', len(elements), country_code)
+        timestamp = stream.timestamp or time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+        return ids, elements, timestamp
+
+    def sync_country(self, country_code):
+        """국가 하나 증분 동기화 → 변경 내역 dict (타일 하나라도 실패하면 예외, watermark/스냅샷 유지)
+
+        타임아웃/데이터 과다 타일은 수집기처럼 4분할하고 (하위 타일은 상위 타일의 watermark를 이어받음),
+        받은 element는 전체 수집과 같은 iter_facilities로 분류 (국경 밖 시설 제외, 질병별 결과)
+        """
+        collector = self.collector
+        diseases = collector.diseases
+        snapshots = {disease: load_snapshot(country_code, disease) for disease in diseases}
+        # 스냅샷이 없으면 비교 기준이 없으므로 watermark가 있어도 전체 수집
+        full = self.full or any(snapshot_path(country_code, disease) is None for disease in diseases)
+
+        bbox = collector.countries[country_code]['bbox']
+        current_ids, changed_ids, elements, marks, since, split = set(), set(), [], {}, {}, []
+        pending = [(tile, None) for tile in plan_tiles(bbox, collector.max_tile_size)]
+        while pending:
+            tile, inherited = pending.pop()
+            key = tile_key(tile)
+            own = None if full else self.watermarks.get(country_code, tile)
+            mark = own or inherited
+            # 지난 실행에서 분할된 타일은 다시 요청하지 않고 바로 분할 (하위 타일 watermark 사용)
+            if not full and own is None and self.watermarks.has_subtiles(country_code, tile):
+                pending.extend((sub, mark) for sub in subdivide_tile(tile))
+                continue
+            try:
+                ids, tile_elements, marks[key] = self.fetch_tile(tile, country_code, mark)
+            except TileRetry as e:
+                collector.metrics.exception(e, 'delta_fetch_tile', country_code)
+                if tile_size(tile) / 2 < collector.min_tile_size:
+                    raise RuntimeError(f"타일 {key} 분할 한계 도달: {e}")
+                print(f"✂️ 타일 {key} 4분할 ({e})")
+                pending.extend((sub, mark) for sub in subdivide_tile(tile))
+                split.append(key)
+                continue
+            since[key] = mark
+            current_ids |= ids
+            for element in tile_elements:
+                osm_id = f"{element['type']}/{element['id']}"
+                if osm_id not in changed_ids:
+                    changed_ids.add(osm_id)
+                    elements.append(element)
+
+        # 본문을 받았지만 어느 질병에도 해당하지 않으면 None (조건에서 빠진 시설 → 삭제)
+        changed = {disease: dict.fromkeys(changed_ids) for disease in diseases}
+        for disease, facility in collector.iter_facilities(elements, country_code):
+            changed[disease][facility['osm_id']] = facility
+
+        by_disease = {disease: diff_facilities(snapshots[disease], changed[disease], current_ids)
+                      for disease in diseases}
+        changes = dict(by_disease.pop('dengue'))
+        changes.update(country=country_code, since=since, watermarks=marks, split=split, diseases=by_disease)
+        return changes
+
+    def apply(self, country_code, changes):
+        """변경 내역 파일 저장 → 스냅샷 갱신 → watermark 갱신 (이 순서로 해야 중단돼도 다음 실행에서 복구 가능)"""
+        os.makedirs(self.sync_dir, exist_ok=True)
+        stamp = time.strftime('%Y%m%d_%H%M%S', time.gmtime())
+        path = os.path.join(self.sync_dir, f"{country_code}_changes_{stamp}.json")
+        write_json_atomic(path, changes)
+
+        for disease, disease_changes in iter_disease_changes(changes):
+            if not (disease_changes['added'] or disease_changes['modified'] or disease_changes['deleted']) \
+                    and snapshot_path(country_code, disease) is not None:
+                continue
+            facilities = {}
+            source = snapshot_path(country_code, disease)
+            if source is not None:
+                facilities = {row.get('osm_id') or f"_{i}": row for i, row in enumerate(iter_facility_file(source))}
+            for facility in disease_changes['deleted']:
+                facilities.pop(facility['osm_id'], None)
+            for facility in disease_changes['added']:
+                facilities[facility['osm_id']] = facility
+            for entry in disease_changes['modified']:
+                facilities[entry['osm_id']] = entry['facility']
+            self.collector.save_outputs(iter(list(facilities.values())), country_code, disease)
+
+        self.watermarks.update(country_code, changes['watermarks'])
+        self.watermarks.drop(country_code, changes.get('split', []))
+        self.watermarks.save()
+        return path
+
+    def sync(self, country_codes):
+        """국가별로 동기화하고 변경 내역 파일 경로 목록 반환 (실패한 국가는 건너뜀)"""
+        paths = []
+        for country_code in country_codes:
+            print(f"🔄 {country_code} 증분 동기화")
+            try:
+                changes = self.sync_country(country_code)
+            except Exception as e:
+                print(f"❌ {country_code} 동기화 실패 (watermark 유지): {e}")
+                self.collector.metrics.exception(e, 'delta_sync', country_code)
+                continue
+            path = self.apply(country_code, changes)
+            print(f"✅ 추가 {len(changes['added'])}, 수정 {len(changes['modified'])}, "
+                  f"삭제 {len(changes['deleted'])} → {path}")
+            paths.append(path)
+        return paths
+
+
+def iter_disease_changes(changes):
+    """변경 내역 → (질병, {'added', 'modified', 'deleted'}) (뎅기열은 최상위, 다른 질병은 changes['diseases'])"""
+    yield 'dengue', changes
+    yield from changes.get('diseases', {}).items()
+
+
+def iter_changes(paths):
+    """변경 내역 파일들 → ('set' | 'delete', 시설 dict)"""
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            changes = json.load(f)
+        for facility in changes['added']:
+            yield 'set', facility
+        for entry in changes['modified']:
+            yield 'set', entry['facility']
+        for facility in changes['deleted']:
+            yield 'delete', facility
+
+
+if __name__ == "__main__":
+    options = dict(arg[2:].partition('=')[::2] for arg in sys.argv[1:] if arg.startswith('--'))
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    diseases = ['dengue']
+    if options.get('diseases'):
+        extra = list(DISEASES) if options['diseases'] == 'all' else options['diseases'].split(',')
+        diseases += [disease for disease in extra if disease != 'dengue']
+    syncer = DeltaSync(OSMDengueCollector(diseases=diseases), full='full' in options)
+    countries = list(syncer.collector.countries) if '--all' in sys.argv else (args or ['papua_new_guinea'])
+    syncer.sync(countries)
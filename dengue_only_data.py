@@ -1,8 +1,56 @@
 import csv
+import json
+import math
 import random
+import sys
 
-def create_dengue_specific_data():
-    """뎅기열 전용 시설 데이터 생성"""
+from country_registry import COUNTRIES, country_bboxes
+from facility_classifier import KEYWORD_TABLES
+
+# 뎅기열 전용 시설 템플릿
+FACILITY_TEMPLATES = {
+    'vaccine': [
+        '{city} Dengue Vaccination Center',
+        '{city} EPI Dengue Center',
+        'Dengue Prevention Center {city}',
+        '{city} Immunization Clinic'
+    ],
+    'blood_test': [
+        '{city} Dengue Diagnostic Lab',
+        'Dengue Blood Test Center {city}',
+        '{city} Fever Diagnostic Center',
+        'Dengue Detection Lab {city}'
+    ],
+    'aid': [
+        '{city} Free Dengue Clinic',
+        'Dengue Relief Center {city}',
+        '{city} Community Dengue Care',
+        'Free Dengue Treatment {city}'
+    ],
+    'dengue_center': [
+        '{city} Dengue Control Center',
+        'Dengue Surveillance Unit {city}',
+        '{city} Dengue Response Team',
+        'Dengue Emergency Center {city}'
+    ]
+}
+
+# 뎅기열과 관계없는 병원/클리닉 이름 (Overpass 가짜 응답에서 분류기가 걸러내야 하는 것)
+UNRELATED_TEMPLATES = [
+    '{city} General Hospital', '{city} Eye Clinic', 'St. Mary Hospital {city}',
+    '{city} Dental Care', 'Community Health Post {city}', '{city} Maternity Clinic'
+]
+
+# 국가별 현지어 (현지어 시설 이름 생성용, 분류기 키워드 표가 없는 언어는 영어만)
+COUNTRY_LANGUAGES = {
+    code: info['local_lang'] for code, info in COUNTRIES.items()
+    if info['local_lang'] != 'en' and info['local_lang'] in KEYWORD_TABLES
+}
+
+
+def create_dengue_specific_data(seed=None):
+    """뎅기열 전용 시설 데이터 생성 (seed를 주면 항상 같은 결과)"""
+    rng = random.Random(seed)
     
     # 방글라데시 주요 도시
     cities = {
@@ -13,48 +61,22 @@ def create_dengue_specific_data():
         'Khulna': {'lat': 22.8456, 'lng': 89.5403}
     }
     
-    # 뎅기열 전용 시설 템플릿
-    facilities = {
-        'vaccine': [
-            '{city} Dengue Vaccination Center',
-            '{city} EPI Dengue Center',
-            'Dengue Prevention Center {city}',
-            '{city} Immunization Clinic'
-        ],
-        'blood_test': [
-            '{city} Dengue Diagnostic Lab',
-            'Dengue Blood Test Center {city}',
-            '{city} Fever Diagnostic Center',
-            'Dengue Detection Lab {city}'
-        ],
-        'aid': [
-            '{city} Free Dengue Clinic',
-            'Dengue Relief Center {city}',
-            '{city} Community Dengue Care',
-            'Free Dengue Treatment {city}'
-        ],
-        'dengue_center': [
-            '{city} Dengue Control Center',
-            'Dengue Surveillance Unit {city}',
-            '{city} Dengue Response Team',
-            'Dengue Emergency Center {city}'
-        ]
-    }
+    facilities = FACILITY_TEMPLATES
     
     locations = []
     
     for city, coords in cities.items():
         for facility_type, templates in facilities.items():
             # 각 타입별로 3-4개씩 생성
-            count = random.randint(3, 4)
+            count = rng.randint(3, 4)
             
             for i in range(count):
-                template = random.choice(templates)
+                template = rng.choice(templates)
                 name = template.replace('{city}', city)
                 
                 # 도시 중심에서 약간씩 떨어뜨리기
-                lat_offset = random.uniform(-0.03, 0.03)
-                lng_offset = random.uniform(-0.03, 0.03)
+                lat_offset = rng.uniform(-0.03, 0.03)
+                lng_offset = rng.uniform(-0.03, 0.03)
                 
                 location = {
                     'name': name,
@@ -69,8 +91,150 @@ def create_dengue_specific_data():
     
     return locations
 
+
+class SyntheticFacilityGenerator:
+    """시드 고정 대규모 가짜 시설 생성기 (10^5 ~ 10^7개, 메모리에 모으지 않고 한 개씩 생성)
+
+    - 국가마다 bbox 안에 가상의 도시를 두고, 도시 규모는 순위에 반비례(Zipf)하게 배분
+    - 시설은 도시 중심 주변 정규분포로 모이게 배치 (실제 데이터처럼 도심에 밀집)
+    - 이름은 영어 템플릿 또는 해당 국가 현지어 키워드 (분류기 키워드 표와 같은 타입)
+    - 같은 seed면 항상 같은 데이터
+    """
+
+    def __init__(self, seed=0, bboxes=None, cities_per_country=12, spread=0.08):
+        self.seed = seed
+        self.bboxes = bboxes or country_bboxes()
+        rng = random.Random(seed)
+
+        # 면적이 큰 국가일수록 시설이 많도록 가중치 부여
+        self.countries = sorted(self.bboxes)
+        self.country_weights = [math.sqrt(self._area(self.bboxes[code])) for code in self.countries]
+        self.cities = {code: self._make_cities(rng, code, cities_per_country) for code in self.countries}
+        self.spread = spread
+
+    @staticmethod
+    def _width(bbox):
+        west, _, east, _ = bbox
+        return (east - west) % 360 or 360    # 날짜변경선을 넘는 bbox(피지 등) 처리
+
+    def _area(self, bbox):
+        return self._width(bbox) * (bbox[3] - bbox[1])
+
+    def _point_in(self, rng, bbox):
+        west, south, _, north = bbox
+        lng = (west + rng.random() * self._width(bbox) + 180) % 360 - 180
+        return south + rng.random() * (north - south), lng
+
+    def _make_cities(self, rng, code, count):
+        cities = []
+        for rank in range(1, count + 1):
+            lat, lng = self._point_in(rng, self.bboxes[code])
+            cities.append({'name': f"{code.replace('_', ' ').title()} City {rank}", 'lat': lat, 'lng': lng})
+        weights = [1 / rank for rank in range(1, count + 1)]
+        return cities, weights
+
+    def facility_name(self, rng, country, city, facility_type):
+        """영어 템플릿 또는 (70% 확률로 영어) 현지어 키워드 이름"""
+        table = KEYWORD_TABLES.get(COUNTRY_LANGUAGES.get(country, 'en'), [])
+        local = [keyword for keyword, category in table if category == facility_type]
+        if local and rng.random() < 0.3:
+            return f"{rng.choice(local)} {city['name'].rsplit(' ', 1)[-1]}"
+        return rng.choice(FACILITY_TEMPLATES[facility_type]).replace('{city}', city['name'])
+
+    def facilities(self, count, countries=None):
+        """시설 dict를 count개 생성 (name, address, lat, lng, type, country, osm_id)"""
+        rng = random.Random(f"{self.seed}:facilities")
+        codes = countries or self.countries
+        weights = [self.country_weights[self.countries.index(code)] for code in codes]
+        types = list(FACILITY_TEMPLATES)
+
+        # 한 번에 나라를 여러 개 뽑아 rng 호출 횟수를 줄임 (count와 무관하게 같은 순서 → 앞부분은 항상 같은 데이터)
+        batch = 4096
+        for start in range(0, count, batch):
+            chosen = rng.choices(codes, weights, k=batch)[:count - start]
+            for offset, country in enumerate(chosen):
+                cities, city_weights = self.cities[country]
+                city = rng.choices(cities, city_weights)[0]
+                bbox = self.bboxes[country]
+                facility_type = rng.choice(types)
+                lat = min(max(rng.gauss(city['lat'], self.spread), bbox[1]), bbox[3])
+                lng = (rng.gauss(city['lng'], self.spread) + 180) % 360 - 180
+                yield {
+                    'name': self.facility_name(rng, country, city, facility_type),
+                    'address': f"{city['name']}, {country.replace('_', ' ').title()}",
+                    'lat': round(lat, 6),
+                    'lng': round(lng, 6),
+                    'type': facility_type,
+                    'country': country,
+                    'osm_id': f"node/{start + offset + 1}"
+                }
+
+    def overpass_elements(self, count, countries=None, unrelated_rate=0.5):
+        """Overpass [out:json] 형식 element 생성 (node는 lat/lon, way/relation은 center)
+
+        unrelated_rate 비율은 뎅기열과 관계없는 이름이라 분류기가 걸러내야 한다.
+        """
+        rng = random.Random(f"{self.seed}:overpass")
+        for i, facility in enumerate(self.facilities(count, countries)):
+            name = facility['name']
+            if rng.random() < unrelated_rate:
+                name = rng.choice(UNRELATED_TEMPLATES).replace('{city}', facility['address'].split(',')[0])
+            tags = {'amenity': rng.choice(['clinic', 'hospital']), 'name': name}
+            if rng.random() < 0.1:
+                tags['healthcare'] = 'laboratory' if facility['type'] == 'blood_test' else 'clinic'
+
+            kind = rng.choices(['node', 'way', 'relation'], [80, 15, 5])[0]
+            element = {'type': kind, 'id': i + 1}
+            if kind == 'node':
+                element.update(lat=facility['lat'], lon=facility['lng'])
+            else:
+                element['center'] = {'lat': facility['lat'], 'lon': facility['lng']}
+            element['tags'] = tags
+            yield element
+
+
+def write_overpass_payload(path, elements):
+    """element 이터러블을 Overpass 응답 형식 JSON 파일로 저장 (메모리에 모으지 않음)"""
+    count = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{"version": 0.6, "generator": "synthetic", "elements": [\n')
+        for element in elements:
+            f.write(('' if count == 0 else ',\n') + json.dumps(element, ensure_ascii=False))
+            count += 1
+        f.write('\n]}')
+    return count
+
+
+def write_facilities_csv(path, facilities):
+    fieldnames = ['name', 'address', 'lat', 'lng', 'type', 'country', 'osm_id']
+    count = 0
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        for facility in facilities:
+            writer.writerow(facility)
+            count += 1
+    return count
+
+
 # 실행
 if __name__ == "__main__":
+    # python dengue_only_data.py                                   → 방글라데시 뎅기열 시설 (기존)
+    # python dengue_only_data.py --count=1000000 --seed=1          → 전체 국가 가짜 시설 CSV
+    # python dengue_only_data.py --count=100000 --overpass=raw.json → 가짜 Overpass 응답
+    options = dict(arg[2:].partition('=')[::2] for arg in sys.argv[1:] if arg.startswith('--'))
+    if options.get('count'):
+        generator = SyntheticFacilityGenerator(seed=int(options.get('seed') or 0))
+        count = int(options['count'])
+        if options.get('overpass'):
+            written = write_overpass_payload(options['overpass'], generator.overpass_elements(count))
+            print(f"✅ 가짜 Overpass element {written}개 → {options['overpass']}")
+        else:
+            out_path = options.get('out') or 'data/synthetic_facilities.csv'
+            written = write_facilities_csv(out_path, generator.facilities(count))
+            print(f"✅ 가짜 시설 {written}개 → {out_path}")
+        sys.exit(0)
+
     print("🦟 뎅기열 전용 시설 데이터 생성 중...")
     dengue_data = create_dengue_specific_data()
     
@@ -0,0 +1,240 @@
+"""
+웹 클라이언트용 정적 데이터 샤드 내보내기
+
+국가별 시설 데이터를 지도 타일(z/x/y) 단위 JSON 파일로 나누고, 내용 해시를 파일명에 넣어
+클라이언트가 화면에 보이는 타일만 받아 영구 캐시할 수 있게 한다. (Firestore 전체 .get() 대체)
+서버가 미리 압축된 파일을 쓸 수 있도록 .gz (brotli 모듈이 있으면 .br도) 함께 만든다.
+
+출력 구조 (data/shards/):
+    manifest.json                                  ← 유일하게 해시 없는 파일 (짧게 캐시)
+    {country}/manifest.{hash}.json                 ← 국가별 타일 목록
+    {country}/{z}/{x}/{y}.{hash}.json(.gz/.br)     ← 타일 샤드
+    {country}/clusters/{filter}/{z}/{x}/{y}.{hash}.json  ← 줌/타입 필터별 사전 계산 클러스터 (marker_clusters.py)
+    {country}/search/{토큰 앞 글자 hex}.{hash}.json     ← 이름 검색 샤드 (facility_search.py, 검색할 때만 로드)
+    search/fold.{hash}.json                        ← 검색어 음역 규칙 (모든 국가 공용)
+    versions/{country}/...                         ← 데이터셋 버전 스냅샷/패치 (dataset_versions.py, 오프라인 사본 동기화)
+"""
+
+import glob
+import gzip
+import hashlib
+import json
+import os
+import sys
+import time
+
+from atomic_io import write_bytes_atomic
+from dataset_versions import DatasetStore
+from facility_store import iter_facility_file
+from facility_search import SEARCH_PREFIX_LEN, FacilitySearchIndex, fold_spec, shard_filename
+from facility_table import FacilityTable
+from marker_clusters import CLUSTER_FIELDS, MarkerClusterer, cluster_tiles, lat_lng_to_tile
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+DEFAULT_SHARD_DIR = 'data/shards'
+SHARD_ZOOM = 8                  # 적도 기준 타일 한 변 약 156km
+SHARD_FIELDS = ['name', 'lat', 'lng', 'type', 'osm_id']
+
+
+def content_hash(payload):
+    return hashlib.sha256(payload).hexdigest()[:12]
+
+
+def encode_json(data):
+    """공백 없는 JSON (같은 데이터면 항상 같은 바이트 → 같은 해시)"""
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'), sort_keys=True).encode('utf-8')
+
+
+def shard_row(facility):
+    row = []
+    for field in SHARD_FIELDS:
+        value = facility.get(field)
+        if field in ('lat', 'lng'):
+            value = round(float(value), 6)
+        row.append('' if value is None else value)
+    return row
+
+
+def write_file(path, payload, compress=True):
+    """파일 저장 (+ .gz/.br 사전 압축), 내용이 같은 파일이 이미 있으면 건너뜀"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    written = [path]
+    # 내용 해시 파일명이라 다음 실행에서 다시 쓰면 되므로 파일마다 fsync하지 않음 (수만 개 파일에서 수 배 느려짐)
+    if not os.path.exists(path):
+        write_bytes_atomic(path, payload, fsync=False)
+
+    if compress:
+        variants = [('.gz', lambda data: gzip.compress(data, compresslevel=9, mtime=0))]
+        if brotli is not None:
+            variants.append(('.br', lambda data: brotli.compress(data, quality=11)))
+        for suffix, compressor in variants:
+            if not os.path.exists(path + suffix):
+                write_bytes_atomic(path + suffix, compressor(payload), fsync=False)
+            written.append(path + suffix)
+    return written
+
+
+class ShardExporter:
+    def __init__(self, output_dir=DEFAULT_SHARD_DIR, zoom=SHARD_ZOOM, compress=True, clusterer=None, versions=None):
+        self.output_dir = output_dir
+        self.zoom = zoom
+        self.compress = compress
+        self.clusterer = clusterer or MarkerClusterer()
+        self.versions = versions or DatasetStore(os.path.join(output_dir, 'versions'))
+
+    def group_tiles(self, facilities):
+        """시설 → {(x, y): [행, ...]}"""
+        tiles = {}
+        for facility in facilities:
+            key = lat_lng_to_tile(float(facility['lat']), float(facility['lng']), self.zoom)
+            tiles.setdefault(key, []).append(shard_row(facility))
+        return tiles
+
+    def export_country(self, country, facilities):
+        """국가 하나의 샤드 + 국가 매니페스트 작성 → (매니페스트 파일명, 요약, 작성한 파일 목록)"""
+        table = facilities if isinstance(facilities, FacilityTable) else FacilityTable.from_facilities(facilities)
+        type_counts = table.type_counts()
+        tiles = self.group_tiles(table)
+        country_dir = os.path.join(self.output_dir, country)
+        written = []
+        tile_entries = {}
+        total = 0
+
+        for (x, y), rows in sorted(tiles.items()):
+            rows.sort(key=lambda row: (row[4], row[0], row[1], row[2]))
+            payload = encode_json({'fields': SHARD_FIELDS, 'rows': rows})
+            filename = f"{self.zoom}/{x}/{y}.{content_hash(payload)}.json"
+            written += write_file(os.path.join(country_dir, filename), payload, self.compress)
+            tile_entries[f"{self.zoom}/{x}/{y}"] = {'file': filename, 'count': len(rows), 'bytes': len(payload)}
+            total += len(rows)
+
+        clusters, cluster_files = self.export_clusters(country_dir, table)
+        written += cluster_files
+        search, search_files = self.export_search(country_dir, table)
+        written += search_files
+        # 수집기에서 이미 기록한 데이터면 같은 해시라 새 버전을 만들지 않음
+        version, _ = self.versions.commit(country, table, source='export')
+        version = {'number': version['version'], 'hash': version['hash'], 'index': f"versions/{country}/index.json"}
+
+        # 타입별 개수를 미리 넣어 두어 클라이언트가 필터 버튼 개수를 세려고 데이터를 다시 훑지 않게 함
+        manifest = encode_json({
+            'country': country,
+            'zoom': self.zoom,
+            'count': total,
+            'type_counts': type_counts,
+            'tiles': tile_entries,
+            'clusters': clusters,
+            'search': search,
+            'version': version
+        })
+        manifest_name = f"manifest.{content_hash(manifest)}.json"
+        written += write_file(os.path.join(country_dir, manifest_name), manifest, self.compress)
+
+        self.remove_stale(country_dir, written)
+        summary = {'count': total, 'tiles': len(tile_entries), 'type_counts': type_counts, 'version': version}
+        return manifest_name, summary, written
+
+    def export_clusters(self, country_dir, table):
+        """타입 필터별 / 줌별 클러스터 타일 작성 → (매니페스트 항목, 작성한 파일 목록)"""
+        clusterer = self.clusterer
+        written = []
+        filters = {}
+
+        for name in sorted(table.type_counts()):
+            # 타입별 시설은 비트맵으로 바로 꺼냄 (타입마다 전체를 다시 훑지 않음)
+            members = list(table) if name == 'all' else table.rows(types=name)
+            entries = {}
+            for key, rows in sorted(cluster_tiles(clusterer.build(members), self.zoom).items()):
+                rows.sort(key=lambda row: (-row[2], row[6], row[0], row[1]))
+                payload = encode_json({'fields': CLUSTER_FIELDS, 'rows': rows})
+                filename = f"clusters/{name}/{key}.{content_hash(payload)}.json"
+                written += write_file(os.path.join(country_dir, filename), payload, self.compress)
+                entries[key] = filename
+            filters[name] = {'count': len(members), 'tiles': entries}
+
+        clusters = {
+            'min_zoom': clusterer.min_zoom,
+            'max_zoom': clusterer.max_zoom,
+            'tile_zoom': self.zoom,
+            'filters': filters
+        }
+        return clusters, written
+
+    def export_search(self, country_dir, table):
+        """이름 검색 샤드 작성 (토큰 앞 글자별) → (매니페스트 항목, 작성한 파일 목록)"""
+        index = FacilitySearchIndex(table, prepare=False)
+        written = []
+        shards = {}
+        for key, shard in sorted(index.shards(SEARCH_PREFIX_LEN).items()):
+            payload = encode_json(shard)
+            filename = f"search/{shard_filename(key)}.{content_hash(payload)}.json"
+            written += write_file(os.path.join(country_dir, filename), payload, self.compress)
+            shards[key] = filename
+        return {'prefix_len': SEARCH_PREFIX_LEN, 'shards': shards}, written
+
+    def remove_stale(self, country_dir, keep):
+        """이번 내보내기에 포함되지 않은 이전 샤드(해시가 바뀐 파일) 삭제"""
+        keep = {os.path.normpath(path) for path in keep}
+        for path in glob.glob(os.path.join(country_dir, '**', '*.json*'), recursive=True):
+            if os.path.normpath(path) not in keep:
+                os.remove(path)
+
+    def write_root_manifest(self, countries):
+        """국가별 매니페스트 위치를 모은 루트 매니페스트 (기존 항목은 유지하고 갱신)"""
+        path = os.path.join(self.output_dir, 'manifest.json')
+        root = {'countries': {}}
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                root = json.load(f)
+
+        # 음역 규칙은 검색할 때만 받도록 별도 파일로 (루트 매니페스트는 매번 받으므로 작게 유지)
+        fold = encode_json(fold_spec())
+        fold_name = f"search/fold.{content_hash(fold)}.json"
+        write_file(os.path.join(self.output_dir, fold_name), fold, self.compress)
+
+        root['zoom'] = self.zoom
+        root['search_fold'] = fold_name
+        root['generated'] = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+        root['countries'].update(countries)
+
+        write_bytes_atomic(path, encode_json(root))
+        return root
+
+    def export(self, sources):
+        """{국가 코드: 시설 이터러블} → 루트 매니페스트"""
+        countries = {}
+        for country, facilities in sources.items():
+            start = time.time()
+            manifest_name, summary, _ = self.export_country(country, facilities)
+            countries[country] = dict(summary, manifest=f"{country}/{manifest_name}")
+            print(f"🧩 {country}: {summary['count']}개 시설 → 타일 {summary['tiles']}개, "
+                  f"데이터 v{summary['version']['number']} ({time.time() - start:.1f}초)")
+        return self.write_root_manifest(countries)
+
+
+def find_country_files(data_dir='data'):
+    """수집기 출력 파일 → {국가 코드: 경로} (.fcol 우선, 없으면 .csv)"""
+    files = {}
+    for path in sorted(glob.glob(os.path.join(data_dir, '*_facilities.csv'))) + \
+            sorted(glob.glob(os.path.join(data_dir, '*_facilities.fcol'))):
+        country = os.path.basename(path).rsplit('_facilities.', 1)[0]
+        files[country] = path
+    return files
+
+
+if __name__ == "__main__":
+    # python export_shards.py                  → data/*_facilities.fcol 전체
+    # python export_shards.py bangladesh india → 지정한 국가만
+    files = find_country_files()
+    countries = sys.argv[1:] or sorted(files)
+    missing = [country for country in countries if country not in files]
+    if missing:
+        print(f"⚠️ 수집 데이터 없음: {', '.join(missing)}")
+
+    exporter = ShardExporter()
+    exporter.export({country: iter_facility_file(files[country]) for country in countries if country in files})
+    print(f"✅ 샤드 내보내기 완료: {exporter.output_dir}")
@@ -0,0 +1,329 @@
+"""
+로컬 조회 API (asyncio HTTP 서버, 외부 서비스 없음)
+
+수집기 출력 파일(data/*_facilities.fcol/.csv)을 시작할 때 한 번 읽어 공간 인덱스(facility_index.py)와
+이름 검색 인덱스(facility_search.py)로 올려두고, 브라우저가 Firestore 컬렉션 전체를 받는 대신
+필요한 범위만 조회하게 한다. 국가 정보는 GlobalDengueSystem / country_registry 공용.
+
+엔드포인트 (GET/HEAD, JSON):
+    /health
+    /countries                                   → 국가 정보 + 국가별 시설 수
+    /types                                       → 시설 타입 설명 + 타입별 개수
+    /facilities?bbox=west,south,east,north       → bbox 안 시설 (type=, country=, limit=, cursor=)
+    /facilities?country=bangladesh               → bbox가 없으면 국가 bbox
+    /nearest?lat=23.81&lng=90.41&k=5             → 가까운 순 (type=, max_km=)
+    /search?q=dhaka+hospital                     → 이름 검색 (lat=, lng=, type=, country=, limit=)
+
+- 페이지: limit(최대 1000)개씩, 응답의 next를 다음 요청의 cursor로
+- 같은 쿼리의 응답 본문/ETag/gzip 결과는 LRU로 재사용, If-None-Match가 맞으면 304
+- Accept-Encoding: gzip이면 1KB 이상 응답을 gzip으로
+
+사용법:
+    python facility_api.py --port=8080
+    python facility_api.py --synthetic=100000      → 수집 데이터 대신 합성 데이터로 실행 (부하 테스트용)
+    python benchmarks/load_test.py --serve --synthetic=100000
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import math
+import os
+import sys
+import time
+from collections import OrderedDict
+from urllib.parse import parse_qs, urlsplit
+
+from country_registry import COUNTRIES
+from export_shards import find_country_files
+from facility_index import DEFAULT_INDEX_PATH, FacilityIndex
+from facility_search import FacilitySearchIndex
+from facility_store import iter_facility_file
+from facility_table import FacilityTable
+from global_dengue_system import GlobalDengueSystem
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8080
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+MAX_NEAREST = 100
+CACHE_ENTRIES = 4096
+GZIP_MIN_BYTES = 1024
+BASE_HEADERS = [('Content-Type', 'application/json; charset=utf-8'), ('Access-Control-Allow-Origin', '*')]
+REASONS = {200: 'OK', 304: 'Not Modified', 400: 'Bad Request', 404: 'Not Found',
+           405: 'Method Not Allowed', 500: 'Internal Server Error'}
+
+
+class ApiError(Exception):
+    """요청 오류 (status 코드와 함께 JSON 오류 응답으로 변환)"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _param(query, name, default=None):
+    values = query.get(name)
+    return values[-1] if values else default
+
+
+def _number(query, name, default=None, kind=float):
+    value = _param(query, name)
+    if value is None:
+        if default is None:
+            raise ApiError(400, f"{name} 파라미터가 필요합니다")
+        return default
+    try:
+        number = kind(value)
+    except ValueError:
+        number = None
+    if number is None or not math.isfinite(number):
+        raise ApiError(400, f"{name} 값이 올바르지 않습니다: {value}")
+    return number
+
+
+def _list(query, name):
+    """type=a,b 또는 type=a&type=b → ['a', 'b'] (없으면 None)"""
+    values = [item for value in query.get(name, []) for item in value.split(',') if item]
+    return values or None
+
+
+def _limit(query, default=DEFAULT_LIMIT, maximum=MAX_LIMIT):
+    return max(1, min(maximum, _number(query, 'limit', default, int)))
+
+
+def encode_body(data):
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+class FacilityApi:
+    """쿼리 처리 + 응답 캐시 (HTTP 연결 처리는 ApiServer)"""
+
+    def __init__(self, facilities, index_path=DEFAULT_INDEX_PATH, cache_entries=CACHE_ENTRIES):
+        facilities = list(facilities)
+        self.system = GlobalDengueSystem()
+        self.table = FacilityTable.from_facilities(facilities)
+        self.index = FacilityIndex.build(facilities, index_path)
+        self.search_index = FacilitySearchIndex(facilities)
+        self.started = time.time()
+        self.requests = 0
+        self.cache_entries = cache_entries
+        self._cache = OrderedDict()     # (경로, 정렬된 쿼리) → (본문, ETag, gzip 본문)
+        self._routes = {
+            '/health': self.health,
+            '/countries': self.countries,
+            '/types': self.types,
+            '/facilities': self.facilities,
+            '/nearest': self.nearest,
+            '/search': self.search,
+        }
+
+    @classmethod
+    def from_files(cls, paths, index_path=DEFAULT_INDEX_PATH):
+        facilities = []
+        for path in paths:
+            facilities.extend(iter_facility_file(path))
+        return cls(facilities, index_path)
+
+    # ---------- 엔드포인트 ----------
+
+    def health(self, query):
+        return {'status': 'ok', 'facilities': len(self.index), 'requests': self.requests,
+                'uptime': round(time.time() - self.started, 1)}
+
+    def countries(self, query):
+        counts = self.table.country_counts()
+        result = {}
+        for code, info in COUNTRIES.items():
+            entry = dict(self.system.get_country_data(code) or {
+                'name': info['name'], 'center': info['center'], 'zoom': info['zoom'],
+                'language': info['languages'], 'currency': info['currency']
+            })
+            entry.update(bbox=info['bbox'], phase1=code in self.system.countries, facilities=counts.get(code, 0))
+            result[code] = entry
+        return {'countries': result}
+
+    def types(self, query):
+        counts = self.table.type_counts()
+        return {
+            'types': {name: {'label': label, 'count': counts.get(name, 0)}
+                      for name, label in self.system.facility_types.items()},
+            'total': counts['all']
+        }
+
+    def facilities(self, query):
+        countries = _list(query, 'country')
+        bbox = _param(query, 'bbox')
+        if bbox:
+            try:
+                west, south, east, north = (float(value) for value in bbox.split(','))
+            except ValueError:
+                raise ApiError(400, "bbox는 west,south,east,north 형식이어야 합니다")
+            if not all(math.isfinite(value) for value in (west, south, east, north)):
+                raise ApiError(400, f"bbox 값이 올바르지 않습니다: {bbox}")
+        elif countries and all(code in COUNTRIES for code in countries):
+            boxes = [COUNTRIES[code]['bbox'] for code in countries]
+            west, south = min(box[0] for box in boxes), min(box[1] for box in boxes)
+            east, north = max(box[2] for box in boxes), max(box[3] for box in boxes)
+        else:
+            raise ApiError(400, "bbox 또는 알려진 country 파라미터가 필요합니다")
+
+        limit = _limit(query)
+        offset = max(0, _number(query, 'cursor', 0, int))
+        # 한 개 더 받아 다음 페이지가 있는지 확인
+        rows = self.index.bbox(west, south, east, north, types=_list(query, 'type'),
+                               limit=limit + 1, countries=countries, offset=offset)
+        return {
+            'items': rows[:limit],
+            'next': str(offset + limit) if len(rows) > limit else None
+        }
+
+    def nearest(self, query):
+        lat, lng = _number(query, 'lat'), _number(query, 'lng')
+        k = max(1, min(MAX_NEAREST, _number(query, 'k', 10, int)))
+        max_km = _param(query, 'max_km')
+        items = self.index.nearest(lat, lng, k, _list(query, 'type'),
+                                   None if max_km is None else _number(query, 'max_km'))
+        return {'items': items}
+
+    def search(self, query):
+        text = _param(query, 'q', '')
+        lat = _number(query, 'lat', None) if 'lat' in query else None
+        lng = _number(query, 'lng', None) if 'lng' in query else None
+        items = self.search_index.search(text, lat, lng, limit=_limit(query, 20, MAX_NEAREST),
+                                         types=_list(query, 'type'), countries=_list(query, 'country'))
+        return {'items': items}
+
+    # ---------- HTTP 응답 ----------
+
+    def _cached(self, path, query):
+        """(본문, ETag, gzip 본문) — 같은 쿼리는 캐시에서 (파라미터 순서는 무시)"""
+        key = (path, tuple(sorted((name, tuple(values)) for name, values in query.items())))
+        entry = self._cache.get(key)
+        if entry is not None:
+            self._cache.move_to_end(key)
+            return entry
+
+        body = encode_body(self._routes[path](query))
+        etag = f'"{hashlib.sha1(body).hexdigest()[:20]}"'
+        compressed = gzip.compress(body, compresslevel=6, mtime=0) if len(body) >= GZIP_MIN_BYTES else None
+        entry = (body, etag, compressed)
+        # 상태 확인 응답은 매번 새로 계산
+        if path != '/health':
+            self._cache[key] = entry
+            if len(self._cache) > self.cache_entries:
+                self._cache.popitem(last=False)
+        return entry
+
+    def error_response(self, status, message):
+        """오류 → (상태 코드, 응답 헤더 목록, JSON 오류 본문)"""
+        return status, list(BASE_HEADERS), encode_body({'error': message})
+
+    def respond(self, method, target, headers):
+        """요청 → (상태 코드, 응답 헤더 목록, 본문)"""
+        self.requests += 1
+        response_headers = list(BASE_HEADERS)
+        try:
+            if method not in ('GET', 'HEAD'):
+                raise ApiError(405, f"{method} 메서드는 지원하지 않습니다")
+            parts = urlsplit(target)
+            if parts.path not in self._routes:
+                raise ApiError(404, f"알 수 없는 경로: {parts.path}")
+            body, etag, compressed = self._cached(parts.path, parse_qs(parts.query))
+        except ApiError as e:
+            return self.error_response(e.status, str(e))
+        except Exception as e:
+            print(f"❌ {target}: {e!r}")
+            return self.error_response(500, 'internal error')
+
+        response_headers += [('ETag', etag), ('Cache-Control', 'public, max-age=60'), ('Vary', 'Accept-Encoding')]
+        if etag in [value.strip() for value in headers.get('if-none-match', '').split(',')]:
+            return 304, response_headers, b''
+        if compressed is not None and 'gzip' in headers.get('accept-encoding', ''):
+            response_headers.append(('Content-Encoding', 'gzip'))
+            body = compressed
+        return 200, response_headers, body
+
+
+class ApiServer:
+    """HTTP/1.1 keep-alive 연결 처리 (요청 본문은 읽고 버림)"""
+
+    def __init__(self, api, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        self.api = api
+        self.host = host
+        self.port = port
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+
+                lines = head.decode('latin-1').split('\r\n')
+                try:
+                    method, target, version = lines[0].split(' ', 2)
+                except ValueError:
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    name, sep, value = line.partition(':')
+                    if sep:
+                        headers[name.strip().lower()] = value.strip()
+                length = headers.get('content-length') or '0'
+                if length.isascii() and length.isdigit():
+                    if int(length):
+                        await reader.readexactly(int(length))
+                    status, response_headers, body = self.api.respond(method, target, headers)
+                    connection = headers.get('connection', '').lower()
+                    keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+                else:
+                    # 본문 길이를 모르면 다음 요청이 어디서 시작하는지도 모름 → 400 응답 후 연결 종료
+                    status, response_headers, body = self.api.error_response(
+                        400, f"Content-Length 값이 올바르지 않습니다: {length}")
+                    keep_alive = False
+
+                response = [f"HTTP/1.1 {status} {REASONS.get(status, '')}"]
+                response += [f"{name}: {value}" for name, value in response_headers]
+                response.append(f"Content-Length: {len(body)}")
+                response.append(f"Connection: {'keep-alive' if keep_alive else 'close'}")
+                writer.write(('\r\n'.join(response) + '\r\n\r\n').encode('latin-1'))
+                if method != 'HEAD':
+                    writer.write(body)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            # 본문을 다 보내기 전에 끊긴 연결
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self):
+        server = await asyncio.start_server(self.handle_connection, self.host, self.port, backlog=1024)
+        print(f"🌐 http://{self.host}:{self.port} (시설 {len(self.api.index)}개)", flush=True)
+        async with server:
+            await server.serve_forever()
+
+
+if __name__ == "__main__":
+    options = dict(arg[2:].partition('=')[::2] for arg in sys.argv[1:] if arg.startswith('--'))
+
+    if options.get('synthetic'):
+        from dengue_only_data import SyntheticFacilityGenerator
+        facilities = SyntheticFacilityGenerator(seed=0).facilities(int(options['synthetic']))
+        api = FacilityApi(facilities, index_path=os.path.join('data', 'processed', 'api_synthetic_index.fcol'))
+    else:
+        files = find_country_files()
+        if not files:
+            print("⚠️ data/*_facilities.fcol 파일이 없습니다 (먼저 osm_data_collector.py 실행 또는 --synthetic=N)")
+            sys.exit(1)
+        api = FacilityApi.from_files(files.values())
+
+    server = ApiServer(api, options.get('host') or DEFAULT_HOST, int(options.get('port') or DEFAULT_PORT))
+    try:
+        asyncio.run(server.serve())
+    except KeyboardInterrupt:
+        print("👋 서버 종료")
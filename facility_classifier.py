@@ -0,0 +1,367 @@
+"""
+뎅기열(및 기타 모기 매개 질병) 시설 분류기
+언어별 키워드 표를 하나의 정규식(키워드 trie)으로 컴파일해 태그 텍스트를 한 번만 훑어 분류
+
+- FacilityClassifier: 뎅기열 키워드 표 하나 → 시설 타입
+- MultiDiseaseClassifier: 질병별 키워드 표를 모두 합친 정규식 하나 → {질병: 시설 타입}
+  (질병을 늘려도 Overpass 쿼리와 텍스트 스캔은 한 번)
+"""
+
+import bisect
+import re
+import unicodedata
+
+# 기존 OSMDengueCollector.determine_facility_type의 영어 키워드 (순서 = 우선순위)
+DENGUE_KEYWORDS = [
+    'dengue', 'aedes', 'mosquito', 'fever clinic',
+    'vaccination center', 'immunization',
+    'blood test', 'diagnostic lab', 'rapid test',
+    'free medicine', 'free clinic dengue', 'prevention center'
+]
+
+
+def categorize_keyword(keyword):
+    """기존 분기 규칙: 키워드 문자열로 시설 타입 결정"""
+    if 'vaccin' in keyword or 'immuniz' in keyword:
+        return 'vaccine'
+    elif 'blood' in keyword or 'test' in keyword or 'lab' in keyword:
+        return 'blood_test'
+    elif 'free' in keyword or 'medicine' in keyword:
+        return 'aid'
+    else:
+        return 'dengue_center'
+
+
+# 언어별 키워드 표: (키워드, 시설 타입) 목록, 앞에 있을수록 우선
+KEYWORD_TABLES = {
+    'en': [(keyword, categorize_keyword(keyword)) for keyword in DENGUE_KEYWORDS],
+    'bn': [
+        ('ডেঙ্গু', 'dengue_center'), ('এডিস', 'dengue_center'), ('মশা', 'dengue_center'),
+        ('জ্বর ক্লিনিক', 'dengue_center'), ('টিকাদান কেন্দ্র', 'vaccine'), ('টিকাদান', 'vaccine'),
+        ('রক্ত পরীক্ষা', 'blood_test'), ('ডায়াগনস্টিক', 'blood_test'),
+        ('বিনামূল্যে ওষুধ', 'aid'), ('প্রতিরোধ কেন্দ্র', 'dengue_center')
+    ],
+    'hi': [
+        ('डेंगू', 'dengue_center'), ('मच्छर', 'dengue_center'), ('बुखार क्लिनिक', 'dengue_center'),
+        ('टीकाकरण', 'vaccine'), ('रक्त जांच', 'blood_test'), ('खून की जांच', 'blood_test'),
+        ('पैथोलॉजी', 'blood_test'), ('मुफ्त दवा', 'aid'), ('रोकथाम केंद्र', 'dengue_center')
+    ],
+    'ur': [
+        ('ڈینگی', 'dengue_center'), ('مچھر', 'dengue_center'), ('ویکسینیشن', 'vaccine'),
+        ('خون کا ٹیسٹ', 'blood_test'), ('مفت دوا', 'aid')
+    ],
+    'th': [
+        ('ไข้เลือดออก', 'dengue_center'), ('ยุงลาย', 'dengue_center'), ('ฉีดวัคซีน', 'vaccine'),
+        ('ตรวจเลือด', 'blood_test'), ('ห้องปฏิบัติการ', 'blood_test'), ('ยาฟรี', 'aid')
+    ],
+    'vi': [
+        ('sốt xuất huyết', 'dengue_center'), ('muỗi vằn', 'dengue_center'), ('tiêm chủng', 'vaccine'),
+        ('xét nghiệm máu', 'blood_test'), ('xét nghiệm nhanh', 'blood_test'),
+        ('thuốc miễn phí', 'aid'), ('y tế dự phòng', 'dengue_center')
+    ],
+    'id': [
+        ('demam berdarah', 'dengue_center'), ('nyamuk', 'dengue_center'), ('vaksinasi', 'vaccine'),
+        ('imunisasi', 'vaccine'), ('tes darah', 'blood_test'), ('laboratorium klinik', 'blood_test'),
+        ('obat gratis', 'aid')
+    ],
+    'ms': [
+        ('denggi', 'dengue_center'), ('vaksinasi', 'vaccine'), ('imunisasi', 'vaccine'),
+        ('ujian darah', 'blood_test'), ('ubat percuma', 'aid')
+    ],
+    'tl': [
+        ('pagbabakuna', 'vaccine'), ('bakuna', 'vaccine'), ('pagsusuri ng dugo', 'blood_test'),
+        ('libreng gamot', 'aid'), ('libreng klinika', 'aid')
+    ],
+    'pt': [
+        ('vacinação', 'vaccine'), ('imunização', 'vaccine'), ('exame de sangue', 'blood_test'),
+        ('laboratório de análises', 'blood_test'), ('teste rápido', 'blood_test'),
+        ('remédio grátis', 'aid'), ('medicamento gratuito', 'aid'), ('centro de prevenção', 'dengue_center')
+    ],
+    'es': [
+        ('vacunación', 'vaccine'), ('inmunización', 'vaccine'), ('análisis de sangre', 'blood_test'),
+        ('laboratorio de diagnóstico', 'blood_test'), ('prueba rápida', 'blood_test'),
+        ('medicamentos gratis', 'aid'), ('clínica de fiebre', 'dengue_center'),
+        ('centro de prevención', 'dengue_center')
+    ],
+    'sw': [
+        ('homa ya dengi', 'dengue_center'), ('chanjo', 'vaccine'), ('kupima damu', 'blood_test'),
+        ('maabara ya uchunguzi', 'blood_test'), ('dawa bure', 'aid')
+    ],
+    'km': [
+        ('គ្រុនឈាម', 'dengue_center'), ('ចាក់ថ្នាំបង្ការ', 'vaccine'), ('ពិនិត្យឈាម', 'blood_test')
+    ],
+    'lo': [
+        ('ໄຂ້ເລືອດອອກ', 'dengue_center'), ('ສັກຢາກັນພະຍາດ', 'vaccine'), ('ກວດເລືອດ', 'blood_test')
+    ],
+    'my': [
+        ('သွေးလွန်တုပ်ကွေး', 'dengue_center'), ('ကာကွယ်ဆေး', 'vaccine'), ('သွေးစစ်', 'blood_test')
+    ],
+    'si': [
+        ('ඩෙංගු', 'dengue_center'), ('එන්නත්', 'vaccine'), ('රුධිර පරීක්ෂණ', 'blood_test')
+    ],
+    'zh': [
+        ('登革热', 'dengue_center'), ('骨痛热症', 'dengue_center'), ('疫苗接种', 'vaccine'),
+        ('免疫接种', 'vaccine'), ('验血', 'blood_test'), ('化验室', 'blood_test'), ('免费药', 'aid')
+    ],
+    'ko': [
+        ('뎅기열', 'dengue_center'), ('예방접종', 'vaccine'), ('혈액검사', 'blood_test')
+    ]
+}
+
+
+# 뎅기열 외 질병별 키워드 표 (형식은 KEYWORD_TABLES와 같음, 앞에 있을수록 우선)
+MALARIA_KEYWORD_TABLES = {
+    'en': [
+        ('malaria vaccine', 'vaccine'), ('malaria test', 'blood_test'), ('rapid diagnostic test', 'blood_test'),
+        ('antimalarial', 'aid'), ('mosquito net', 'aid'), ('bed net', 'aid'), ('malaria', 'malaria_center')
+    ],
+    'fr': [('paludisme', 'malaria_center')],
+    'pt': [('malária', 'malaria_center')],
+    'hi': [('मलेरिया', 'malaria_center')],
+    'bn': [('ম্যালেরিয়া', 'malaria_center')],
+    'th': [('มาลาเรีย', 'malaria_center')],
+    'vi': [('sốt rét', 'malaria_center')],
+    'sw': [('chandarua', 'aid')]
+}
+
+ZIKA_KEYWORD_TABLES = {
+    'en': [('zika test', 'blood_test'), ('zika', 'zika_center'), ('microcephaly', 'zika_center')],
+    'pt': [('microcefalia', 'zika_center')],
+    'es': [('microcefalia', 'zika_center')]
+}
+
+CHIKUNGUNYA_KEYWORD_TABLES = {
+    'en': [('chikungunya test', 'blood_test'), ('chikungunya', 'chikungunya_center')],
+    'hi': [('चिकनगुनिया', 'chikungunya_center')],
+    'bn': [('চিকুনগুনিয়া', 'chikungunya_center')],
+    'th': [('ชิคุนกุนยา', 'chikungunya_center')]
+}
+
+# 질병 → 언어별 키워드 표
+DISEASE_KEYWORD_TABLES = {
+    'dengue': KEYWORD_TABLES,
+    'malaria': MALARIA_KEYWORD_TABLES,
+    'zika': ZIKA_KEYWORD_TABLES,
+    'chikungunya': CHIKUNGUNYA_KEYWORD_TABLES
+}
+DISEASES = list(DISEASE_KEYWORD_TABLES)
+
+
+def normalize_text(text):
+    """소문자화 + (비ASCII만) NFC 정규화 — ASCII 텍스트는 기존 .lower()와 완전히 동일"""
+    text = text.lower()
+    if not text.isascii():
+        text = unicodedata.normalize('NFC', text)
+    return text
+
+
+def keyword_entries(tables, languages=None):
+    """언어 순서대로 (키워드, 타입) 목록을 합침 (중복 키워드는 먼저 나온 것 우선)"""
+    languages = languages or list(tables.keys())
+    entries = []
+    seen = set()
+
+    for lang in languages:
+        for keyword, category in tables.get(lang, []):
+            keyword = normalize_text(keyword)
+            if keyword not in seen:
+                seen.add(keyword)
+                entries.append((keyword, category))
+
+    return entries
+
+
+def compile_keyword_trie(keywords):
+    """키워드 목록 → (정규식, 그룹 번호별 키워드 번호, 키워드별 '자기 접두사인 키워드 번호' 목록)
+
+    매치된 그룹(match.lastindex)은 그 위치에서 시작하는 가장 긴 키워드를 가리키고,
+    같은 위치에서 시작하는 더 짧은 키워드는 모두 그 키워드의 접두사다.
+    """
+    # 키워드 trie 구성 (None 키 = 해당 위치에서 끝나는 키워드 번호)
+    trie = {}
+    for index, keyword in enumerate(keywords):
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[None] = index
+
+    prefixes = []
+    for keyword in keywords:
+        node, found = trie, []
+        for char in keyword:
+            node = node[char]
+            if None in node:
+                found.append(node[None])
+        prefixes.append(found)
+
+    # 빈 그룹 ()을 키워드 종료 표시로 사용 → match.lastindex로 어떤 키워드인지 식별
+    group_keywords = [None]
+
+    def emit(node):
+        branches = []
+        for char in sorted(key for key in node if key is not None):
+            branches.append(re.escape(char) + emit(node[char]))
+        if None in node:
+            # 더 긴 키워드를 먼저 시도하고, 실패하면 여기서 끝나는 키워드로 매치
+            group_keywords.append(node[None])
+            branches.append('()')
+        if len(branches) == 1:
+            return branches[0]
+        return '(?:' + '|'.join(branches) + ')'
+
+    # lookahead 없이 컴파일해야 re의 첫 글자 집합 스캔 최적화가 적용됨
+    # (겹치는 매치는 검색 시 매치 시작 위치 + 1부터 다시 찾는 방식으로 처리)
+    body = emit(trie) if trie else '(?!)'
+    return re.compile(body), group_keywords, prefixes
+
+
+class FacilityClassifier:
+    """키워드 표 → 단일 정규식 분류기
+
+    기존 로직(키워드 목록을 순서대로 `in` 검사해 첫 번째로 포함된 키워드의 타입)과 같은 결과를
+    텍스트 한 번 스캔으로 계산한다.
+    """
+
+    def __init__(self, languages=None, tables=None):
+        entries = keyword_entries(tables or KEYWORD_TABLES, languages)
+        self.keywords = [keyword for keyword, _ in entries]
+        self.categories = [category for _, category in entries]
+        self.pattern, self._group_priority = self._compile(self.keywords)
+
+    def _compile(self, keywords):
+        pattern, group_keywords, prefixes = compile_keyword_trie(keywords)
+        # 한 위치에서 시작하는 키워드들은 모두 '가장 긴 매치'의 접두사이므로,
+        # 각 키워드에 대해 "자기 접두사인 키워드 중 최고 우선순위"를 그룹 번호에 대응
+        return pattern, [None] + [min(prefixes[index]) for index in group_keywords[1:]]
+
+    def classify_text(self, text):
+        """정규화된 텍스트 → 시설 타입 (해당 없으면 None)"""
+        best = None
+        group_priority = self._group_priority
+        search = self.pattern.search
+
+        match = search(text)
+        while match:
+            priority = group_priority[match.lastindex]
+            if best is None or priority < best:
+                best = priority
+                if best == 0:
+                    break
+            match = search(text, match.start() + 1)
+
+        return None if best is None else self.categories[best]
+
+    def tags_text(self, tags):
+        """determine_facility_type과 같은 방식으로 검사할 텍스트 구성"""
+        return normalize_text(f"{tags.get('name', '')} {tags.get('description', '')} {tags.get('healthcare', '')}")
+
+    def classify(self, tags):
+        """OSM 태그 dict → 시설 타입 (해당 없으면 None)"""
+        return self.classify_text(self.tags_text(tags))
+
+    def classify_many(self, tag_dicts, chunk_size=20000):
+        """태그 dict 이터러블을 일괄 분류해 타입 목록 반환
+
+        chunk 단위로 텍스트를 줄바꿈으로 이어 붙여 정규식 한 번으로 스캔한다.
+        (키워드에는 줄바꿈이 없으므로 레코드 경계를 넘는 매치는 생기지 않음)
+        """
+        results = []
+        chunk = []
+
+        for tags in tag_dicts:
+            chunk.append(self.tags_text(tags))
+            if len(chunk) >= chunk_size:
+                results.extend(self._classify_chunk(chunk))
+                chunk = []
+        if chunk:
+            results.extend(self._classify_chunk(chunk))
+
+        return results
+
+    def _classify_chunk(self, texts):
+        starts = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + 1
+
+        best = [None] * len(texts)
+        group_priority = self._group_priority
+
+        joined = '\n'.join(texts)
+        search = self.pattern.search
+
+        match = search(joined)
+        while match:
+            start = match.start()
+            record = bisect.bisect_right(starts, start) - 1
+            priority = group_priority[match.lastindex]
+            current = best[record]
+            if current is None or priority < current:
+                best[record] = priority
+            match = search(joined, start + 1)
+
+        categories = self.categories
+        return [None if priority is None else categories[priority] for priority in best]
+
+
+class MultiDiseaseClassifier:
+    """질병별 키워드 표 → 모든 키워드를 합친 단일 정규식 분류기
+
+    텍스트를 한 번 훑으면서 매치된 키워드마다 질병별 우선순위를 갱신하므로
+    질병 수가 늘어도 스캔 횟수는 그대로이고, 각 질병의 결과는 FacilityClassifier를 따로 돌린 것과 같다.
+    """
+
+    def __init__(self, diseases=None, languages=None, rules=None):
+        rules = rules or DISEASE_KEYWORD_TABLES
+        self.diseases = list(diseases or rules)
+        self.categories = []     # 질병별 [키워드 우선순위 → 타입]
+        ranks = {}               # 키워드 → [질병별 우선순위 (없으면 None)]
+
+        for slot, disease in enumerate(self.diseases):
+            entries = keyword_entries(rules[disease], languages)
+            self.categories.append([category for _, category in entries])
+            for priority, (keyword, _) in enumerate(entries):
+                ranks.setdefault(keyword, [None] * len(self.diseases))[slot] = priority
+
+        # 여러 질병에 같은 키워드가 있어도 쿼리/정규식에는 한 번만
+        self.keywords = list(ranks)
+        self.pattern, group_keywords, prefixes = compile_keyword_trie(self.keywords)
+
+        # 그룹 번호 → 질병별 "매치된 키워드의 접두사 중 최고 우선순위"
+        self._group_ranks = [None]
+        for index in group_keywords[1:]:
+            best = []
+            for slot in range(len(self.diseases)):
+                found = [ranks[self.keywords[prefix]][slot] for prefix in prefixes[index]]
+                found = [rank for rank in found if rank is not None]
+                best.append(min(found) if found else None)
+            self._group_ranks.append(tuple(best))
+
+    def classify_text(self, text):
+        """정규화된 텍스트 → {질병: 시설 타입} (해당 질병만)"""
+        best = [None] * len(self.diseases)
+        group_ranks = self._group_ranks
+        search = self.pattern.search
+
+        match = search(text)
+        while match:
+            for slot, rank in enumerate(group_ranks[match.lastindex]):
+                if rank is not None and (best[slot] is None or rank < best[slot]):
+                    best[slot] = rank
+            match = search(text, match.start() + 1)
+
+        return {
+            disease: self.categories[slot][rank]
+            for slot, (disease, rank) in enumerate(zip(self.diseases, best)) if rank is not None
+        }
+
+    def tags_text(self, tags):
+        return normalize_text(f"{tags.get('name', '')} {tags.get('description', '')} {tags.get('healthcare', '')}")
+
+    def classify(self, tags):
+        """OSM 태그 dict → {질병: 시설 타입} (관련 없으면 빈 dict)"""
+        return self.classify_text(self.tags_text(tags))
+
+    def classify_many(self, tag_dicts):
+        return [self.classify(tags) for tags in tag_dicts]
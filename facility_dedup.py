@@ -0,0 +1,213 @@
+"""
+중복 시설 제거 (업로드 전 전체 데이터 대상)
+
+같은 병원이 겹치는 타일/국가 bbox, OSM node와 way, 사용자 제보(user_reports),
+dengue_only_data.py의 합성 데이터 등으로 여러 번 들어오는 경우를 하나로 합친다.
+
+1. 공간 해시(격자)로 N미터 이내 후보 쌍만 뽑음 → O(n²) 비교 없이 거의 선형
+2. 정규화한 이름이 충분히 비슷하면 같은 시설로 확정 (이름 없는 시설은 더 가까운 거리만 허용)
+3. union-find로 묶은 뒤 대표 레코드 하나로 병합, 원본 레코드는 sources에 보존
+"""
+
+import csv
+import glob
+import json
+import math
+import re
+import sys
+import unicodedata
+from difflib import SequenceMatcher
+
+from atomic_io import atomic_open
+from country_registry import CountryLocator
+from facility_index import KM_PER_DEGREE, haversine_km
+from facility_store import FACILITY_COLUMNS, FacilityStoreWriter, iter_facility_file
+
+# 대표 레코드 선택 우선순위 (작을수록 우선)
+SOURCE_PRIORITY = {'osm': 0, 'user_report': 1, 'synthetic': 2}
+UNNAMED = {'', 'unknown facility'}
+_NON_WORD = re.compile(r'[\W_]+', re.UNICODE)
+
+
+def normalize_name(name):
+    """비교용 이름 정규화: NFKC + 소문자 + 결합 부호 제거 + 구두점/공백 정리"""
+    text = unicodedata.normalize('NFKD', unicodedata.normalize('NFKC', name or '').casefold())
+    text = ''.join(char for char in text if not unicodedata.combining(char))
+    return _NON_WORD.sub(' ', text).strip()
+
+
+def name_similarity(a, b):
+    """정규화된 두 이름의 유사도 (0~1): 문자열 유사도와 토큰 집합 자카드 중 큰 값"""
+    if a == b:
+        return 1.0
+    tokens_a, tokens_b = set(a.split()), set(b.split())
+    # 'Clinic 1'과 'Clinic 2'처럼 번호만 다른 이름은 다른 시설
+    if {t for t in tokens_a if t.isdigit()} != {t for t in tokens_b if t.isdigit()}:
+        return 0.0
+    jaccard = len(tokens_a & tokens_b) / len(tokens_a | tokens_b) if tokens_a and tokens_b else 0.0
+    return max(jaccard, SequenceMatcher(None, a, b).ratio())
+
+
+class _UnionFind:
+    def __init__(self, size):
+        self.parent = list(range(size))
+
+    def find(self, i):
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(self, a, b):
+        ra, rb = self.find(a), self.find(b)
+        if ra != rb:
+            self.parent[max(ra, rb)] = min(ra, rb)
+
+
+class FacilityDeduplicator:
+    def __init__(self, max_distance_m=75, unnamed_distance_m=15, min_similarity=0.8):
+        self.max_distance_m = max_distance_m            # 이름이 비슷할 때 같은 시설로 볼 거리
+        self.unnamed_distance_m = unnamed_distance_m    # 이름이 없을 때 같은 시설로 볼 거리
+        self.min_similarity = min_similarity
+        self.stats = {}
+
+    def is_duplicate(self, a, b, distance_m):
+        """거리 후보 쌍이 실제로 같은 시설인지 이름으로 확정"""
+        if a['_norm'] in UNNAMED or b['_norm'] in UNNAMED:
+            return distance_m <= self.unnamed_distance_m
+        return name_similarity(a['_norm'], b['_norm']) >= self.min_similarity
+
+    def candidate_pairs(self, records):
+        """격자 해시로 max_distance_m 이내인 (i, j, 거리m) 후보 쌍 생성 (i < j)
+
+        경도 칸 번호는 격자 너비로 나눈 나머지 → ±180° 양쪽(피지, 키리바시)의 시설도 이웃 칸으로 비교
+        """
+        cell = self.max_distance_m / 1000 / KM_PER_DEGREE
+        width = math.ceil(360 / cell)
+        grid = {}
+        for i, record in enumerate(records):
+            key = (math.floor(record['lat'] / cell), math.floor((record['lng'] + 180) / cell) % width)
+            grid.setdefault(key, []).append(i)
+
+        for (cy, cx), members in grid.items():
+            # 고위도에서는 경도 1칸이 짧으므로 경도 방향으로 더 넓게 확인
+            # 위아래 칸까지 포함한 띠의 극 쪽 끝 위도 기준 → 위도가 다른 두 시설 어느 쪽에서 찾아도 같은 범위
+            edge = min(89.0, max(abs((cy - 1) * cell), abs((cy + 2) * cell)))
+            reach = min(math.ceil(1 / max(0.01, math.cos(math.radians(edge)))), width // 2)
+            neighbours = {(cy + dy, (cx + dx) % width) for dy in (-1, 0, 1) for dx in range(-reach, reach + 1)}
+            for key in neighbours:
+                others = grid.get(key)
+                if not others:
+                    continue
+                for i in members:
+                    a = records[i]
+                    for j in others:
+                        if j <= i:
+                            continue
+                        b = records[j]
+                        distance_m = haversine_km(a['lat'], a['lng'], b['lat'], b['lng']) * 1000
+                        if distance_m <= self.max_distance_m:
+                            yield i, j, distance_m
+
+    def merge_group(self, group):
+        """중복 묶음 → 대표 레코드 (원본은 sources로 보존)"""
+        ranked = sorted(group, key=lambda r: (
+            SOURCE_PRIORITY.get(r.get('source'), 9),
+            r['_norm'] in UNNAMED,
+            -len(r.get('name') or '')
+        ))
+        merged = {key: value for key, value in ranked[0].items() if not key.startswith('_')}
+        merged['sources'] = [
+            {key: value for key, value in record.items() if not key.startswith('_')}
+            for record in ranked
+        ]
+        merged['source_count'] = len(ranked)
+        return merged
+
+    def deduplicate(self, records):
+        """레코드 목록 → 병합된 레코드 목록"""
+        records = [dict(record, _norm=normalize_name(record.get('name'))) for record in records]
+        union = _UnionFind(len(records))
+
+        # 같은 OSM id는 거리와 상관없이 같은 시설 (겹치는 국가 bbox)
+        by_osm_id = {}
+        for i, record in enumerate(records):
+            osm_id = record.get('osm_id')
+            if osm_id:
+                if osm_id in by_osm_id:
+                    union.union(by_osm_id[osm_id], i)
+                else:
+                    by_osm_id[osm_id] = i
+
+        candidates = confirmed = 0
+        for i, j, distance_m in self.candidate_pairs(records):
+            candidates += 1
+            if self.is_duplicate(records[i], records[j], distance_m):
+                union.union(i, j)
+                confirmed += 1
+
+        groups = {}
+        for i, record in enumerate(records):
+            groups.setdefault(union.find(i), []).append(record)
+
+        merged = [self.merge_group(group) for group in groups.values()]
+        self.stats = {
+            'input': len(records),
+            'candidate_pairs': candidates,
+            'confirmed_pairs': confirmed,
+            'output': len(merged)
+        }
+        return merged
+
+
+def load_sources(specs):
+    """'source=경로(glob)' 목록 → source 필드가 붙은 레코드 목록 (country가 없는 레코드는 좌표로 국가 판정)"""
+    records = []
+    locator = None
+    for spec in specs:
+        source, _, pattern = spec.partition('=')
+        for path in sorted(glob.glob(pattern)):
+            if path.endswith('.json'):
+                with open(path, encoding='utf-8') as f:
+                    rows = [row for row in json.load(f) if row.get('lat') is not None and row.get('lng') is not None]
+                for row in rows:
+                    row['lat'], row['lng'] = float(row['lat']), float(row['lng'])
+            else:
+                rows = iter_facility_file(path)
+            for row in rows:
+                row['source'] = source
+                if not row.get('country'):
+                    locator = locator or CountryLocator()
+                    row['country'] = locator.locate(row['lat'], row['lng']) or ''
+                records.append(row)
+    return records
+
+
+def save_deduplicated(facilities, csv_path, store_path=None):
+    """병합 결과를 CSV(+컬럼형)로 저장 (sources는 JSON 문자열)"""
+    fieldnames = [name for name, _ in FACILITY_COLUMNS] + ['source_count', 'sources']
+    rows = [dict(f, sources=json.dumps(f['sources'], ensure_ascii=False)) for f in facilities]
+
+    with atomic_open(csv_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(rows)
+
+    if store_path:
+        store = FacilityStoreWriter(store_path, columns=FACILITY_COLUMNS + [('source_count', 'uint16'), ('sources', 'string')])
+        store.extend(rows)
+        store.close()
+
+
+if __name__ == "__main__":
+    # python facility_dedup.py osm=data/*_facilities.fcol synthetic=dengue_only_data.csv user_report=data/raw/user_reports.json
+    specs = sys.argv[1:] or ['osm=data/*_facilities.fcol']
+    records = load_sources(specs)
+
+    deduplicator = FacilityDeduplicator()
+    merged = deduplicator.deduplicate(records)
+    save_deduplicated(merged, 'data/processed/deduped_facilities.csv', 'data/processed/deduped_facilities.fcol')
+
+    stats = deduplicator.stats
+    print(f"🧹 {stats['input']}개 → {stats['output']}개 (후보 쌍 {stats['candidate_pairs']}, 중복 확정 {stats['confirmed_pairs']})")
@@ -0,0 +1,325 @@
+"""
+시설 공간 인덱스 (위경도 격자)
+"내 주변 가장 가까운 뎅기열 검사소" 같은 k-최근접 / 반경 / bbox 질의를 전체 국가 데이터에서 1ms 이내로 처리
+
+- 시설을 격자 셀 순서로 정렬해 .fcol 파일로 저장 (셀 디렉터리 포함) → 시작 시 재구축 불필요
+- 셀 크기는 데이터 밀도에 맞춰 자동 결정
+"""
+
+import glob
+import heapq
+import math
+import sys
+from bisect import bisect_left
+
+from facility_store import FacilityStore, FacilityStoreWriter, iter_facility_file
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = 111.195
+FACILITY_TYPES = ['vaccine', 'blood_test', 'aid', 'dengue_center']
+DEFAULT_INDEX_PATH = 'data/processed/facility_index.fcol'
+
+
+def haversine_km(lat1, lng1, lat2, lng2):
+    """두 좌표 사이 거리(km)"""
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    dlat = p2 - p1
+    dlng = math.radians(lng2 - lng1)
+    a = math.sin(dlat / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dlng / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def choose_cell_size(points, target_per_cell=24, max_size=2.0, min_size=0.005):
+    """점유 셀당 평균 시설 수가 target 이하가 되도록 셀 크기(도) 결정"""
+    size = max_size
+    while size > min_size:
+        cells = {(math.floor(lat / size), math.floor(lng / size)) for lat, lng in points}
+        if len(points) <= target_per_cell * len(cells):
+            break
+        size /= 2
+    return size
+
+
+class CellGrid:
+    """위경도 격자 셀 탐색 (셀 키 순으로 정렬된 행 배열 + 셀 디렉터리)
+
+    사용하는 쪽에서 cell_size, cols, lat_cells, cell_keys(정렬된 셀 키), cell_starts(셀별 시작 행)를 채운다.
+    """
+
+    def _cell_of(self, lat, lng):
+        iy = min(self.lat_cells - 1, max(0, math.floor((lat + 90) / self.cell_size)))
+        return iy, math.floor((lng + 180) / self.cell_size)
+
+    def _row_ranges(self, iy0, iy1, ix0, ix1):
+        """셀 사각형 [iy0..iy1] x [ix0..ix1] 에 속한 시설 행 구간들 (경도는 ±180° 순환)"""
+        if ix1 - ix0 + 1 >= self.cols:
+            spans = [(0, self.cols - 1)]
+        else:
+            ix0, ix1 = ix0 % self.cols, ix1 % self.cols
+            spans = [(ix0, ix1)] if ix0 <= ix1 else [(ix0, self.cols - 1), (0, ix1)]
+
+        keys, starts = self.cell_keys, self.cell_starts
+        for iy in range(max(0, iy0), min(self.lat_cells - 1, iy1) + 1):
+            base = iy * self.cols
+            for lo, hi in spans:
+                first = bisect_left(keys, base + lo)
+                last = bisect_left(keys, base + hi + 1, first)
+                if first < last:
+                    yield starts[first], starts[last]
+
+    def _ring_ranges(self, cy, cx, inner, half):
+        """중심 셀 ± half 사각형에서 ± inner 사각형을 뺀 테두리의 행 구간들"""
+        if inner < 0:
+            yield from self._row_ranges(cy - half, cy + half, cx - half, cx + half)
+            return
+
+        yield from self._row_ranges(cy - half, cy - inner - 1, cx - half, cx + half)
+        yield from self._row_ranges(cy + inner + 1, cy + half, cx - half, cx + half)
+
+        if 2 * half + 1 >= self.cols:
+            # 경도 방향으로 한 바퀴를 다 덮으면 좌우 테두리는 안쪽 사각형의 나머지 전체
+            width = self.cols - (2 * inner + 1)
+            if width > 0:
+                yield from self._row_ranges(cy - inner, cy + inner, cx + inner + 1, cx + inner + width)
+        else:
+            yield from self._row_ranges(cy - inner, cy + inner, cx - half, cx - inner - 1)
+            yield from self._row_ranges(cy - inner, cy + inner, cx + inner + 1, cx + half)
+
+    def _covered_km(self, lat0, half_cells):
+        """셀 사각형(중심 셀 ± half_cells) 밖에 있는 점까지의 최소 거리(km)"""
+        covered_deg = half_cells * self.cell_size
+        lat_bound = covered_deg * KM_PER_DEGREE
+
+        # 경도 방향: hav(d) >= cos(lat1)·cos(lat2)·hav(Δλ), lat2는 사각형의 극쪽 끝 위도까지 가능
+        if 2 * half_cells + 1 >= self.cols:
+            lng_bound = math.inf
+        else:
+            pole_lat = min(90.0, abs(lat0) + covered_deg + self.cell_size)
+            factor = max(0.0, math.cos(math.radians(lat0)) * math.cos(math.radians(pole_lat)))
+            dlng = math.radians(min(180.0, covered_deg))
+            lng_bound = 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(factor) * math.sin(dlng / 2)))
+
+        return min(lat_bound, lng_bound)
+
+
+def cell_order(points, cell_size):
+    """좌표 목록 → (셀 키 순 행 번호 배열, 셀 키 목록, 셀별 시작 위치 + 끝)"""
+    cols = math.ceil(360 / cell_size)
+    keys = [math.floor((lat + 90) / cell_size) * cols + math.floor((lng + 180) / cell_size) % cols
+            for lat, lng in points]
+    order = sorted(range(len(points)), key=keys.__getitem__)
+    cell_keys, cell_starts = [], []
+    for position, row in enumerate(order):
+        if not cell_keys or cell_keys[-1] != keys[row]:
+            cell_keys.append(keys[row])
+            cell_starts.append(position)
+    cell_starts.append(len(order))
+    return order, cell_keys, cell_starts
+
+
+class FacilityIndex(CellGrid):
+    def __init__(self, store):
+        self.store = store
+        self.cell_size = store.meta['cell_size']
+        self.cols = math.ceil(360 / self.cell_size)
+        self.lat_cells = math.ceil(180 / self.cell_size)
+
+        self.lat = store.numeric('lat')
+        self.lng = store.numeric('lng')
+        self.type_codes, self.type_values = store.codes('type')
+        self.country_codes, self.country_values = store.codes('country')
+
+        # 셀 디렉터리: 정렬된 셀 키와 각 셀의 시작 행 (같은 위도 줄의 셀들은 행이 연속)
+        keys = store.array('cell_keys')
+        starts = store.array('cell_starts')
+        self.cell_keys = keys.tolist()
+        self.cell_starts = starts.tolist()
+        keys.release()
+        starts.release()
+
+    # ---------- 구축 / 로드 ----------
+
+    @classmethod
+    def build(cls, facilities, path=DEFAULT_INDEX_PATH, cell_size=None):
+        """시설 dict 목록으로 인덱스 파일 생성 후 로드"""
+        facilities = [f for f in facilities if f.get('lat') is not None and f.get('lng') is not None]
+        cell_size = cell_size or choose_cell_size([(float(f['lat']), float(f['lng'])) for f in facilities])
+        cols = math.ceil(360 / cell_size)
+
+        def cell_key(facility):
+            iy = math.floor((float(facility['lat']) + 90) / cell_size)
+            ix = math.floor((float(facility['lng']) + 180) / cell_size) % cols
+            return iy * cols + ix
+
+        keyed = sorted(((cell_key(f), f) for f in facilities), key=lambda item: item[0])
+
+        writer = FacilityStoreWriter(path, meta={'cell_size': cell_size})
+        keys, starts = [], []
+        for row, (key, facility) in enumerate(keyed):
+            if not keys or keys[-1] != key:
+                keys.append(key)
+                starts.append(row)
+            writer.append(facility)
+        starts.append(len(keyed))
+
+        writer.add_array('cell_keys', 'int64', keys)
+        writer.add_array('cell_starts', 'uint32', starts)
+        writer.close()
+
+        print(f"🗂️ {path}: 시설 {len(keyed)}개, 셀 {len(keys)}개 (셀 크기 {cell_size:g}°)")
+        return cls.load(path)
+
+    @classmethod
+    def build_from_files(cls, paths, path=DEFAULT_INDEX_PATH, cell_size=None):
+        """수집기 출력 파일(.fcol/.csv)들로 인덱스 생성"""
+        facilities = []
+        for file_path in paths:
+            facilities.extend(iter_facility_file(file_path))
+        return cls.build(facilities, path, cell_size)
+
+    @classmethod
+    def load(cls, path=DEFAULT_INDEX_PATH):
+        return cls(FacilityStore(path))
+
+    def close(self):
+        for view in (self.lat, self.lng, self.type_codes, self.country_codes):
+            view.release()
+        self.store.close()
+
+    def __len__(self):
+        return self.store.rows
+
+    # ---------- 내부 도우미 ----------
+
+    def _type_filter(self, types):
+        """타입 이름(또는 목록) → 허용 코드 집합 (None이면 전체 허용)"""
+        return self._code_filter(self.type_values, types)
+
+    @staticmethod
+    def _code_filter(values, wanted):
+        if not wanted:
+            return None
+        if isinstance(wanted, str):
+            wanted = [wanted]
+        return {code for code, value in enumerate(values) if value in wanted}
+
+    def facility(self, row, distance_km=None):
+        """행 번호 → 시설 dict"""
+        result = {
+            'name': self.store.string('name', row),
+            'lat': self.lat[row],
+            'lng': self.lng[row],
+            'type': self.type_values[self.type_codes[row]],
+            'country': self.country_values[self.country_codes[row]],
+            'osm_id': self.store.string('osm_id', row)
+        }
+        if distance_km is not None:
+            result['distance_km'] = round(distance_km, 3)
+        return result
+
+    # ---------- 질의 ----------
+
+    def bbox(self, west, south, east, north, types=None, limit=None, countries=None, offset=0):
+        """bbox 안의 시설 목록 (west > east면 ±180° 경계를 넘는 bbox, offset개 건너뛴 뒤 최대 limit개)"""
+        allowed = self._type_filter(types)
+        allowed_countries = self._code_filter(self.country_values, countries)
+        lat, lng, codes, country_codes = self.lat, self.lng, self.type_codes, self.country_codes
+        wraps = west > east
+        iy0, ix0 = self._cell_of(south, west)
+        iy1, ix1 = self._cell_of(north, east)
+        if wraps:
+            ix1 += self.cols
+        found = []
+
+        for start, end in self._row_ranges(iy0, iy1, ix0, ix1):
+            for row in range(start, end):
+                x = lng[row]
+                in_lng = (x >= west or x <= east) if wraps else (west <= x <= east)
+                if in_lng and south <= lat[row] <= north and (allowed is None or codes[row] in allowed) \
+                        and (allowed_countries is None or country_codes[row] in allowed_countries):
+                    if offset:
+                        offset -= 1
+                        continue
+                    found.append(row)
+                    if limit and len(found) >= limit:
+                        return [self.facility(r) for r in found]
+
+        return [self.facility(row) for row in found]
+
+    def radius(self, lat0, lng0, radius_km, types=None, limit=None):
+        """중심에서 radius_km 이내 시설을 가까운 순으로"""
+        allowed = self._type_filter(types)
+        lat, lng, codes = self.lat, self.lng, self.type_codes
+
+        dlat = radius_km / KM_PER_DEGREE
+        cos_lat = math.cos(math.radians(min(90.0, abs(lat0) + dlat)))
+        dlng = radius_km / (KM_PER_DEGREE * cos_lat) if cos_lat > 1e-9 else 360.0
+        iy0, ix0 = self._cell_of(lat0 - dlat, lng0 - min(dlng, 180.0))
+        iy1, ix1 = self._cell_of(lat0 + dlat, lng0 + min(dlng, 180.0))
+
+        hits = []
+        for start, end in self._row_ranges(iy0, iy1, ix0, ix1):
+            for row in range(start, end):
+                if allowed is not None and codes[row] not in allowed:
+                    continue
+                distance = haversine_km(lat0, lng0, lat[row], lng[row])
+                if distance <= radius_km:
+                    hits.append((distance, row))
+
+        hits.sort()
+        if limit:
+            hits = hits[:limit]
+        return [self.facility(row, distance) for distance, row in hits]
+
+    def nearest(self, lat0, lng0, k=1, types=None, max_radius_km=None):
+        """가장 가까운 시설 k개 (탐색 사각형을 두 배씩 넓혀가며 결과가 확정될 때까지 탐색)"""
+        allowed = self._type_filter(types)
+        lat, lng, codes = self.lat, self.lng, self.type_codes
+        cy, cx = self._cell_of(lat0, lng0)
+        heap = []  # (-거리, 행) 최대 힙으로 상위 k개 유지
+        inner, half = -1, 1
+
+        while True:
+            # 이전 사각형은 이미 훑었으므로 새로 늘어난 테두리 부분만 검사
+            for start, end in self._ring_ranges(cy, cx, inner, half):
+                for row in range(start, end):
+                    if allowed is not None and codes[row] not in allowed:
+                        continue
+                    # 위도 차이만으로도 현재 k번째보다 멀면 거리 계산 생략
+                    if len(heap) == k and abs(lat[row] - lat0) * KM_PER_DEGREE >= -heap[0][0]:
+                        continue
+                    distance = haversine_km(lat0, lng0, lat[row], lng[row])
+                    if max_radius_km is not None and distance > max_radius_km:
+                        continue
+                    if len(heap) < k:
+                        heapq.heappush(heap, (-distance, row))
+                    elif distance < -heap[0][0]:
+                        heapq.heapreplace(heap, (-distance, row))
+
+            covered_km = self._covered_km(lat0, half)
+            everything = cy - half <= 0 and cy + half >= self.lat_cells - 1 and 2 * half + 1 >= self.cols
+            if len(heap) == k and -heap[0][0] <= covered_km:
+                break
+            if everything or (max_radius_km is not None and covered_km >= max_radius_km):
+                break
+            inner, half = half, half * 2
+
+        return [self.facility(row, -neg) for neg, row in sorted(heap, reverse=True)]
+
+
+if __name__ == "__main__":
+    # python facility_index.py build                  → data/*_facilities.fcol로 인덱스 생성
+    # python facility_index.py nearest 23.81 90.41 5 blood_test
+    command = sys.argv[1] if len(sys.argv) > 1 else 'build'
+
+    if command == 'build':
+        paths = sorted(glob.glob('data/*_facilities.fcol')) or sorted(glob.glob('data/*_facilities.csv'))
+        FacilityIndex.build_from_files(paths).close()
+    elif command == 'nearest':
+        index = FacilityIndex.load()
+        lat, lng = float(sys.argv[2]), float(sys.argv[3])
+        k = int(sys.argv[4]) if len(sys.argv) > 4 else 5
+        types = sys.argv[5] if len(sys.argv) > 5 else None
+        for facility in index.nearest(lat, lng, k, types):
+            print(f"  {facility['distance_km']:>8.2f} km  {facility['name']} ({facility['type']})")
+        index.close()
@@ -0,0 +1,528 @@
+"""
+시설 이름 검색 인덱스 (다국어 접두사 + 3-gram 퍼지 검색)
+
+이름을 NFKC + 소문자로 정규화한 뒤 벵골/데바나가리 등 인도계 문자, 태국/라오/크메르/미얀마,
+싱할라, 우르두(아랍) 문자를 라틴 문자로 음역(fold)해서 토큰으로 나눈다.
+→ 'ঢাকা', 'ढाका', 'dhaka', 'Dhākā' 모두 같은 토큰 'dhaka'
+
+- 접두사: 정렬된 토큰 배열에서 이분 탐색 (정렬 배열 = 압축된 trie)
+- 부분 문자열/오타: 토큰의 3-gram → 토큰 목록 역색인 (띄어쓰기 없는 태국어/크메르어 이름도 중간부터 검색)
+- 토큰 조건은 행 비트맵 AND/OR, 위치가 주어지면 격자 셀을 가까운 순으로 넓혀가며 정렬
+
+웹 클라이언트용으로는 토큰 앞 두 글자별 샤드로 나눠 내보낸다 (export_shards.py → {국가}/search/).
+음역 표(fold_spec)는 루트 매니페스트에 넣어 클라이언트가 같은 방식으로 검색어를 정규화한다.
+
+사용법:
+    python facility_search.py dhaka hospital       → data/*_facilities.fcol 전체에서 검색
+    python facility_search.py --near=23.81,90.41 dhaka hospital
+"""
+
+import glob
+import heapq
+import math
+import re
+import sys
+import time
+import unicodedata
+from array import array
+from bisect import bisect_left
+
+from facility_index import CellGrid, cell_order, choose_cell_size, haversine_km
+from facility_store import iter_facility_file
+from facility_table import FacilityTable, iter_bits
+
+SEARCH_FIELDS = ['name', 'lat', 'lng', 'type', 'osm_id']
+SEARCH_PREFIX_LEN = 2           # 클라이언트 샤드 키 길이 (토큰 앞 글자 수)
+FUZZY_MIN_SIMILARITY = 0.5      # 3-gram Dice 유사도 하한
+_NON_WORD = re.compile(r'[\W_]+', re.UNICODE)
+
+# 토큰 일치 점수 (토큰마다 가장 좋은 것 하나, 퍼지는 3-gram 유사도 0.5~1 미만)
+EXACT, PREFIX, SUBSTRING = 3.0, 2.0, 1.5
+# 결과 일치 등급 (모든 검색어 토큰 중 가장 약한 일치 기준)
+MATCH_TIERS = ['exact', 'prefix', 'substring', 'fuzzy']
+
+# ---------- 음역 표 ----------
+
+# 데바나가리 블록 기준 오프셋 → 라틴 (벵골/구르무키/구자라트/오리야/타밀/텔루구/칸나다/말라얄람도 같은 배치)
+_INDIC_VOWELS = {
+    0x05: 'a', 0x06: 'a', 0x07: 'i', 0x08: 'i', 0x09: 'u', 0x0A: 'u', 0x0B: 'ri', 0x0C: 'li',
+    0x0D: 'e', 0x0E: 'e', 0x0F: 'e', 0x10: 'ai', 0x11: 'o', 0x12: 'o', 0x13: 'o', 0x14: 'au',
+    0x60: 'ri', 0x61: 'li'
+}
+_INDIC_CONSONANTS = {
+    0x15: 'k', 0x16: 'kh', 0x17: 'g', 0x18: 'gh', 0x19: 'ng', 0x1A: 'ch', 0x1B: 'chh', 0x1C: 'j',
+    0x1D: 'jh', 0x1E: 'ny', 0x1F: 't', 0x20: 'th', 0x21: 'd', 0x22: 'dh', 0x23: 'n', 0x24: 't',
+    0x25: 'th', 0x26: 'd', 0x27: 'dh', 0x28: 'n', 0x29: 'n', 0x2A: 'p', 0x2B: 'ph', 0x2C: 'b',
+    0x2D: 'bh', 0x2E: 'm', 0x2F: 'y', 0x30: 'r', 0x31: 'r', 0x32: 'l', 0x33: 'l', 0x34: 'l',
+    0x35: 'v', 0x36: 'sh', 0x37: 'sh', 0x38: 's', 0x39: 'h',
+    0x58: 'q', 0x59: 'kh', 0x5A: 'g', 0x5B: 'z', 0x5C: 'r', 0x5D: 'rh', 0x5E: 'f', 0x5F: 'y'
+}
+# 모음 기호/비라마 (앞 자음의 기본 모음 'a'를 없앰)
+_INDIC_SIGNS = {
+    0x01: 'n', 0x02: 'n', 0x03: 'h', 0x3C: '', 0x3E: 'a', 0x3F: 'i', 0x40: 'i', 0x41: 'u',
+    0x42: 'u', 0x43: 'ri', 0x44: 'ri', 0x45: 'e', 0x46: 'e', 0x47: 'e', 0x48: 'ai', 0x49: 'o',
+    0x4A: 'o', 0x4B: 'o', 0x4C: 'au', 0x4D: '', 0x4E: 't', 0x57: 'au', 0x62: 'li', 0x63: 'li'
+}
+_INDIC_NASALS = (0x01, 0x02, 0x03)
+_INDIC_BLOCKS = [0x0900, 0x0980, 0x0A00, 0x0A80, 0x0B00, 0x0B80, 0x0C00, 0x0C80, 0x0D00]
+# 블록별 예외 (벵골어 아누스와라는 'ng', ৰ/ৱ 등)
+_INDIC_OVERRIDES = {'ং': 'ng', 'ৰ': 'r', 'ৱ': 'w', 'ழ': 'zh'}
+
+_SINHALA = dict(zip(
+    'අආඇඈඉඊඋඌඍඎඑඒඓඔඕඖ',
+    ['a', 'a', 'ae', 'ae', 'i', 'i', 'u', 'u', 'ri', 'ri', 'e', 'e', 'ai', 'o', 'o', 'au']
+))
+_SINHALA_CONSONANTS = dict(zip(
+    'කඛගඝඞඟචඡජඣඤඥඦටඨඩඪණඬතථදධනඳපඵබභමඹයරලවශෂසහළෆ',
+    ['k', 'kh', 'g', 'gh', 'ng', 'ng', 'ch', 'chh', 'j', 'jh', 'ny', 'gn', 'nj', 't', 'th', 'd', 'dh',
+     'n', 'nd', 't', 'th', 'd', 'dh', 'n', 'nd', 'p', 'ph', 'b', 'bh', 'm', 'mb', 'y', 'r', 'l', 'v',
+     'sh', 'sh', 's', 'h', 'l', 'f']
+))
+_SINHALA_SIGNS = dict(zip(
+    'ංඃ්ාැෑිීුූෘෙේෛොෝෞෟ',
+    ['n', 'h', '', 'a', 'ae', 'ae', 'i', 'i', 'u', 'u', 'ri', 'e', 'e', 'ai', 'o', 'o', 'au', 'lu']
+))
+
+_KHMER_CONSONANTS = dict(zip(
+    'កខគឃងចឆជឈញដឋឌឍណតថទធនបផពភមយរលវឝឞសហឡអ',
+    ['k', 'kh', 'k', 'kh', 'ng', 'ch', 'chh', 'ch', 'chh', 'nh', 'd', 'th', 'd', 'th', 'n', 't',
+     'th', 't', 'th', 'n', 'b', 'ph', 'p', 'ph', 'm', 'y', 'r', 'l', 'v', 's', 's', 's', 'h', 'l', '']
+))
+_KHMER = dict(zip(
+    'ឥឦឧឩឪឫឬឭឮឯឰឱឲឳ',
+    ['e', 'ei', 'u', 'u', 'ov', 'rue', 'rue', 'lue', 'lue', 'ae', 'ai', 'ao', 'ao', 'au']
+))
+_KHMER_SIGNS = dict(zip(
+    'ាិីឹឺុូួើឿៀេែៃោៅំះៈ៉៊់៌៍៎៏័៑្',
+    ['a', 'e', 'ei', 'oe', 'eu', 'o', 'ou', 'uo', 'aeu', 'oea', 'ie', 'e', 'ae', 'ai', 'ao', 'au',
+     'm', 'h', '', '', '', '', '', '', '', '', '', '', '']
+))
+
+_MYANMAR_CONSONANTS = dict(zip(
+    'ကခဂဃငစဆဇဈဉညဋဌဍဎဏတထဒဓနပဖဗဘမယရလဝသဟဠအ',
+    ['k', 'kh', 'g', 'gh', 'ng', 's', 'hs', 'z', 'zh', 'ny', 'ny', 't', 'ht', 'd', 'dh', 'n', 't',
+     'ht', 'd', 'dh', 'n', 'p', 'hp', 'b', 'b', 'm', 'y', 'r', 'l', 'w', 'th', 'h', 'l', 'a']
+))
+_MYANMAR = dict(zip('ဣဤဥဦဧဩဪဿ', ['i', 'i', 'u', 'u', 'e', 'o', 'aw', 'ss']))
+_MYANMAR_SIGNS = dict(zip(
+    'ါာိီုူေဲံ့း္်ျြွှ',
+    ['a', 'a', 'i', 'i', 'u', 'u', 'e', 'ai', 'n', '', '', '', '', 'y', 'y', 'w', 'h']
+))
+
+# 자음에 붙는 미얀마 중간 자음 기호(ျ ြ ွ ှ): 기본 모음은 이 기호들 뒤에 옴
+_MEDIALS = 'ျြွှ'
+# 바로 앞 자음의 기본 모음을 살리는 비음/기식 기호 (인도계 계열 외)
+_NASALS = 'ංඃំះံ'
+
+# 태국/라오: 기본 모음 없이 자음 그대로, 앞에 쓰는 모음(เ แ โ ใ ไ)은 뒤 자음 다음으로 옮김
+_THAI = dict(zip(
+    'กขฃคฅฆงจฉชซฌญฎฏฐฑฒณดตถทธนบปผฝพฟภมยรฤลฦวศษสหฬอฮ'
+    'ะัาำิีึืุูเแโใไๅ็่้๊๋์ฯๆ',
+    ['k', 'kh', 'kh', 'kh', 'kh', 'kh', 'ng', 'ch', 'ch', 'ch', 's', 'ch', 'y', 'd', 't', 'th', 'th',
+     'th', 'n', 'd', 't', 'th', 'th', 'th', 'n', 'b', 'p', 'ph', 'f', 'ph', 'f', 'ph', 'm', 'y', 'r',
+     'rue', 'l', 'lue', 'w', 's', 's', 's', 'h', 'l', '', 'h',
+     'a', 'a', 'a', 'am', 'i', 'i', 'ue', 'ue', 'u', 'u', 'e', 'ae', 'o', 'ai', 'ai', '', '', '', '',
+     '', '', '', '', '']
+))
+_LAO = dict(zip(
+    'ກຂຄງຈສຊຍດຕຖທນບປຜຝພຟມຢຣລວຫອຮໜໝ'
+    'ະັາຳິີຶືຸູົຼຽເແໂໃໄ່້໊໋໌ໍໆ',
+    ['k', 'kh', 'kh', 'ng', 'ch', 's', 's', 'ny', 'd', 't', 'th', 'th', 'n', 'b', 'p', 'ph', 'f',
+     'ph', 'f', 'm', 'y', 'r', 'l', 'v', 'h', '', 'h', 'n', 'm',
+     'a', 'a', 'a', 'am', 'i', 'i', 'ue', 'ue', 'u', 'u', 'o', 'l', 'ia', 'e', 'ae', 'o', 'ai', 'ai',
+     '', '', '', '', '', 'o', '']
+))
+_LEADING_VOWELS = 'เแโใไເແໂໃໄ'
+
+# 우르두/아랍 (모음 부호는 결합 문자라 자동 제거)
+_ARABIC = dict(zip(
+    'اآأإبپتٹثجچحخدڈذرڑزژسشصضطظعغفقکكگلمنںوؤہهھةءیيئےۓ',
+    ['a', 'a', 'a', 'a', 'b', 'p', 't', 't', 's', 'j', 'ch', 'h', 'kh', 'd', 'd', 'z', 'r', 'r', 'z',
+     'zh', 's', 'sh', 's', 'z', 't', 'z', '', 'gh', 'f', 'q', 'k', 'k', 'g', 'l', 'm', 'n', 'n', 'w',
+     'w', 'h', 'h', 'h', 'h', '', 'y', 'y', 'y', 'e', 'e']
+))
+
+# 분해로 떨어지지 않는 라틴 문자, 보이지 않는 결합 제어 문자 (싱할라 'ශ්‍රී'의 ZWJ 등)
+_LATIN = {'đ': 'd', 'ð': 'd', 'ħ': 'h', 'ı': 'i', 'ł': 'l', 'ø': 'o', 'œ': 'oe', 'æ': 'ae',
+          'ß': 'ss', 'þ': 'th', '‌': '', '‍': ''}
+
+
+def _build_fold_table():
+    """문자 → 라틴 문자열, 기본 모음 'a'를 가진 자음 집합, 비음 기호 집합"""
+    table = dict(_LATIN)
+    inherent = set(_MEDIALS)
+    nasals = set(_NASALS)
+    for base in _INDIC_BLOCKS:
+        for offsets, is_consonant in ((_INDIC_VOWELS, False), (_INDIC_CONSONANTS, True), (_INDIC_SIGNS, False)):
+            for offset, latin in offsets.items():
+                char = chr(base + offset)
+                if unicodedata.name(char, None):
+                    table[char] = latin
+                    if is_consonant:
+                        inherent.add(char)
+                    elif offset in _INDIC_NASALS:
+                        nasals.add(char)
+    table.update(_INDIC_OVERRIDES)
+
+    for letters, consonants, signs in ((_SINHALA, _SINHALA_CONSONANTS, _SINHALA_SIGNS),
+                                       (_KHMER, _KHMER_CONSONANTS, _KHMER_SIGNS),
+                                       (_MYANMAR, _MYANMAR_CONSONANTS, _MYANMAR_SIGNS)):
+        table.update(letters)
+        table.update(consonants)
+        table.update(signs)
+        inherent.update(consonants)
+    table.update(_THAI)
+    table.update(_LAO)
+    table.update(_ARABIC)
+
+    # 각 문자 블록의 숫자 (০-৯, ๐-๙ 등) → ASCII 숫자
+    for start, end in ((0x0660, 0x066A), (0x06F0, 0x06FA), (0x0966, 0x0D70), (0x0DE6, 0x0DF0),
+                       (0x0E50, 0x0E5A), (0x0ED0, 0x0EDA), (0x1040, 0x104A), (0x17E0, 0x17EA)):
+        for code in range(start, end):
+            digit = unicodedata.decimal(chr(code), None)
+            if digit is not None:
+                table[chr(code)] = str(digit)
+    return table, frozenset(inherent), frozenset(nasals)
+
+
+FOLD_TABLE, INHERENT_CONSONANTS, NASAL_SIGNS = _build_fold_table()
+# 이 문자가 뒤따르면 앞 자음(또는 중간 자음 기호)에 기본 모음 'a'를 붙임
+_VOWEL_TRIGGERS = (INHERENT_CONSONANTS - frozenset(_MEDIALS)) | NASAL_SIGNS
+_fold_cache = {}
+
+
+def fold_spec():
+    """클라이언트(js/global-app.js foldName)용 음역 규칙 → 루트 매니페스트의 search_fold"""
+    return {
+        'map': FOLD_TABLE,
+        'inherent': ''.join(sorted(INHERENT_CONSONANTS)),
+        'triggers': ''.join(sorted(_VOWEL_TRIGGERS)),
+        'lead': _LEADING_VOWELS
+    }
+
+
+def _fold_char(char):
+    latin = _fold_cache.get(char)
+    if latin is None:
+        latin = FOLD_TABLE.get(char)
+        if latin is None:
+            # 표에 없는 문자: 분해 후 결합 부호 제거 (é → e, 한자/한글은 그대로)
+            latin = ''.join(c for c in unicodedata.normalize('NFKD', char)
+                            if not unicodedata.category(c).startswith('M'))
+        _fold_cache[char] = latin
+    return latin
+
+
+def fold_name(name):
+    """검색용 이름 정규화: NFKC + 소문자 + 음역 + 구두점/공백 정리 → 공백으로 구분된 토큰 문자열"""
+    text = unicodedata.normalize('NFKC', name or '').lower()
+    if text.isascii():
+        return _NON_WORD.sub(' ', text).strip()
+
+    out = []
+    i, size = 0, len(text)
+    while i < size:
+        char = text[i]
+        following = text[i + 1] if i + 1 < size else ''
+        if char in _LEADING_VOWELS and following and unicodedata.category(following) == 'Lo':
+            out.append(_fold_char(following))
+            out.append(_fold_char(char))
+            i += 2
+            continue
+        out.append(_fold_char(char))
+        # 자음 뒤에 바로 자음/비음 기호가 오면 기본 모음 'a' (모음 기호/비라마가 붙거나 단어 끝이면 없음)
+        if char in INHERENT_CONSONANTS and following in _VOWEL_TRIGGERS:
+            out.append('a')
+        i += 1
+    return _NON_WORD.sub(' ', ''.join(out)).strip()
+
+
+def name_tokens(name):
+    return fold_name(name).split()
+
+
+def trigrams(token):
+    return {token[i:i + 3] for i in range(len(token) - 2)}
+
+
+def _rank_key(facility):
+    """인덱스 행 순서: 짧은 이름 → 이름순 (비트맵에서 켜진 행을 앞에서부터 꺼내면 그대로 순위)"""
+    name = facility.get('name') or ''
+    return len(name), name, facility.get('osm_id') or ''
+
+
+def _rows_bitmap(row_lists, size):
+    """행 번호 배열들 → 행 비트맵 int"""
+    buffer = bytearray((size + 7) // 8)
+    for rows in row_lists:
+        for row in rows:
+            buffer[row >> 3] |= 1 << (row & 7)
+    return int.from_bytes(buffer, 'little')
+
+
+class FacilitySearchIndex(CellGrid):
+    """이름 토큰 → 행 역색인 + 행 비트맵 조합 검색
+
+    행은 (이름 길이, 이름) 순으로 정렬해 두어 비트맵의 낮은 비트부터 꺼내면 이름순 순위가 되고,
+    토큰 조건의 AND/OR은 FacilityTable과 같은 파이썬 int 비트맵 연산으로 처리한다.
+    위치 검색은 FacilityIndex와 같은 격자 셀 탐색으로 사각형을 넓혀가며 후보 비트맵에 있는 행만 본다.
+    """
+
+    def __init__(self, facilities, cell_size=None, prepare=True):
+        self.table = FacilityTable.from_facilities(sorted(facilities, key=_rank_key))
+        table = self.table
+        postings = {}
+        for row, name in enumerate(table.names):
+            for token in set(name_tokens(name)):
+                postings.setdefault(token, []).append(row)
+
+        self.terms = sorted(postings)
+        self.postings = [array('I', postings[term]) for term in self.terms]
+
+        grams = {}
+        for term_id, term in enumerate(self.terms):
+            for gram in trigrams(term):
+                grams.setdefault(gram, []).append(term_id)
+        self.grams = {gram: array('I', term_ids) for gram, term_ids in grams.items()}
+
+        # 위치 검색용 격자
+        self.cell_size = cell_size
+        self.spatial_rows = None
+
+        # 행이 많은 토큰/토큰 조합의 비트맵은 한 번 만들면 재사용
+        self._large = max(64, len(table) // 256)
+        self._term_bitmaps = {}
+        self._bitmap_cache = {}
+
+        # 검색 서버용: 격자와 행이 많은 토큰의 비트맵을 미리 만들어 첫 요청도 바로 응답
+        # (prepare=False면 처음 필요할 때 만듦 — 샤드 내보내기처럼 검색을 하지 않는 경우)
+        if prepare:
+            self._ensure_grid()
+            for term_id, rows in enumerate(self.postings):
+                if len(rows) >= self._large:
+                    self._term_bitmaps[term_id] = _rows_bitmap([rows], len(table))
+
+    @classmethod
+    def from_files(cls, paths, cell_size=None):
+        facilities = []
+        for path in paths:
+            facilities.extend(iter_facility_file(path))
+        return cls(facilities, cell_size)
+
+    def __len__(self):
+        return len(self.table)
+
+    def _ensure_grid(self):
+        """셀 키 순 위치 → 행 (FacilityIndex와 같은 셀 디렉터리)"""
+        if self.spatial_rows is None:
+            points = list(zip(self.table.lat, self.table.lng))
+            self.cell_size = self.cell_size or choose_cell_size(points)
+            self.cols = math.ceil(360 / self.cell_size)
+            self.lat_cells = math.ceil(180 / self.cell_size)
+            order, self.cell_keys, self.cell_starts = cell_order(points, self.cell_size)
+            self.spatial_rows = array('I', order)
+
+    # ---------- 토큰 일치 ----------
+
+    def prefix_range(self, token):
+        """token으로 시작하는 토큰들의 [시작, 끝) 위치"""
+        first = bisect_left(self.terms, token)
+        return first, bisect_left(self.terms, token + '\U0010ffff', first)
+
+    def match_token(self, token, fuzzy=True):
+        """검색어 토큰 하나 → {토큰 번호: 점수}"""
+        terms = self.terms
+        first, last = self.prefix_range(token)
+        matched = {term_id: EXACT if terms[term_id] == token else PREFIX for term_id in range(first, last)}
+
+        grams = trigrams(token)
+        if not grams:
+            return matched
+
+        # 부분 문자열: 모든 3-gram을 가진 토큰 중 실제로 포함하는 것
+        lists = sorted((self.grams.get(gram, ()) for gram in grams), key=len)
+        candidates = set(lists[0])
+        for term_ids in lists[1:]:
+            if not candidates:
+                break
+            candidates.intersection_update(term_ids)
+        for term_id in candidates:
+            if term_id not in matched and token in terms[term_id]:
+                matched[term_id] = SUBSTRING
+
+        if matched or not fuzzy:
+            return matched
+
+        # 오타/음역 차이: 공유하는 3-gram 수로 Dice 유사도
+        shared = {}
+        for gram in grams:
+            for term_id in self.grams.get(gram, ()):
+                shared[term_id] = shared.get(term_id, 0) + 1
+        for term_id, count in shared.items():
+            similarity = 2 * count / (len(grams) + max(1, len(terms[term_id]) - 2))
+            if similarity >= FUZZY_MIN_SIMILARITY:
+                matched[term_id] = similarity
+        return matched
+
+    def _bitmap(self, key, term_ids):
+        """토큰 번호 목록 → 행 비트맵 (행이 많으면 캐시)"""
+        cached = self._bitmap_cache.get(key)
+        if cached is not None:
+            return cached
+        bitmap, lists = 0, []
+        for term_id in term_ids:
+            rows = self.postings[term_id]
+            if len(rows) < self._large:
+                lists.append(rows)
+                continue
+            term_bitmap = self._term_bitmaps.get(term_id)
+            if term_bitmap is None:
+                term_bitmap = self._term_bitmaps[term_id] = _rows_bitmap([rows], len(self.table))
+            bitmap |= term_bitmap
+        if lists:
+            bitmap |= _rows_bitmap(lists, len(self.table))
+        if bitmap.bit_count() >= self._large:
+            if len(self._bitmap_cache) >= 256:
+                self._bitmap_cache.clear()
+            self._bitmap_cache[key] = bitmap
+        return bitmap
+
+    def token_tiers(self, token, fuzzy=True):
+        """검색어 토큰 하나 → 등급별 누적 비트맵 [정확, ≤접두사, ≤부분 문자열, ≤퍼지]"""
+        matched = self.match_token(token, fuzzy)
+        first, last = self.prefix_range(token)
+        exact = [term_id for term_id in range(first, last) if self.terms[term_id] == token]
+        tiers = [
+            self._bitmap(('exact', token), exact),
+            self._bitmap(('prefix', token), range(first, last)),
+        ]
+        substring = [term_id for term_id, score in matched.items() if score == SUBSTRING]
+        tiers.append(tiers[1] | self._bitmap(('substring', token), substring) if substring else tiers[1])
+        rest = [term_id for term_id, score in matched.items() if score < SUBSTRING]
+        tiers.append(tiers[2] | self._bitmap(('fuzzy', token), rest) if rest else tiers[2])
+        return tiers
+
+    # ---------- 검색 ----------
+
+    def search(self, query, lat=None, lng=None, limit=10, types=None, countries=None, fuzzy=True):
+        """이름 검색 → 시설 dict 목록 (match: exact/prefix/substring/fuzzy, 위치가 있으면 distance_km 포함)
+
+        모든 검색어 토큰이 일치하는 시설만. 위치가 없으면 일치 등급 → 짧은 이름 순,
+        위치가 주어지면 가까운 순 (정확/접두사/부분 일치가 하나라도 있으면 퍼지 결과는 제외).
+        """
+        tokens = name_tokens(query)
+        if not tokens:
+            return []
+
+        table = self.table
+        scope = table.mask(types, countries) if types is not None or countries is not None else -1
+        tiers = [scope] * len(MATCH_TIERS)
+        for token in tokens:
+            for i, bitmap in enumerate(self.token_tiers(token, fuzzy)):
+                tiers[i] &= bitmap
+
+        if lat is None or lng is None:
+            found, seen = [], 0
+            for tier, bitmap in zip(MATCH_TIERS, tiers):
+                for row in iter_bits(bitmap & ~seen):
+                    found.append((row, tier, None))
+                    if len(found) >= limit:
+                        break
+                if len(found) >= limit:
+                    break
+                seen |= bitmap
+        else:
+            candidates = tiers[2] or tiers[3]
+            tier_of = dict(zip(MATCH_TIERS, tiers))
+            found = [(row, next(tier for tier in MATCH_TIERS if tier_of[tier] >> row & 1), distance)
+                     for distance, row in self._nearest(candidates, lat, lng, limit)]
+
+        results = []
+        for row, tier, distance in found:
+            facility = table.row(row)
+            facility['match'] = tier
+            if distance is not None:
+                facility['distance_km'] = round(distance, 3)
+            results.append(facility)
+        return results
+
+    def _nearest(self, candidates, lat0, lng0, limit):
+        """후보 비트맵에서 가까운 행 limit개 → [(거리 km, 행)]"""
+        count = candidates.bit_count()
+        if not count:
+            return []
+        lats, lngs = self.table.lat, self.table.lng
+        if count <= 4 * self._large:
+            return heapq.nsmallest(limit, ((haversine_km(lat0, lng0, lats[row], lngs[row]), row)
+                                           for row in iter_bits(candidates)))
+
+        # 후보가 많으면 중심 셀부터 사각형을 두 배씩 넓혀가며 후보인 행만 거리 계산 (FacilityIndex.nearest와 같은 방식)
+        self._ensure_grid()
+        member = candidates.to_bytes((len(self.table) + 7) // 8, 'little')
+        spatial_rows = self.spatial_rows
+        cy, cx = self._cell_of(lat0, lng0)
+        heap = []   # (-거리, 행)
+        inner, half = -1, 1
+        while True:
+            for start, end in self._ring_ranges(cy, cx, inner, half):
+                for row in spatial_rows[start:end]:
+                    if not member[row >> 3] >> (row & 7) & 1:
+                        continue
+                    distance = haversine_km(lat0, lng0, lats[row], lngs[row])
+                    if len(heap) < limit:
+                        heapq.heappush(heap, (-distance, row))
+                    elif distance < -heap[0][0]:
+                        heapq.heapreplace(heap, (-distance, row))
+
+            everything = cy - half <= 0 and cy + half >= self.lat_cells - 1 and 2 * half + 1 >= self.cols
+            if everything or (len(heap) == limit and -heap[0][0] <= self._covered_km(lat0, half)):
+                break
+            inner, half = half, half * 2
+        return sorted((-negative, row) for negative, row in heap)
+
+    # ---------- 클라이언트 샤드 ----------
+
+    def shards(self, prefix_len=SEARCH_PREFIX_LEN):
+        """{샤드 키: {'fields', 'rows', 'terms'}} — 토큰 앞 prefix_len 글자가 같은 토큰끼리 한 샤드
+
+        rows는 샤드 안에서만 쓰는 번호로 다시 매기고(이름순), terms는 토큰 → 그 번호 목록
+        """
+        table = self.table
+        groups = {}
+        for term_id, term in enumerate(self.terms):
+            groups.setdefault(term[:prefix_len], []).append(term_id)
+
+        shards = {}
+        for key, term_ids in groups.items():
+            members = sorted({row for term_id in term_ids for row in self.postings[term_id]})
+            local = {row: i for i, row in enumerate(members)}
+            rows = [[table.names[row], round(table.lat[row], 6), round(table.lng[row], 6),
+                     table.types.values[table.type_codes[row]], table.osm_ids[row]] for row in members]
+            terms = {self.terms[term_id]: [local[row] for row in self.postings[term_id]] for term_id in term_ids}
+            shards[key] = {'fields': SEARCH_FIELDS, 'rows': rows, 'terms': terms}
+        return shards
+
+
+def shard_filename(key):
+    """샤드 키(임의 문자) → 파일명에 쓸 수 있는 16진수 (클라이언트도 같은 방식으로 찾지 않고 매니페스트에서 조회)"""
+    return key.encode('utf-8').hex()
+
+
+if __name__ == "__main__":
+    near = None
+    for arg in sys.argv[1:]:
+        if arg.startswith('--near='):
+            near = [float(value) for value in arg.split('=', 1)[1].split(',')]
+    query = ' '.join(arg for arg in sys.argv[1:] if not arg.startswith('--'))
+
+    paths = sorted(glob.glob('data/*_facilities.fcol')) or sorted(glob.glob('data/*_facilities.csv'))
+    started = time.perf_counter()
+    index = FacilitySearchIndex.from_files(paths)
+    print(f"🔎 시설 {len(index)}개, 토큰 {len(index.terms)}개 인덱스 구축 ({time.perf_counter() - started:.1f}초)")
+
+    started = time.perf_counter()
+    results = index.search(query, *(near or (None, None)))
+    print(f"'{query}' → '{fold_name(query)}' ({(time.perf_counter() - started) * 1000:.1f}ms)")
+    for facility in results:
+        distance = f"{facility['distance_km']:>8.2f} km  " if 'distance_km' in facility else ''
+        print(f"  {distance}{facility['name']} ({facility['country']}, {facility['type']})")
@@ -0,0 +1,386 @@
+"""
+시설 데이터 컬럼형 저장 포맷 (.fcol)
+
+CSV는 읽을 때마다 모든 행을 문자열 파싱 + float() 변환해야 하므로,
+좌표는 float 배열, type/country는 사전 인코딩(코드 배열), 이름은 오프셋 + UTF-8 블록으로 저장한다.
+읽기는 mmap + memoryview로 필요한 컬럼만 복사 없이 불러온다.
+
+파일 구조:
+    MAGIC(8) | 헤더 길이(uint32) | 헤더 JSON | 패딩 | 컬럼 블록들 (8바이트 정렬)
+"""
+
+import csv
+import json
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+from array import array
+
+from atomic_io import atomic_open
+
+MAGIC = b'FCOL\x00\x01\x00\x00'
+ALIGN = 8
+# 컬럼별 쓰기 버퍼 크기 (넘으면 임시 파일로 내보냄)
+SPOOL_FLUSH_BYTES = 1 << 20
+
+# 시설 레코드 기본 스키마: (컬럼명, 종류)
+FACILITY_COLUMNS = [
+    ('name', 'string'),
+    ('lat', 'float64'),
+    ('lng', 'float64'),
+    ('type', 'dict'),
+    ('country', 'dict'),
+    ('osm_id', 'string')
+]
+
+# 숫자 컬럼 종류 → array typecode
+NUMERIC_TYPECODES = {
+    'float64': 'd',
+    'float32': 'f',
+    'uint8': 'B',
+    'uint16': 'H',
+    'uint32': 'L' if array('L').itemsize == 4 else 'I',
+    'int64': 'q'
+}
+
+
+def _pad(size):
+    return (-size) % ALIGN
+
+
+class _Spool:
+    """컬럼 블록 하나를 임시 파일에 이어 쓰기 (메모리에는 SPOOL_FLUSH_BYTES까지만 보관)"""
+
+    def __init__(self, directory, typecode=None):
+        self.file = tempfile.TemporaryFile(dir=directory)
+        self.buffer = array(typecode) if typecode else bytearray()
+        self.itemsize = self.buffer.itemsize if typecode else 1
+        self.size = 0
+
+    def append(self, value):
+        self.buffer.append(value)
+        if len(self.buffer) * self.itemsize >= SPOOL_FLUSH_BYTES:
+            self.flush()
+
+    def write(self, data):
+        self.buffer += data
+        if len(self.buffer) >= SPOOL_FLUSH_BYTES:
+            self.flush()
+
+    def flush(self):
+        if self.buffer:
+            payload = self.buffer.tobytes() if isinstance(self.buffer, array) else self.buffer
+            self.file.write(payload)
+            self.size += len(payload)
+            del self.buffer[:]
+
+    def copy_to(self, f):
+        self.flush()
+        self.file.seek(0)
+        shutil.copyfileobj(self.file, f)
+
+    def close(self):
+        self.file.close()
+
+
+class _StringColumn:
+    """문자열 컬럼 누적기: 오프셋(uint32) + UTF-8 바이트"""
+
+    def __init__(self, directory):
+        self.offsets = _Spool(directory, NUMERIC_TYPECODES['uint32'])
+        self.data = _Spool(directory)
+        self.length = 0
+        self.offsets.append(0)
+
+    def append(self, value):
+        encoded = ('' if value is None else str(value)).encode('utf-8')
+        self.data.write(encoded)
+        self.length += len(encoded)
+        self.offsets.append(self.length)
+
+    def parts(self):
+        return [('offsets', self.offsets), ('data', self.data)]
+
+
+class _DictColumn:
+    """사전 인코딩 컬럼 누적기: 값 → 코드(uint16)"""
+
+    def __init__(self, directory):
+        self.values = []
+        self.index = {}
+        self.codes = _Spool(directory, NUMERIC_TYPECODES['uint16'])
+
+    def append(self, value):
+        value = '' if value is None else str(value)
+        code = self.index.get(value)
+        if code is None:
+            code = len(self.values)
+            self.index[value] = code
+            self.values.append(value)
+        self.codes.append(code)
+
+    def parts(self):
+        return [('codes', self.codes)]
+
+
+class _NumericColumn:
+    def __init__(self, directory, kind):
+        self.values = _Spool(directory, NUMERIC_TYPECODES[kind])
+        self.append = self.values.append
+        self.cast = float if kind.startswith('float') else int
+
+    def parts(self):
+        return [('values', self.values)]
+
+
+class FacilityStoreWriter:
+    """시설 dict를 한 행씩 받아 .fcol 파일로 저장 (close 시 원자적으로 교체)
+
+    컬럼 블록은 출력 파일과 같은 디렉터리의 임시 파일에 바로 이어 쓰므로 행 수와 무관하게 메모리 사용량이 일정하다.
+    close는 헤더 뒤에 임시 파일들을 차례로 복사하고, abort는 임시 파일만 지운다.
+    """
+
+    def __init__(self, path, columns=None, coord_type='float64', meta=None):
+        self.path = path
+        self.meta = meta or {}
+        self.rows = 0
+        self.schema = []
+        self.columns = {}
+        self.arrays = {}
+
+        directory = os.path.dirname(path) or '.'
+        for name, kind in columns or FACILITY_COLUMNS:
+            # 좌표 정밀도 선택 (float32 = 약 1~2m 정밀도, 크기 절반)
+            if kind == 'float64' and name in ('lat', 'lng'):
+                kind = coord_type
+            self.schema.append((name, kind))
+            if kind == 'string':
+                self.columns[name] = _StringColumn(directory)
+            elif kind == 'dict':
+                self.columns[name] = _DictColumn(directory)
+            else:
+                self.columns[name] = _NumericColumn(directory, kind)
+
+    def append(self, facility):
+        for name, kind in self.schema:
+            column = self.columns[name]
+            value = facility.get(name)
+            column.append(value if kind in ('string', 'dict') else column.cast(value))
+        self.rows += 1
+
+    def extend(self, facilities):
+        for facility in facilities:
+            self.append(facility)
+
+    def add_array(self, name, kind, values):
+        """행과 무관한 보조 숫자 배열 추가 (예: 공간 인덱스의 셀 디렉터리)"""
+        self.arrays[name] = (kind, array(NUMERIC_TYPECODES[kind], values))
+
+    def close(self):
+        blocks = []
+        header_columns = {}
+        offset = 0
+
+        # 블록 위치는 헤더 뒤 기준 상대 오프셋으로 기록
+        for name, kind in self.schema:
+            column = self.columns[name]
+            info = {'kind': kind, 'values': column.values} if kind == 'dict' else {'kind': kind}
+            for part, spool in column.parts():
+                spool.flush()
+                info[part] = [offset, spool.size]
+                blocks.append(spool)
+                offset += spool.size + _pad(spool.size)
+            header_columns[name] = info
+
+        header_arrays = {}
+        for name, (kind, values) in self.arrays.items():
+            payload = values.tobytes()
+            header_arrays[name] = {'kind': kind, 'values': [offset, len(payload)]}
+            blocks.append(payload)
+            offset += len(payload) + _pad(len(payload))
+
+        header = json.dumps({
+            'rows': self.rows,
+            'byteorder': sys.byteorder,
+            'columns': header_columns,
+            'arrays': header_arrays,
+            'meta': self.meta
+        }, ensure_ascii=False).encode('utf-8')
+        header_size = len(MAGIC) + 4 + len(header)
+
+        try:
+            with atomic_open(self.path, 'wb') as f:
+                f.write(MAGIC)
+                f.write(struct.pack('<I', len(header)))
+                f.write(header)
+                f.write(b'\x00' * _pad(header_size))
+                for block in blocks:
+                    if isinstance(block, _Spool):
+                        block.copy_to(f)
+                        size = block.size
+                    else:
+                        f.write(block)
+                        size = len(block)
+                    f.write(b'\x00' * _pad(size))
+        finally:
+            self.abort()
+
+    def abort(self):
+        """저장 취소 (임시 파일 삭제, 기존 파일 유지)"""
+        for column in self.columns.values():
+            for _, spool in column.parts():
+                spool.close()
+        self.columns = {}
+        self.arrays = {}
+
+
+def write_facility_store(path, facilities, **kwargs):
+    """시설 dict 이터러블을 .fcol 파일로 저장하고 행 수 반환"""
+    writer = FacilityStoreWriter(path, **kwargs)
+    writer.extend(facilities)
+    writer.close()
+    return writer.rows
+
+
+class FacilityStore:
+    """.fcol 파일 읽기 (mmap, 필요한 컬럼만 로드)
+
+    숫자/코드 컬럼은 memoryview로 복사 없이 반환되므로 numpy.frombuffer 등에 그대로 넘길 수 있다.
+    close() 전에 반환받은 memoryview는 모두 release() 해야 한다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._mmap[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"{path}: .fcol 파일이 아닙니다")
+
+        (header_len,) = struct.unpack_from('<I', self._mmap, len(MAGIC))
+        header_start = len(MAGIC) + 4
+        header = json.loads(self._mmap[header_start:header_start + header_len].decode('utf-8'))
+        self._base = header_start + header_len + _pad(header_start + header_len)
+
+        self.rows = header['rows']
+        self.meta = header['meta']
+        self.schema = header['columns']
+        self.arrays = header.get('arrays', {})
+        self._swap = header['byteorder'] != sys.byteorder
+        self._cache = {}
+        self._views = {}
+
+    def __len__(self):
+        return self.rows
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def close(self):
+        self._cache = {}
+        for view in self._views.values():
+            view.release()
+        self._views = {}
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    @property
+    def column_names(self):
+        return list(self.schema.keys())
+
+    def _raw(self, part, kind):
+        offset, length = part
+        start = self._base + offset
+        typecode = NUMERIC_TYPECODES[kind]
+
+        if self._swap:
+            # 다른 엔디언에서 만든 파일은 복사 후 바이트 순서 변환
+            values = array(typecode)
+            values.frombytes(self._mmap[start:start + length])
+            values.byteswap()
+            return memoryview(values)
+
+        return memoryview(self._mmap)[start:start + length].cast(typecode)
+
+    def numeric(self, name):
+        """숫자 컬럼 → memoryview (복사 없음)"""
+        info = self.schema[name]
+        return self._raw(info['values'], info['kind'])
+
+    def array(self, name):
+        """보조 숫자 배열 → memoryview (복사 없음)"""
+        info = self.arrays[name]
+        return self._raw(info['values'], info['kind'])
+
+    def codes(self, name):
+        """사전 인코딩 컬럼 → (코드 memoryview, 값 목록)"""
+        info = self.schema[name]
+        return self._raw(info['codes'], 'uint16'), info['values']
+
+    def column(self, name):
+        """컬럼 전체를 파이썬 값 목록/뷰로 반환 (한 번 읽은 컬럼은 캐시)"""
+        if name in self._cache:
+            return self._cache[name]
+
+        kind = self.schema[name]['kind']
+        if kind == 'dict':
+            codes, values = self.codes(name)
+            result = [values[code] for code in codes]
+        elif kind == 'string':
+            info = self.schema[name]
+            offsets = self._raw(info['offsets'], 'uint32')
+            start, length = info['data']
+            blob = self._mmap[self._base + start:self._base + start + length]
+            result = [blob[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(self.rows)]
+            offsets.release()
+        else:
+            result = self.numeric(name)
+
+        self._cache[name] = result
+        return result
+
+    def string(self, name, row):
+        """문자열 컬럼의 한 행만 디코딩"""
+        info = self.schema[name]
+        offsets = self._views.get(name)
+        if offsets is None:
+            offsets = self._views[name] = self._raw(info['offsets'], 'uint32')
+        start, end = offsets[row], offsets[row + 1]
+        base = self._base + info['data'][0]
+        return self._mmap[base + start:base + end].decode('utf-8')
+
+    def iter_rows(self, columns=None):
+        """선택한 컬럼만 dict로 한 행씩 반환"""
+        names = columns or self.column_names
+        data = [self.column(name) for name in names]
+        for i in range(self.rows):
+            yield {name: values[i] for name, values in zip(names, data)}
+
+
+def iter_facility_file(path, columns=None):
+    """CSV(.csv) 또는 컬럼형(.fcol) 시설 파일을 dict로 한 행씩 읽기 (lat/lng는 float)"""
+    if path.endswith('.fcol'):
+        with FacilityStore(path) as store:
+            yield from store.iter_rows(columns)
+        return
+
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        for row in csv.DictReader(f):
+            lat, lng = row.get('lat', '').strip(), row.get('lng', '').strip()
+            if not lat or not lng:
+                continue
+            row['lat'] = float(lat)
+            row['lng'] = float(lng)
+            if columns:
+                row = {name: row.get(name) for name in columns}
+            yield row
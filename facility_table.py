@@ -0,0 +1,176 @@
+"""
+메모리 내 시설 테이블 (컬럼 배열 + 타입/국가별 행 비트맵)
+
+시설 dict 목록 대신 컬럼별 array/list로 보관해 메모리를 줄이고,
+타입/국가 값은 코드로 바꿔(intern) 코드별 행 비트맵(파이썬 int의 비트 i = i번째 행)을 미리 만든다.
+
+- count(types=..., countries=...): 비트맵 AND 후 비트 수 (행을 다시 훑지 않음)
+- select(...) / rows(...): 비트맵에서 켜진 행만 꺼냄 (전체 행을 다시 훑지 않음)
+- type_counts(): 내보내기 매니페스트와 웹 필터 버튼 개수에 그대로 사용
+
+사용법:
+    python facility_table.py data/*_facilities.fcol   → 국가/타입별 개수 표
+"""
+
+import glob
+import sys
+from array import array
+
+from facility_store import iter_facility_file
+
+
+class _Codes:
+    """문자열 값 ↔ 작은 정수 코드"""
+    __slots__ = ('values', 'index')
+
+    def __init__(self):
+        self.values = []
+        self.index = {}
+
+    def code(self, value):
+        code = self.index.get(value)
+        if code is None:
+            code = self.index[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+def _bitmaps(codes, size):
+    """코드 배열 → [코드별 행 비트맵 int]"""
+    buffers = [bytearray((len(codes) + 7) // 8) for _ in range(size)]
+    for row, code in enumerate(codes):
+        buffers[code][row >> 3] |= 1 << (row & 7)
+    return [int.from_bytes(buffer, 'little') for buffer in buffers]
+
+
+def iter_bits(bitmap):
+    """비트맵에서 켜진 비트 위치(행 번호)를 오름차순으로 (바이트 단위로 훑어 빈 구간은 건너뜀)"""
+    data = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, 'little')
+    for offset, byte in enumerate(data):
+        while byte:
+            low = byte & -byte
+            yield (offset << 3) + low.bit_length() - 1
+            byte ^= low
+
+
+class FacilityTable:
+    __slots__ = ('names', 'lat', 'lng', 'osm_ids', 'type_codes', 'country_codes',
+                 'types', 'countries', '_type_bitmaps', '_country_bitmaps')
+
+    def __init__(self):
+        self.names = []
+        self.lat = array('d')
+        self.lng = array('d')
+        self.osm_ids = []
+        self.type_codes = array('H')
+        self.country_codes = array('H')
+        self.types = _Codes()
+        self.countries = _Codes()
+        self._type_bitmaps = None       # 행 추가 후 첫 조회 때 다시 만듦
+        self._country_bitmaps = None
+
+    @classmethod
+    def from_facilities(cls, facilities):
+        table = cls()
+        table.extend(facilities)
+        return table
+
+    @classmethod
+    def from_files(cls, paths):
+        table = cls()
+        for path in paths:
+            table.extend(iter_facility_file(path))
+        return table
+
+    def append(self, facility):
+        self.names.append(facility.get('name') or '')
+        self.lat.append(float(facility['lat']))
+        self.lng.append(float(facility['lng']))
+        self.osm_ids.append(facility.get('osm_id') or '')
+        self.type_codes.append(self.types.code(facility.get('type') or ''))
+        self.country_codes.append(self.countries.code(facility.get('country') or ''))
+        self._type_bitmaps = self._country_bitmaps = None
+
+    def extend(self, facilities):
+        for facility in facilities:
+            self.append(facility)
+
+    def __len__(self):
+        return len(self.names)
+
+    def row(self, i):
+        return {
+            'name': self.names[i],
+            'lat': self.lat[i],
+            'lng': self.lng[i],
+            'type': self.types.values[self.type_codes[i]],
+            'country': self.countries.values[self.country_codes[i]],
+            'osm_id': self.osm_ids[i]
+        }
+
+    def __iter__(self):
+        return (self.row(i) for i in range(len(self)))
+
+    # ---------- 비트맵 ----------
+
+    def _ensure_bitmaps(self):
+        if self._type_bitmaps is None:
+            self._type_bitmaps = _bitmaps(self.type_codes, len(self.types.values))
+            self._country_bitmaps = _bitmaps(self.country_codes, len(self.countries.values))
+
+    @staticmethod
+    def _union(codes, bitmaps, values):
+        """값 하나 또는 목록 → 해당 코드 비트맵들의 OR"""
+        if isinstance(values, str):
+            values = [values]
+        bitmap = 0
+        for value in values:
+            code = codes.index.get(value)
+            if code is not None:
+                bitmap |= bitmaps[code]
+        return bitmap
+
+    def mask(self, types=None, countries=None):
+        """조건에 맞는 행 비트맵 (값 하나 또는 목록, 조건이 없으면 전체 행)"""
+        self._ensure_bitmaps()
+        bitmap = (1 << len(self)) - 1
+        if types is not None:
+            bitmap &= self._union(self.types, self._type_bitmaps, types)
+        if countries is not None:
+            bitmap &= self._union(self.countries, self._country_bitmaps, countries)
+        return bitmap
+
+    def count(self, types=None, countries=None):
+        return self.mask(types, countries).bit_count()
+
+    def select(self, types=None, countries=None):
+        """조건에 맞는 행 번호 목록"""
+        return list(iter_bits(self.mask(types, countries)))
+
+    def rows(self, types=None, countries=None):
+        return [self.row(i) for i in iter_bits(self.mask(types, countries))]
+
+    def type_counts(self, country=None):
+        """{'all': 전체, 타입: 개수, ...} (빈 타입 제외)"""
+        self._ensure_bitmaps()
+        scope = None if country is None else self.mask(countries=country)
+        counts = {'all': len(self) if scope is None else scope.bit_count()}
+        for value, bitmap in zip(self.types.values, self._type_bitmaps):
+            if value:
+                counts[value] = (bitmap if scope is None else bitmap & scope).bit_count()
+        return counts
+
+    def country_counts(self):
+        self._ensure_bitmaps()
+        return {value: bitmap.bit_count() for value, bitmap in zip(self.countries.values, self._country_bitmaps) if value}
+
+
+if __name__ == "__main__":
+    paths = [path for arg in sys.argv[1:] for path in sorted(glob.glob(arg))] or sorted(glob.glob('data/*_facilities.fcol'))
+    table = FacilityTable.from_files(paths)
+    types = [value for value in table.types.values if value]
+
+    print(f"{'country':<18}" + ''.join(f"{value:>15}" for value in ['all'] + types))
+    for country in sorted(table.country_counts()):
+        counts = table.type_counts(country)
+        print(f"{country:<18}" + ''.join(f"{counts.get(value, 0):>15}" for value in ['all'] + types))
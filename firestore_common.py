@@ -0,0 +1,297 @@
+"""
+Firestore 공통 도구 (업로드/정리 스크립트 공용)
+
+- Firebase 클라이언트 초기화 (서비스 계정 키 / FIRESTORE_EMULATOR_HOST 에뮬레이터)
+- 여러 batch를 동시에 커밋하고 일시적 오류로 실패한 batch만 백오프 후 재시도
+- 네트워크 없이 동작 확인용 FakeFirestoreClient (--fake)
+"""
+
+import hashlib
+import os
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+# Firestore batch 하나당 최대 쓰기 수
+MAX_BATCH_WRITES = 500
+DEFAULT_KEY_PATH = os.environ.get('FIREBASE_KEY_PATH', 'bangdeng-key.json')
+# 다시 커밋하면 성공할 수 있는 오류 (google.api_core.exceptions 클래스 이름)
+# 잘못된 인자(InvalidArgument), 권한 없음(PermissionDenied) 등은 재시도해도 같은 결과 → 바로 실패 처리
+TRANSIENT_ERRORS = ('Aborted', 'DeadlineExceeded', 'InternalServerError', 'ServiceUnavailable',
+                    'TooManyRequests', 'ResourceExhausted', 'GatewayTimeout')
+
+
+def init_firestore(key_path=None):
+    """Firestore 클라이언트 생성 (FIRESTORE_EMULATOR_HOST가 있으면 에뮬레이터, 키 파일 불필요)"""
+    import firebase_admin
+    from firebase_admin import credentials, firestore
+
+    if not firebase_admin._apps:
+        if os.environ.get('FIRESTORE_EMULATOR_HOST'):
+            firebase_admin.initialize_app(options={
+                'projectId': os.environ.get('GCLOUD_PROJECT', 'demo-bangdeng')
+            })
+        else:
+            firebase_admin.initialize_app(credentials.Certificate(key_path or DEFAULT_KEY_PATH))
+
+    return firestore.client()
+
+
+def get_client(fake=False, key_path=None):
+    return FakeFirestoreClient() if fake else init_firestore(key_path)
+
+
+def facility_doc_id(facility):
+    """시설 → 결정적 문서 ID (재실행 시 중복 추가 대신 덮어쓰기)
+
+    OSM id가 있으면 'node-123' 형식, 없으면 좌표(소수 6자리)+이름 해시
+    """
+    osm_id = facility.get('osm_id')
+    if osm_id:
+        return str(osm_id).replace('/', '-')
+
+    name = ' '.join(str(facility.get('name') or '').casefold().split())
+    key = f"{float(facility['lat']):.6f},{float(facility['lng']):.6f},{name}"
+    return 'h-' + hashlib.sha1(key.encode('utf-8')).hexdigest()[:20]
+
+
+def is_transient_error(error):
+    """재시도할 오류인지 (네트워크 끊김/시간 초과 + TRANSIENT_ERRORS, firebase_admin 없이도 판별)"""
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return True
+    return any(cls.__name__ in TRANSIENT_ERRORS for cls in type(error).__mro__)
+
+
+def collection_for(country):
+    """국가 코드 → 웹 앱(js/global-app.js)이 읽는 컬렉션 이름"""
+    return f"{country}_locations"
+
+
+class BatchWriter:
+    """(종류, 문서 참조, 데이터) 작업을 batch로 묶어 동시에 커밋
+
+    - 동시에 진행 중인 batch 수를 max_workers * 2로 제한해 메모리 사용량 고정
+    - 일시적 오류(is_transient_error)로 실패한 batch는 지수 백오프(+지터)로 max_retries번까지 다시 커밋
+    """
+
+    def __init__(self, db, batch_size=MAX_BATCH_WRITES, max_workers=8, max_retries=5, base_delay=0.5):
+        self.db = db
+        self.batch_size = min(batch_size, MAX_BATCH_WRITES)
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.stats = {'writes': 0, 'batches': 0, 'retries': 0, 'failed_batches': 0, 'failed_writes': 0, 'seconds': 0.0}
+        self._lock = threading.Lock()
+
+    def _commit(self, operations):
+        for attempt in range(self.max_retries + 1):
+            batch = self.db.batch()
+            for kind, ref, data in operations:
+                if kind == 'delete':
+                    batch.delete(ref)
+                else:
+                    batch.set(ref, data)
+            try:
+                batch.commit()
+                break
+            except Exception as e:
+                if attempt == self.max_retries or not is_transient_error(e):
+                    print(f"❌ batch 커밋 실패 ({len(operations)}건): {e}")
+                    with self._lock:
+                        self.stats['failed_batches'] += 1
+                        self.stats['failed_writes'] += len(operations)
+                    return
+                with self._lock:
+                    self.stats['retries'] += 1
+                time.sleep(self.base_delay * 2 ** attempt * (1 + random.random()))
+
+        with self._lock:
+            self.stats['writes'] += len(operations)
+            self.stats['batches'] += 1
+
+    def run(self, operations, progress_every=10):
+        """작업 이터러블을 모두 커밋하고 통계 반환 (progress_every batch마다 진행 상황 출력)"""
+        start = time.time()
+        pending = set()
+        submitted = 0
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            chunk = []
+            for operation in operations:
+                chunk.append(operation)
+                if len(chunk) < self.batch_size:
+                    continue
+
+                if len(pending) >= self.max_workers * 2:
+                    _, pending = wait(pending, return_when=FIRST_COMPLETED)
+                pending.add(executor.submit(self._commit, chunk))
+                chunk = []
+                submitted += 1
+                if progress_every and submitted % progress_every == 0:
+                    self.print_progress(start)
+
+            if chunk:
+                pending.add(executor.submit(self._commit, chunk))
+            wait(pending)
+
+        self.stats['seconds'] = time.time() - start
+        return self.stats
+
+    def print_progress(self, start):
+        elapsed = max(time.time() - start, 1e-9)
+        print(f"  ... {self.stats['writes']}건 커밋 ({self.stats['writes'] / elapsed:.0f}건/초)")
+
+    def summary(self):
+        seconds = max(self.stats['seconds'], 1e-9)
+        return (f"{self.stats['writes']}건 / batch {self.stats['batches']}개 / {self.stats['seconds']:.1f}초 "
+                f"({self.stats['writes'] / seconds:.0f}건/초, 재시도 {self.stats['retries']}, "
+                f"실패 batch {self.stats['failed_batches']})")
+
+
+class FakeDocumentReference:
+    def __init__(self, collection, doc_id):
+        self._collection = collection
+        self.id = doc_id
+
+    @property
+    def path(self):
+        return f"{self._collection.id}/{self.id}"
+
+    def set(self, data):
+        self._collection._docs[self.id] = dict(data)
+
+    def delete(self):
+        self._collection._docs.pop(self.id, None)
+
+    def get(self):
+        return FakeDocumentSnapshot(self, self._collection._docs.get(self.id))
+
+
+class FakeDocumentSnapshot:
+    def __init__(self, reference, data):
+        self.reference = reference
+        self.id = reference.id
+        self._data = data
+
+    @property
+    def exists(self):
+        return self._data is not None
+
+    def to_dict(self):
+        return None if self._data is None else dict(self._data)
+
+
+class FakeQuery:
+    """where(==)/order_by/start_after/limit/select만 지원하는 쿼리 대역"""
+
+    def __init__(self, collection, filters=(), order=None, cursor=None, count=None):
+        self._collection = collection
+        self._filters = tuple(filters)
+        self._order = order
+        self._cursor = cursor
+        self._count = count
+
+    def _copy(self, **changes):
+        state = dict(filters=self._filters, order=self._order, cursor=self._cursor, count=self._count)
+        state.update(changes)
+        return FakeQuery(self._collection, **state)
+
+    def where(self, field, op, value):
+        if op != '==':
+            raise NotImplementedError(f"FakeQuery는 '==' 조건만 지원합니다: {op}")
+        return self._copy(filters=self._filters + ((field, value),))
+
+    def order_by(self, field):
+        if field != '__name__':
+            raise NotImplementedError("FakeQuery는 문서 ID('__name__') 정렬만 지원합니다")
+        return self._copy(order=field)
+
+    def start_after(self, snapshot):
+        return self._copy(cursor=snapshot.id)
+
+    def limit(self, count):
+        return self._copy(count=count)
+
+    def select(self, field_paths):
+        return self
+
+    def stream(self):
+        collection = self._collection
+        with collection._client._lock:
+            items = sorted(collection._docs.items())
+        returned = 0
+        for doc_id, data in items:
+            if self._cursor is not None and doc_id <= self._cursor:
+                continue
+            if any(data.get(field) != value for field, value in self._filters):
+                continue
+            if self._count is not None and returned >= self._count:
+                break
+            returned += 1
+            yield FakeDocumentSnapshot(FakeDocumentReference(collection, doc_id), data)
+
+
+class FakeCollectionReference(FakeQuery):
+    def __init__(self, client, name):
+        self._client = client
+        self.id = name
+        self._docs = client._store.setdefault(name, {})
+        super().__init__(self)
+
+    def document(self, doc_id=None):
+        if doc_id is None:
+            doc_id = hashlib.sha1(f"{self.id}{len(self._docs)}{random.random()}".encode()).hexdigest()[:20]
+        return FakeDocumentReference(self, doc_id)
+
+    def add(self, data):
+        ref = self.document()
+        ref.set(data)
+        return None, ref
+
+
+class FakeWriteBatch:
+    def __init__(self, client):
+        self._client = client
+        self._writes = []
+
+    def set(self, ref, data):
+        self._writes.append((ref, dict(data)))
+
+    def delete(self, ref):
+        self._writes.append((ref, None))
+
+    def commit(self):
+        if len(self._writes) > MAX_BATCH_WRITES:
+            raise ValueError(f"batch 쓰기 수 초과: {len(self._writes)}")
+        if self._client.fail_rate and random.random() < self._client.fail_rate:
+            raise ConnectionError("fake commit 실패")
+        if self._client.latency:
+            time.sleep(self._client.latency)
+        with self._client._lock:
+            for ref, data in self._writes:
+                if data is None:
+                    ref.delete()
+                else:
+                    ref.set(data)
+        self._client.commits += 1
+
+
+class FakeFirestoreClient:
+    """메모리 안에서 동작하는 Firestore 대역 (collection/document/batch/단순 쿼리만 지원)
+
+    latency: batch 커밋마다 대기 시간(초), fail_rate: 커밋 실패 확률 — 재시도/동시성 확인용
+    """
+
+    def __init__(self, latency=0.0, fail_rate=0.0):
+        self.latency = latency
+        self.fail_rate = fail_rate
+        self.commits = 0
+        self._store = {}
+        self._lock = threading.Lock()
+
+    def collection(self, name):
+        return FakeCollectionReference(self, name)
+
+    def batch(self):
+        return FakeWriteBatch(self)
@@ -0,0 +1,91 @@
+"""
+Firestore 컬렉션 정리 도구 (quick_clean.py, quick_clean_firestore.py, check_before_delete.py 통합)
+
+- 컬렉션 전체를 list(stream())으로 메모리에 올리지 않고 커서(start_after)로 페이지 단위 조회
+- 문서를 하나씩 delete() 하지 않고 batch 삭제를 여러 개 동시에 커밋 (firestore_common.BatchWriter)
+- --dry-run: 삭제 대상 수와 미리보기만 출력
+- --country / --type: 해당 필드가 일치하는 문서만 대상
+
+사용법:
+    python firestore_purge.py locations --dry-run
+    python firestore_purge.py bangladesh_locations --type=aid
+    python firestore_purge.py locations --country=bangladesh --yes   → 확인 질문 없이 삭제
+"""
+
+import sys
+import time
+
+from firestore_common import BatchWriter, get_client
+
+
+class FirestorePurger:
+    def __init__(self, db, collection, filters=None, page_size=500, max_workers=8):
+        self.db = db
+        self.collection = collection
+        self.filters = filters or {}    # {필드: 값} (== 조건)
+        self.page_size = page_size
+        self.writer = BatchWriter(db, max_workers=max_workers)
+
+    def base_query(self):
+        query = self.db.collection(self.collection)
+        for field, value in self.filters.items():
+            query = query.where(field, '==', value)
+        return query.order_by('__name__')
+
+    def iter_documents(self, fields=('name', 'type')):
+        """조건에 맞는 문서 스냅샷을 page_size개씩 커서로 이어서 조회"""
+        query = self.base_query().select(list(fields))
+        last = None
+        while True:
+            page = query.start_after(last) if last is not None else query
+            docs = list(page.limit(self.page_size).stream())
+            yield from docs
+            if len(docs) < self.page_size:
+                return
+            last = docs[-1]
+
+    def preview(self, sample=3):
+        """(대상 문서 수, 처음 sample개 문서 데이터) — 삭제하지 않음"""
+        count = 0
+        samples = []
+        for doc in self.iter_documents():
+            if len(samples) < sample:
+                samples.append(doc.to_dict())
+            count += 1
+        return count, samples
+
+    def purge(self):
+        """조건에 맞는 문서를 batch 단위로 동시에 삭제 → BatchWriter 통계 (문서 ID만 조회)"""
+        operations = (('delete', doc.reference, None) for doc in self.iter_documents(fields=('__name__',)))
+        return self.writer.run(operations)
+
+
+if __name__ == "__main__":
+    options = dict(arg[2:].partition('=')[::2] for arg in sys.argv[1:] if arg.startswith('--'))
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    collection = args[0] if args else 'locations'
+    filters = {field: options[field] for field in ('country', 'type') if options.get(field)}
+
+    db = get_client(fake='fake' in options, key_path=options.get('key'))
+    purger = FirestorePurger(db, collection, filters, max_workers=int(options.get('workers') or 8))
+    condition = ', '.join(f"{field}={value}" for field, value in filters.items()) or '전체'
+
+    start = time.time()
+    count, samples = purger.preview()
+    print(f"🔍 '{collection}' ({condition}): {count}개 문서 ({time.time() - start:.1f}초)")
+    if samples:
+        print("처음 3개 미리보기:")
+        for i, data in enumerate(samples):
+            print(f"{i+1}. {data.get('name')} - {data.get('type')}")
+
+    if 'dry-run' in options or count == 0:
+        sys.exit(0)
+
+    if 'yes' not in options:
+        answer = input("\n정말 모두 삭제하시겠습니까? (yes/no): ")
+        if answer.lower() != 'yes':
+            print("❌ 취소되었습니다.")
+            sys.exit(0)
+
+    purger.purge()
+    print(f"✅ 삭제 완료: {purger.writer.summary()}")
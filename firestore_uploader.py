@@ -0,0 +1,133 @@
+"""
+Firestore 일괄 업로드 (scripts/upload_to_firestore.py, scripts/processing/upload_to_firestore.py 통합)
+
+- 문서 ID를 OSM id / 좌표+이름 해시로 고정 → 다시 실행해도 중복 없이 덮어쓰기(upsert)
+- batch(최대 500건) 여러 개를 동시에 커밋, 실패한 batch는 백오프 후 재시도
+- 입력: 수집기 출력(.fcol/.csv), facility_dedup 결과, 가공 JSON(.json, 레코드 목록)
+  가공 JSON은 DOCUMENT_FIELDS 밖의 필드(service_type 목록 등)도 그대로 저장 (이전 scripts/processing 업로드와 같음)
+
+사용법:
+    python firestore_uploader.py data/papua_new_guinea_facilities.fcol
+    python firestore_uploader.py --collection=locations data/processed/processed_locations_*.json
+    python firestore_uploader.py --collection=locations data/processed/deduped_facilities.csv
+    python firestore_uploader.py --fake data/*_facilities.fcol      → 메모리 대역으로 처리량만 확인
+    python firestore_uploader.py --changes data/sync/*_changes_*.json → delta_sync 변경분만 반영 (삭제 포함)
+    FIRESTORE_EMULATOR_HOST=localhost:8080 python firestore_uploader.py data/...   → 에뮬레이터
+"""
+
+import glob
+import json
+import sys
+
+from facility_store import iter_facility_file
+from firestore_common import BatchWriter, collection_for, facility_doc_id, get_client
+
+# Firestore 문서에 저장할 필드 (sources 같은 큰 필드는 제외)
+DOCUMENT_FIELDS = ('name', 'address', 'lat', 'lng', 'type', 'country', 'osm_id', 'source_count')
+
+
+def facility_document(facility, extra_fields=False):
+    """시설 dict → Firestore 문서 데이터 (빈 값 제외, type은 소문자)
+
+    extra_fields=True면 DOCUMENT_FIELDS 밖의 필드도 값 그대로 포함 (가공 JSON 입력)
+    """
+    data = {}
+    if extra_fields:
+        data.update((field, value) for field, value in facility.items()
+                    if field not in DOCUMENT_FIELDS and value is not None and value != '')
+    for field in DOCUMENT_FIELDS:
+        value = facility.get(field)
+        if value is None or value == '':
+            continue
+        if field in ('lat', 'lng'):
+            value = float(value)
+        elif field == 'source_count':
+            value = int(value)
+        elif field == 'type':
+            value = str(value).strip().lower()
+        elif isinstance(value, str):
+            value = value.strip()
+        data[field] = value
+    return data
+
+
+def load_json_records(path):
+    """가공 JSON(레코드 dict 목록) → 시설 dict 목록 (lat/lng 없는 레코드는 제외)"""
+    with open(path, encoding='utf-8') as f:
+        records = json.load(f)
+    if not isinstance(records, list):
+        raise ValueError(f"{path}: 레코드 목록(JSON 배열)이 아닙니다")
+    return [record for record in records
+            if isinstance(record, dict) and record.get('lat') not in (None, '') and record.get('lng') not in (None, '')]
+
+
+class FirestoreUploader:
+    def __init__(self, db, collection=None, max_workers=8, batch_size=500):
+        self.db = db
+        self.collection = collection    # None이면 시설의 country로 '{country}_locations'
+        self.writer = BatchWriter(db, batch_size=batch_size, max_workers=max_workers)
+        self.skipped = 0
+
+    def collection_name(self, facility):
+        if self.collection:
+            return self.collection
+        country = facility.get('country')
+        return collection_for(country) if country else 'locations'
+
+    def iter_operations(self, facilities, action='set', extra_fields=False):
+        for facility in facilities:
+            try:
+                data = facility_document(facility, extra_fields) if action == 'set' else None
+                ref = self.db.collection(self.collection_name(facility)).document(facility_doc_id(facility))
+            except (KeyError, TypeError, ValueError) as e:
+                self.skipped += 1
+                print(f"⚠️ 건너뜀: {facility.get('name', '이름 없음')} - {e}")
+                continue
+            yield action, ref, data
+
+    def upload(self, facilities):
+        """시설 이터러블 업로드 → BatchWriter 통계"""
+        return self.writer.run(self.iter_operations(facilities))
+
+    def upload_files(self, paths):
+        def operations():
+            for path in paths:
+                print(f"📂 {path}")
+                if path.endswith('.json'):
+                    yield from self.iter_operations(load_json_records(path), extra_fields=True)
+                else:
+                    yield from self.iter_operations(iter_facility_file(path))
+        return self.writer.run(operations())
+
+    def upload_changes(self, paths):
+        """delta_sync 변경 내역 파일 → 추가/수정은 set, 삭제는 delete"""
+        from delta_sync import iter_changes
+
+        def operations():
+            for action, facility in iter_changes(paths):
+                yield from self.iter_operations([facility], action)
+        return self.writer.run(operations())
+
+
+if __name__ == "__main__":
+    options = dict(arg[2:].partition('=')[::2] for arg in sys.argv[1:] if arg.startswith('--'))
+    paths = [path for arg in sys.argv[1:] if not arg.startswith('--') for path in sorted(glob.glob(arg))]
+
+    if not paths:
+        print("업로드할 파일이 없습니다.")
+        sys.exit(1)
+
+    db = get_client(fake='fake' in options, key_path=options.get('key'))
+    uploader = FirestoreUploader(
+        db,
+        collection=options.get('collection') or None,
+        max_workers=int(options.get('workers') or 8)
+    )
+    if 'changes' in options:
+        uploader.upload_changes(paths)
+    else:
+        uploader.upload_files(paths)
+
+    print(f"\n✅ 업로드 완료: {uploader.writer.summary()}")
+    if uploader.skipped:
+        print(f"⚠️ 변환 실패로 건너뛴 시설: {uploader.skipped}개")
@@ -3,80 +3,26 @@
 Phase 1: 핵심 10개국
 """
 
+from country_registry import COUNTRIES
+
+# 뎅기열 고위험 핵심 10개국 (국가 정보는 country_registry 공용)
+PHASE1_COUNTRIES = [
+    'bangladesh', 'nigeria', 'brazil', 'thailand', 'indonesia',
+    'philippines', 'india', 'vietnam', 'malaysia', 'sri_lanka'
+]
+
+
 class GlobalDengueSystem:
     def __init__(self):
-        # 뎅기열 고위험 핵심 10개국
         self.countries = {
-            'bangladesh': {
-                'name': 'Bangladesh',
-                'center': [23.6850, 90.3563],
-                'zoom': 7,
-                'language': ['en', 'bn'],
-                'currency': 'BDT'
-            },
-            'nigeria': {
-                'name': 'Nigeria', 
-                'center': [9.0820, 8.6753],
-                'zoom': 6,
-                'language': ['en', 'ha'],
-                'currency': 'NGN'
-            },
-            'brazil': {
-                'name': 'Brazil',
-                'center': [-14.2350, -51.9253], 
-                'zoom': 4,
-                'language': ['pt', 'en'],
-                'currency': 'BRL'
-            },
-            'thailand': {
-                'name': 'Thailand',
-                'center': [15.8700, 100.9925],
-                'zoom': 6,
-                'language': ['th', 'en'],
-                'currency': 'THB'
-            },
-            'indonesia': {
-                'name': 'Indonesia',
-                'center': [-0.7893, 113.9213],
-                'zoom': 5,
-                'language': ['id', 'en'],
-                'currency': 'IDR'
-            },
-            'philippines': {
-                'name': 'Philippines',
-                'center': [12.8797, 121.7740],
-                'zoom': 6,
-                'language': ['tl', 'en'],
-                'currency': 'PHP'
-            },
-            'india': {
-                'name': 'India',
-                'center': [20.5937, 78.9629],
-                'zoom': 5,
-                'language': ['hi', 'en'],
-                'currency': 'INR'
-            },
-            'vietnam': {
-                'name': 'Vietnam',
-                'center': [14.0583, 108.2772],
-                'zoom': 6,
-                'language': ['vi', 'en'],
-                'currency': 'VND'
-            },
-            'malaysia': {
-                'name': 'Malaysia',
-                'center': [4.2105, 101.9758],
-                'zoom': 6,
-                'language': ['ms', 'en'],
-                'currency': 'MYR'
-            },
-            'sri_lanka': {
-                'name': 'Sri Lanka',
-                'center': [7.8731, 80.7718],
-                'zoom': 7,
-                'language': ['si', 'en'],
-                'currency': 'LKR'
+            code: {
+                'name': COUNTRIES[code]['name'],
+                'center': COUNTRIES[code]['center'],
+                'zoom': COUNTRIES[code]['zoom'],
+                'language': COUNTRIES[code]['languages'],
+                'currency': COUNTRIES[code]['currency']
             }
+            for code in PHASE1_COUNTRIES
         }
         
         # 뎅기열 전용 시설 타입
@@ -27,7 +27,7 @@ let markerClusterGroup;
 // Service Worker 등록
 if ('serviceWorker' in navigator) {
     window.addEventListener('load', () => {
-        navigator.serviceWorker.register('/service-worker.js')
+        navigator.serviceWorker.register('/app/service-worker.js', { scope: '/' })
             .then(registration => {
                 console.log('Service Worker 등록 성공:', registration.scope);
             })
@@ -44,20 +44,8 @@ function detectUserLanguage() {
 }
 
 async function loadTranslations(lang) {
-    // 임시로 하드코딩된 번역
-    const hardcodedTranslations = {
-        "report_title": "Share Dengue-Related Location",
-        "email": "Email", 
-        "country": "Country",
-        "facility_type": "Facility Type",
-        "description": "Description",
-        "description_placeholder": "Please describe the location, address, and services...",
-        "attachment": "Attachment",
-        "submit_report": "Submit Report",
-        "select_country": "Select Country"
-    };
-    
-    translations[lang] = hardcodedTranslations;
+    // 번역 번들 (js/locales.js, build_locales.py로 생성)
+    translations[lang] = await loadLocale(lang);
     console.log("Loaded translations:", translations[lang]);
     return translations[lang];
 }
@@ -271,15 +259,19 @@ function loadPlacesData() {
 
 // 필터 버튼에 개수 표시 업데이트
 function updateFilterButtonCounts() {
+    // 타입마다 filter()로 다시 훑지 않고 한 번의 순회로 계산
     const typeCounts = {
         'all': allPlacesData.length,
-        'hospital': allPlacesData.filter(p => p.type === 'hospital').length,
-        'pharmacy': allPlacesData.filter(p => p.type === 'pharmacy').length,
-        'vaccine': allPlacesData.filter(p => p.type === 'vaccine').length,
-        'blood_test': allPlacesData.filter(p => p.type === 'blood_test').length,
-        'aid': allPlacesData.filter(p => p.type === 'aid').length,
-        'dengue_center': allPlacesData.filter(p => p.type === 'dengue_center').length
+        'hospital': 0,
+        'pharmacy': 0,
+        'vaccine': 0,
+        'blood_test': 0,
+        'aid': 0,
+        'dengue_center': 0
     };
+    allPlacesData.forEach(p => {
+        if (p.type in typeCounts && p.type !== 'all') typeCounts[p.type]++;
+    });
     
     Object.keys(typeCounts).forEach(type => {
         const button = document.querySelector(`[data-filter="${type}"]`);
@@ -0,0 +1,35 @@
+// 자동 생성 파일 — 수정하지 말고 country_registry.py를 고친 뒤 python country_registry.py --js 실행
+// 국가 정보
+const COUNTRIES = {
+    'bangladesh': { name: "Bangladesh", center: [23.685, 90.3563], zoom: 7, languages: ["en", "bn", "ko"], localLang: "bn", localName: "বাংলাদেশ", flag: "🇧🇩", iso2: "BD", bbox: [88.0, 20.0, 92.1, 26.6] },
+    'thailand': { name: "Thailand", center: [15.87, 100.9925], zoom: 6, languages: ["en", "th", "ko"], localLang: "th", localName: "ประเทศไทย", flag: "🇹🇭", iso2: "TH", bbox: [97.3, 5.6, 105.6, 20.5] },
+    'vietnam': { name: "Vietnam", center: [14.0583, 108.2772], zoom: 6, languages: ["en", "vi", "ko"], localLang: "vi", localName: "Việt Nam", flag: "🇻🇳", iso2: "VN", bbox: [102.14, 8.18, 109.46, 23.39] },
+    'indonesia': { name: "Indonesia", center: [-0.7893, 113.9213], zoom: 5, languages: ["en", "id", "ko"], localLang: "id", localName: "Indonesia", flag: "🇮🇩", iso2: "ID", bbox: [95.0, -11.0, 141.0, 6.0] },
+    'philippines': { name: "Philippines", center: [12.8797, 121.774], zoom: 6, languages: ["en", "tl", "ko"], localLang: "tl", localName: "Pilipinas", flag: "🇵🇭", iso2: "PH", bbox: [116.0, 4.0, 126.0, 21.0] },
+    'malaysia': { name: "Malaysia", center: [4.2105, 101.9758], zoom: 6, languages: ["en", "ms", "ko"], localLang: "ms", localName: "Malaysia", flag: "🇲🇾", iso2: "MY", bbox: [100.0, 0.5, 120.0, 7.5] },
+    'singapore': { name: "Singapore", center: [1.3521, 103.8198], zoom: 11, languages: ["en", "zh", "ko"], localLang: "zh", localName: "新加坡", flag: "🇸🇬", iso2: "SG", bbox: [103.6, 1.2, 104.1, 1.5] },
+    'laos': { name: "Laos", center: [19.8563, 102.4955], zoom: 6, languages: ["en", "lo", "ko"], localLang: "lo", localName: "ລາວ", flag: "🇱🇦", iso2: "LA", bbox: [100.1, 13.9, 107.7, 22.5] },
+    'cambodia': { name: "Cambodia", center: [12.5657, 104.991], zoom: 7, languages: ["en", "km", "ko"], localLang: "km", localName: "កម្ពុជា", flag: "🇰🇭", iso2: "KH", bbox: [102.3, 10.4, 107.6, 14.7] },
+    'myanmar': { name: "Myanmar", center: [21.9162, 95.956], zoom: 6, languages: ["en", "my", "ko"], localLang: "my", localName: "မြန်မာ", flag: "🇲🇲", iso2: "MM", bbox: [92.2, 9.5, 101.2, 28.5] },
+    'india': { name: "India", center: [20.5937, 78.9629], zoom: 5, languages: ["en", "hi", "ko"], localLang: "hi", localName: "भारत", flag: "🇮🇳", iso2: "IN", bbox: [68.7, 6.7, 97.25, 35.5] },
+    'sri_lanka': { name: "Sri Lanka", center: [7.8731, 80.7718], zoom: 7, languages: ["en", "si", "ko"], localLang: "si", localName: "ශ්‍රී ලංකා", flag: "🇱🇰", iso2: "LK", bbox: [79.6, 5.9, 81.9, 9.8] },
+    'pakistan': { name: "Pakistan", center: [30.3753, 69.3451], zoom: 5, languages: ["en", "ur", "ko"], localLang: "ur", localName: "پاکستان", flag: "🇵🇰", iso2: "PK", bbox: [60.9, 23.6, 77.0, 37.0] },
+    'brazil': { name: "Brazil", center: [-14.235, -51.9253], zoom: 4, languages: ["en", "pt", "ko"], localLang: "pt", localName: "Brasil", flag: "🇧🇷", iso2: "BR", bbox: [-74.0, -33.0, -34.0, 5.3] },
+    'colombia': { name: "Colombia", center: [4.5709, -74.2973], zoom: 5, languages: ["en", "es", "ko"], localLang: "es", localName: "Colombia", flag: "🇨🇴", iso2: "CO", bbox: [-79.0, -4.2, -66.9, 13.4] },
+    'venezuela': { name: "Venezuela", center: [6.4238, -66.5897], zoom: 6, languages: ["en", "es", "ko"], localLang: "es", localName: "Venezuela", flag: "🇻🇪", iso2: "VE", bbox: [-73.4, 0.6, -59.8, 12.2] },
+    'peru': { name: "Peru", center: [-9.19, -75.0152], zoom: 5, languages: ["en", "es", "ko"], localLang: "es", localName: "Perú", flag: "🇵🇪", iso2: "PE", bbox: [-84.0, -18.3, -68.6, 0.2] },
+    'ecuador': { name: "Ecuador", center: [-1.8312, -78.1834], zoom: 6, languages: ["en", "es", "ko"], localLang: "es", localName: "Ecuador", flag: "🇪🇨", iso2: "EC", bbox: [-92.0, -5.0, -75.2, 2.3] },
+    'mexico': { name: "Mexico", center: [23.6345, -102.5528], zoom: 5, languages: ["en", "es", "ko"], localLang: "es", localName: "México", flag: "🇲🇽", iso2: "MX", bbox: [-118.5, 14.5, -86.7, 32.7] },
+    'argentina': { name: "Argentina", center: [-38.4161, -63.6167], zoom: 4, languages: ["en", "es", "ko"], localLang: "es", localName: "Argentina", flag: "🇦🇷", iso2: "AR", bbox: [-73.6, -55.1, -53.6, -21.8] },
+    'nigeria': { name: "Nigeria", center: [9.082, 8.6753], zoom: 6, languages: ["en", "ha", "ko"], localLang: "ha", localName: "Najeriya", flag: "🇳🇬", iso2: "NG", bbox: [2.7, 4.3, 14.7, 13.9] },
+    'kenya': { name: "Kenya", center: [-0.0236, 37.9062], zoom: 6, languages: ["en", "sw", "ko"], localLang: "sw", localName: "Kenya", flag: "🇰🇪", iso2: "KE", bbox: [33.8, -4.7, 41.9, 5.0] },
+    'tanzania': { name: "Tanzania", center: [-6.369, 34.8888], zoom: 6, languages: ["en", "sw", "ko"], localLang: "sw", localName: "Tanzania", flag: "🇹🇿", iso2: "TZ", bbox: [29.3, -11.7, 40.4, 0.9] },
+    'uganda': { name: "Uganda", center: [1.3733, 32.2903], zoom: 7, languages: ["en", "lg", "ko"], localLang: "lg", localName: "Uganda", flag: "🇺🇬", iso2: "UG", bbox: [29.6, -1.5, 35.0, 4.2] },
+    'australia': { name: "Australia", center: [-25.2744, 133.7751], zoom: 4, languages: ["en", "ko"], localLang: "en", localName: "Australia", flag: "🇦🇺", iso2: "AU", bbox: [113.3, -43.7, 153.6, -10.7] },
+    'fiji': { name: "Fiji", center: [-16.7784, 179.4144], zoom: 8, languages: ["en", "fj", "ko"], localLang: "fj", localName: "Viti", flag: "🇫🇯", iso2: "FJ", bbox: [177.9, -19.5, -178.4, -16.0] },
+    'papua_new_guinea': { name: "Papua New Guinea", center: [-6.3149, 143.9555], zoom: 6, languages: ["en", "tpi", "ko"], localLang: "tpi", localName: "Papua Niugini", flag: "🇵🇬", iso2: "PG", bbox: [140.8, -11.6, 156.0, -1.0] }
+};
+
+if (typeof module !== 'undefined') {
+    module.exports = { COUNTRIES };
+}
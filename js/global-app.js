@@ -8,118 +8,16 @@ let map;
 let currentLang = 'en';
 let currentCountry = 'bangladesh';
 let translations = {};
+let currentFilter = 'all';
 
-// 국가 정보
-const COUNTRIES = {
-    'bangladesh': {
-        name: 'Bangladesh', center: [23.6850, 90.3563], zoom: 7,
-        languages: ['en', 'bn', 'ko'], localLang: 'bn', localName: 'বাংলাদেশ', flag: '🇧🇩'
-    },
-    'thailand': {
-        name: 'Thailand', center: [15.8700, 100.9925], zoom: 6,
-        languages: ['en', 'th', 'ko'], localLang: 'th', localName: 'ประเทศไทย', flag: '🇹🇭'
-    },
-    'vietnam': {
-        name: 'Vietnam', center: [14.0583, 108.2772], zoom: 6,
-        languages: ['en', 'vi', 'ko'], localLang: 'vi', localName: 'Việt Nam', flag: '🇻🇳'
-    },
-    'indonesia': {
-        name: 'Indonesia', center: [-0.7893, 113.9213], zoom: 5,
-        languages: ['en', 'id', 'ko'], localLang: 'id', localName: 'Indonesia', flag: '🇮🇩'
-    },
-    'philippines': {
-        name: 'Philippines', center: [12.8797, 121.7740], zoom: 6,
-        languages: ['en', 'tl', 'ko'], localLang: 'tl', localName: 'Pilipinas', flag: '🇵🇭'
-    },
-    'malaysia': {
-        name: 'Malaysia', center: [4.2105, 101.9758], zoom: 6,
-        languages: ['en', 'ms', 'ko'], localLang: 'ms', localName: 'Malaysia', flag: '🇲🇾'
-    },
-    'singapore': {
-        name: 'Singapore', center: [1.3521, 103.8198], zoom: 11,
-        languages: ['en', 'zh', 'ko'], localLang: 'zh', localName: '新加坡', flag: '🇸🇬'
-    },
-    'laos': {
-        name: 'Laos', center: [19.8563, 102.4955], zoom: 6,
-        languages: ['en', 'lo', 'ko'], localLang: 'lo', localName: 'ລາວ', flag: '🇱🇦'
-    },
-    'cambodia': {
-        name: 'Cambodia', center: [12.5657, 104.9910], zoom: 7,
-        languages: ['en', 'km', 'ko'], localLang: 'km', localName: 'កម្ពុជា', flag: '🇰🇭'
-    },
-    'myanmar': {
-        name: 'Myanmar', center: [21.9162, 95.9560], zoom: 6,
-        languages: ['en', 'my', 'ko'], localLang: 'my', localName: 'မြန်မာ', flag: '🇲🇲'
-    },
-    'india': {
-        name: 'India', center: [20.5937, 78.9629], zoom: 5,
-        languages: ['en', 'hi', 'ko'], localLang: 'hi', localName: 'भारत', flag: '🇮🇳'
-    },
-    'sri_lanka': {
-        name: 'Sri Lanka', center: [7.8731, 80.7718], zoom: 7,
-        languages: ['en', 'si', 'ko'], localLang: 'si', localName: 'ශ්‍රී ලංකා', flag: '🇱🇰'
-    },
-    'pakistan': {
-        name: 'Pakistan', center: [30.3753, 69.3451], zoom: 5,
-        languages: ['en', 'ur', 'ko'], localLang: 'ur', localName: 'پاکستان', flag: '🇵🇰'
-    },
-    'brazil': {
-        name: 'Brazil', center: [-14.2350, -51.9253], zoom: 4,
-        languages: ['en', 'pt', 'ko'], localLang: 'pt', localName: 'Brasil', flag: '🇧🇷'
-    },
-    'colombia': {
-        name: 'Colombia', center: [4.5709, -74.2973], zoom: 5,
-        languages: ['en', 'es', 'ko'], localLang: 'es', localName: 'Colombia', flag: '🇨🇴'
-    },
-    'venezuela': {
-        name: 'Venezuela', center: [6.4238, -66.5897], zoom: 6,
-        languages: ['en', 'es', 'ko'], localLang: 'es', localName: 'Venezuela', flag: '🇻🇪'
-    },
-    'peru': {
-        name: 'Peru', center: [-9.1900, -75.0152], zoom: 5,
-        languages: ['en', 'es', 'ko'], localLang: 'es', localName: 'Perú', flag: '🇵🇪'
-    },
-    'ecuador': {
-        name: 'Ecuador', center: [-1.8312, -78.1834], zoom: 6,
-        languages: ['en', 'es', 'ko'], localLang: 'es', localName: 'Ecuador', flag: '🇪🇨'
-    },
-    'mexico': {
-        name: 'Mexico', center: [23.6345, -102.5528], zoom: 5,
-        languages: ['en', 'es', 'ko'], localLang: 'es', localName: 'México', flag: '🇲🇽'
-    },
-    'argentina': {
-        name: 'Argentina', center: [-38.4161, -63.6167], zoom: 4,
-        languages: ['en', 'es', 'ko'], localLang: 'es', localName: 'Argentina', flag: '🇦🇷'
-    },
-    'nigeria': {
-        name: 'Nigeria', center: [9.0820, 8.6753], zoom: 6,
-        languages: ['en', 'ha', 'ko'], localLang: 'ha', localName: 'Najeriya', flag: '🇳🇬'
-    },
-    'kenya': {
-        name: 'Kenya', center: [-0.0236, 37.9062], zoom: 6,
-        languages: ['en', 'sw', 'ko'], localLang: 'sw', localName: 'Kenya', flag: '🇰🇪'
-    },
-    'tanzania': {
-        name: 'Tanzania', center: [-6.3690, 34.8888], zoom: 6,
-        languages: ['en', 'sw', 'ko'], localLang: 'sw', localName: 'Tanzania', flag: '🇹🇿'
-    },
-    'uganda': {
-        name: 'Uganda', center: [1.3733, 32.2903], zoom: 7,
-        languages: ['en', 'lg', 'ko'], localLang: 'lg', localName: 'Uganda', flag: '🇺🇬'
-    },
-    'australia': {
-        name: 'Australia', center: [-25.2744, 133.7751], zoom: 4,
-        languages: ['en', 'ko'], localLang: 'en', localName: 'Australia', flag: '🇦🇺'
-    },
-    'fiji': {
-        name: 'Fiji', center: [-16.7784, 179.4144], zoom: 8,
-        languages: ['en', 'fj', 'ko'], localLang: 'fj', localName: 'Viti', flag: '🇫🇯'
-    },
-    'papua_new_guinea': {
-        name: 'Papua New Guinea', center: [-6.3149, 143.9555], zoom: 6,
-        languages: ['en', 'tpi', 'ko'], localLang: 'tpi', localName: 'Papua Niugini', flag: '🇵🇬'
-    }
-};
+// 정적 데이터 샤드 (export_shards.py 출력)
+const SHARD_BASE = 'data/shards';
+let shardManifest = null;
+let countryShards = null;      // { country, zoom, tiles, loaded: Set, clusters, clusterCache: Map, typeCounts, search, searchCache: Map }
+let clusterLayer;              // 사전 계산 클러스터 표시용 (markerClusterGroup 대신)
+let searchFold = null;         // 검색어 음역 규칙 (facility_search.fold_spec, 처음 검색할 때 로드)
+
+// 국가 정보(COUNTRIES)는 js/countries.js (country_registry.py에서 생성)
 
 // Firebase 설정
 const firebaseConfig = {
@@ -150,6 +48,10 @@ function initializeMap() {
         spiderfyOnMaxZoom: true
     });
     map.addLayer(markerClusterGroup);
+    clusterLayer = L.layerGroup().addTo(map);
+    
+    // 지도를 움직이면 새로 보이는 타일의 샤드/클러스터 로드
+    map.on('moveend', updateShardView);
     
     console.log("🗺️ 글로벌 지도 초기화 완료");
 }
@@ -185,11 +87,202 @@ function updateLocalLanguageOption(country) {
     }
 }
 
-// 국가별 데이터 로드
-function loadCountryData(countryCode) {
+// 루트 샤드 매니페스트 로드 (한 번만, 없으면 null)
+async function loadShardManifest() {
+    if (shardManifest !== null) return shardManifest;
+    try {
+        const response = await fetch(`${SHARD_BASE}/manifest.json`, { cache: 'no-cache' });
+        shardManifest = response.ok ? await response.json() : {};
+    } catch (error) {
+        shardManifest = {};
+    }
+    return shardManifest;
+}
+
+// 위경도 → 타일 좌표 (export_shards.lat_lng_to_tile과 같은 계산)
+function latLngToTile(lat, lng, zoom) {
+    const n = 2 ** zoom;
+    lat = Math.max(-85.05112878, Math.min(85.05112878, lat));
+    const latRad = lat * Math.PI / 180;
+    const x = Math.floor((lng + 180) / 360 * n);
+    const y = Math.floor((1 - Math.asinh(Math.tan(latRad)) / Math.PI) / 2 * n);
+    return [Math.min(Math.max(x, 0), n - 1), Math.min(Math.max(y, 0), n - 1)];
+}
+
+// 현재 화면에 보이는 타일 좌표 목록
+function visibleTiles(zoom) {
+    const bounds = map.getBounds();
+    const [minX, minY] = latLngToTile(bounds.getNorth(), bounds.getWest(), zoom);
+    const [maxX, maxY] = latLngToTile(bounds.getSouth(), bounds.getEast(), zoom);
+    const tiles = [];
+    for (let x = minX; x <= maxX; x++) {
+        for (let y = minY; y <= maxY; y++) {
+            tiles.push([x, y]);
+        }
+    }
+    return tiles;
+}
+
+// 샤드 JSON 받기 (파일명에 내용 해시가 있으므로 브라우저 캐시를 그대로 사용)
+function fetchShard(shards, file) {
+    return fetch(`${SHARD_BASE}/${shards.country}/${file}`)
+        .then(response => {
+            if (!response.ok) throw new Error(`HTTP ${response.status}`);
+            return response.json();
+        });
+}
+
+// 샤드 행 → 시설 객체
+function shardRows(shard) {
+    return shard.rows.map(row => {
+        const place = {};
+        shard.fields.forEach((field, i) => { place[field] = row[i]; });
+        return place;
+    });
+}
+
+// 줌에 따라 사전 계산 클러스터 또는 원본 샤드 표시
+async function updateShardView() {
+    const shards = countryShards;
+    if (!shards) return;
+
+    const clusters = shards.clusters;
+    const zoom = Math.round(map.getZoom());
+    if (clusters && zoom <= clusters.max_zoom) {
+        await renderClusters(shards, Math.max(zoom, clusters.min_zoom));
+    } else {
+        clusterLayer.clearLayers();
+        await loadVisibleShards(shards);
+        if (countryShards === shards) renderPlaces(currentFilter);
+    }
+}
+
+// 현재 화면/줌/필터에 해당하는 클러스터 타일을 받아 표시
+async function renderClusters(shards, zoom) {
+    const filter = shards.clusters.filters[currentFilter];
+    if (!filter) {
+        // 시설이 없는 타입은 매니페스트에 필터가 없음 → 이전 필터의 마커를 지우고 개수(0) 표시
+        markerClusterGroup.clearLayers();
+        clusterLayer.clearLayers();
+        updateFilterCounts();
+        console.log(`🔍 ${currentFilter} 필터: 시설 없음`);
+        return;
+    }
+
+    const tileZoom = Math.min(zoom, shards.clusters.tile_zoom);
+    const keys = visibleTiles(tileZoom)
+        .map(([x, y]) => `${zoom}/${x}/${y}`)
+        .filter(key => filter.tiles[key]);
+
+    const results = await Promise.all(keys.map(key => {
+        const file = filter.tiles[key];
+        if (!shards.clusterCache.has(file)) {
+            shards.clusterCache.set(file, fetchShard(shards, file).then(shardRows).catch(error => {
+                shards.clusterCache.delete(file);
+                console.error('클러스터 로드 오류:', key, error);
+                return [];
+            }));
+        }
+        return shards.clusterCache.get(file);
+    }));
+
+    // 그 사이 국가/줌/필터가 바뀌었으면 표시하지 않음
+    if (countryShards !== shards || Math.round(map.getZoom()) !== zoom ||
+        shards.clusters.filters[currentFilter] !== filter) return;
+
+    markerClusterGroup.clearLayers();
+    clusterLayer.clearLayers();
+    let total = 0;
+    results.forEach(points => {
+        points.forEach(point => {
+            clusterLayer.addLayer(point.count > 1 ? createClusterMarker(point) : createPlaceMarker(point));
+            total += point.count;
+        });
+    });
+
+    console.log(`🔍 ${currentFilter} 필터 (줌 ${zoom}): 클러스터 ${clusterLayer.getLayers().length}개, 시설 ${total}개 표시`);
+}
+
+// 클러스터 마커 (leaflet.markercluster와 같은 모양, 클릭하면 풀리는 줌으로 확대)
+function createClusterMarker(point) {
+    const size = point.count < 10 ? 'small' : point.count < 100 ? 'medium' : 'large';
+    const icon = L.divIcon({
+        html: `<div><span>${point.count}</span></div>`,
+        className: `marker-cluster marker-cluster-${size}`,
+        iconSize: [40, 40]
+    });
+    return L.marker([point.lat, point.lng], {icon: icon})
+        .on('click', () => map.setView([point.lat, point.lng], point.expand_zoom));
+}
+
+// 보이는 타일 중 아직 받지 않은 원본 샤드만 로드 (클러스터 최대 줌보다 확대했을 때)
+async function loadVisibleShards(shards) {
+    const requests = [];
+    visibleTiles(shards.zoom).forEach(([x, y]) => {
+        const key = `${shards.zoom}/${x}/${y}`;
+        const tile = shards.tiles[key];
+        if (!tile || shards.loaded.has(key)) return;
+        shards.loaded.add(key);
+        requests.push(
+            fetchShard(shards, tile.file).catch(error => {
+                shards.loaded.delete(key);
+                console.error('샤드 로드 오류:', key, error);
+                return null;
+            })
+        );
+    });
+    if (requests.length === 0) return;
+
+    const results = await Promise.all(requests);
+    if (countryShards !== shards) return;   // 그 사이 국가가 바뀜
+
+    results.forEach(shard => {
+        if (shard) allPlacesData.push(...shardRows(shard));
+    });
+    updateFilterCounts();
+}
+
+// 국가별 데이터 로드 (정적 샤드 우선, 없으면 Firestore)
+async function loadCountryData(countryCode) {
     document.getElementById('loading').style.display = 'block';
-    
-    // Firestore에서 해당 국가 데이터 로드
+    allPlacesData = [];
+    countryShards = null;
+    clusterLayer.clearLayers();
+
+    const manifest = await loadShardManifest();
+    const entry = manifest.countries && manifest.countries[countryCode];
+    if (entry) {
+        try {
+            const response = await fetch(`${SHARD_BASE}/${entry.manifest}`);
+            if (!response.ok) throw new Error(`HTTP ${response.status}`);
+            const countryManifest = await response.json();
+            countryShards = {
+                country: countryCode,
+                zoom: countryManifest.zoom,
+                tiles: countryManifest.tiles,
+                loaded: new Set(),
+                clusters: countryManifest.clusters || null,
+                clusterCache: new Map(),
+                typeCounts: countryManifest.type_counts || null,
+                search: countryManifest.search || null,
+                searchCache: new Map()
+            };
+            markerClusterGroup.clearLayers();
+            updateFilterCounts();
+            await updateShardView();
+            document.getElementById('loading').style.display = 'none';
+            return;
+        } catch (error) {
+            console.error('샤드 매니페스트 로드 오류, Firestore로 전환:', error);
+            countryShards = null;
+        }
+    }
+
+    loadCountryDataFromFirestore(countryCode);
+}
+
+// Firestore에서 국가 데이터 전체 로드 (샤드가 없는 국가용)
+function loadCountryDataFromFirestore(countryCode) {
     db.collection(countryCode === 'bangladesh' ? 'bangladesh_locations' : `${countryCode}_locations`)
         .get()
         .then(snapshot => {
@@ -205,7 +298,7 @@ function loadCountryData(countryCode) {
             console.log(allPlacesData);
             
             // 마커 표시
-            filterPlaces('all');
+            filterPlaces(currentFilter);
             document.getElementById('loading').style.display = 'none';
             updateFilterCounts();
         })
@@ -235,8 +328,37 @@ function getCustomIcon(type) {
     });
 }
 
+// 시설 마커 생성
+function createPlaceMarker(place) {
+    const icon = getCustomIcon(place.type);
+    return L.marker([place.lat, place.lng], {icon: icon})
+        .bindPopup(`
+            <b>${place.name || 'Medical Facility'}</b><br>
+            ${place.address ? place.address + '<br>' : ''}
+            <small>Type: ${place.type}</small><br>
+            <small>Country: ${COUNTRIES[currentCountry].name}</small>
+        `);
+}
+
 // 필터링
 function filterPlaces(type) {
+    currentFilter = type;
+    
+    // 필터 버튼 활성화
+    document.querySelectorAll('.filter-btn').forEach(btn => {
+        btn.classList.remove('active');
+    });
+    document.querySelector(`[data-filter="${type}"]`).classList.add('active');
+    
+    if (countryShards) {
+        updateShardView();
+    } else {
+        renderPlaces(type);
+    }
+}
+
+// 불러온 시설 전체를 markerClusterGroup으로 표시 (Firestore 데이터 또는 최대 확대 시 원본 샤드)
+function renderPlaces(type) {
     markerClusterGroup.clearLayers();
     
     const filteredData = type === 'all' ? 
@@ -244,41 +366,30 @@ function filterPlaces(type) {
         allPlacesData.filter(place => place.type === type);
     
     filteredData.forEach(place => {
-        const icon = getCustomIcon(place.type);
-        const marker = L.marker([place.lat, place.lng], {icon: icon})
-            .bindPopup(`
-                <b>${place.name || 'Medical Facility'}</b><br>
-                ${place.address ? place.address + '<br>' : ''}
-                <small>Type: ${place.type}</small><br>
-                <small>Country: ${COUNTRIES[currentCountry].name}</small>
-            `);
-        markerClusterGroup.addLayer(marker);
+        markerClusterGroup.addLayer(createPlaceMarker(place));
     });
     
-    // 필터 버튼 활성화
-    document.querySelectorAll('.filter-btn').forEach(btn => {
-        btn.classList.remove('active');
-    });
-    document.querySelector(`[data-filter="${type}"]`).classList.add('active');
-    
     console.log(`🔍 ${type} 필터: ${filteredData.length}개 표시`);
 }
 
-// 필터 개수 업데이트
+// 타입별 개수를 한 번의 순회로 계산
+function countByType(places) {
+    const counts = { 'all': places.length };
+    places.forEach(place => {
+        counts[place.type] = (counts[place.type] || 0) + 1;
+    });
+    return counts;
+}
+
+// 필터 개수 업데이트 (샤드 매니페스트에 미리 계산된 타입별 개수가 있으면 그대로 사용)
 function updateFilterCounts() {
-    const counts = {
-        'all': allPlacesData.length,
-        'vaccine': allPlacesData.filter(p => p.type === 'vaccine').length,
-        'blood_test': allPlacesData.filter(p => p.type === 'blood_test').length,
-        'aid': allPlacesData.filter(p => p.type === 'aid').length,
-        'dengue_center': allPlacesData.filter(p => p.type === 'dengue_center').length
-    };
+    const counts = (countryShards && countryShards.typeCounts) || countByType(allPlacesData);
     
-    Object.keys(counts).forEach(type => {
+    ['all', 'vaccine', 'blood_test', 'aid', 'dengue_center'].forEach(type => {
         const btn = document.querySelector(`[data-filter="${type}"]`);
         if (btn) {
             const text = btn.textContent.split('(')[0].trim();
-            btn.textContent = `${text} (${counts[type]})`;
+            btn.textContent = `${text} (${counts[type] || 0})`;
         }
     });
 }
@@ -288,11 +399,8 @@ async function changeLanguage(lang) {
     currentLang = lang;
     
     try {
-        // 번역 파일 로드
-        const response = await fetch(`app/locales/${lang}.json`);
-        if (!response.ok) throw new Error('Translation file not found');
-        
-        const translations = await response.json();
+        // 번역 번들 로드 (js/locales.js, 기본 언어는 네트워크 요청 없음)
+        const translations = await loadLocale(lang);
         
         // UI 텍스트 업데이트
         document.querySelectorAll('[data-translate]').forEach(element => {
@@ -305,6 +413,11 @@ async function changeLanguage(lang) {
         // 필터 버튼 텍스트 업데이트
         updateFilterButtonTexts(translations);
         
+        const searchInput = document.getElementById('facilitySearch');
+        if (searchInput && translations.search_placeholder) {
+            searchInput.placeholder = translations.search_placeholder;
+        }
+        
         // 언어 선택 드롭다운 활성화
         const languageSelect = document.getElementById('languageSelect');
         if (languageSelect) {
@@ -318,6 +431,106 @@ async function changeLanguage(lang) {
     }
 }
 
+// 검색용 이름 정규화 (facility_search.fold_name과 같은 규칙: NFKC + 소문자 + 음역)
+function foldChar(char, fold) {
+    if (char in fold.map) return fold.map[char];
+    return char.normalize('NFKD').replace(/\p{M}/gu, '');
+}
+
+function foldName(text, fold) {
+    const chars = Array.from((text || '').normalize('NFKC').toLowerCase());
+    let out = '';
+    for (let i = 0; i < chars.length; i++) {
+        const char = chars[i];
+        const next = chars[i + 1] || '';
+        // 태국/라오 문자의 앞에 쓰는 모음은 뒤 자음 다음으로
+        if (next && fold.lead.includes(char) && /\p{Lo}/u.test(next)) {
+            out += foldChar(next, fold) + foldChar(char, fold);
+            i++;
+            continue;
+        }
+        out += foldChar(char, fold);
+        // 자음 뒤에 자음/비음 기호가 오면 기본 모음 'a'
+        if (next && fold.inherent.includes(char) && fold.triggers.includes(next)) out += 'a';
+    }
+    return out.replace(/[^\p{L}\p{N}]+/gu, ' ').trim();
+}
+
+// 음역 규칙 로드 (한 번만)
+async function loadSearchFold() {
+    if (searchFold) return searchFold;
+    const manifest = await loadShardManifest();
+    if (!manifest.search_fold) return null;
+    const response = await fetch(`${SHARD_BASE}/${manifest.search_fold}`);
+    if (!response.ok) throw new Error(`HTTP ${response.status}`);
+    searchFold = await response.json();
+    return searchFold;
+}
+
+// 현재 국가에서 이름 검색 → 지도 중심에서 가까운 순 (샤드가 없으면 불러온 데이터에서)
+async function searchPlaces(query, limit = 20) {
+    const shards = countryShards;
+    const fold = await loadSearchFold().catch(() => null);
+    const fallbackFold = { map: {}, lead: '', inherent: '', triggers: '' };
+    const tokens = foldName(query, fold || fallbackFold).split(' ').filter(Boolean);
+    if (tokens.length === 0) return [];
+
+    let places = allPlacesData;
+    if (shards && shards.search && fold) {
+        // 가장 긴 토큰의 앞 글자 샤드만 받아서 그 토큰으로 시작하는 시설 후보를 꺼냄
+        const token = tokens.reduce((a, b) => (b.length > a.length ? b : a));
+        const key = Array.from(token).slice(0, shards.search.prefix_len).join('');
+        const file = shards.search.shards[key];
+        if (!file) return [];
+        if (!shards.searchCache.has(file)) {
+            shards.searchCache.set(file, fetchShard(shards, file).catch(error => {
+                shards.searchCache.delete(file);
+                throw error;
+            }));
+        }
+        const shard = await shards.searchCache.get(file);
+        const rows = shardRows(shard);
+        const matched = new Set();
+        Object.keys(shard.terms).forEach(term => {
+            if (term.startsWith(token)) shard.terms[term].forEach(i => matched.add(i));
+        });
+        places = Array.from(matched, i => rows[i]);
+    }
+
+    // 모든 토큰이 이름의 어떤 토큰의 접두사여야 함
+    const results = places.filter(place => {
+        const words = foldName(place.name, fold || fallbackFold).split(' ');
+        return tokens.every(token => words.some(word => word.startsWith(token)));
+    });
+
+    const center = map.getCenter();
+    const cosLat = Math.cos(center.lat * Math.PI / 180);
+    const distance = place => {
+        const dLng = Math.abs(place.lng - center.lng);
+        const x = Math.min(dLng, 360 - dLng) * cosLat;
+        const y = place.lat - center.lat;
+        return x * x + y * y;
+    };
+    return results.sort((a, b) => distance(a) - distance(b)).slice(0, limit);
+}
+
+// 검색 결과 목록 표시 (클릭하면 해당 시설로 이동)
+function renderSearchResults(results) {
+    const list = document.getElementById('searchResults');
+    if (!list) return;
+    list.innerHTML = '';
+    results.forEach(place => {
+        const item = document.createElement('li');
+        item.textContent = `${place.name || 'Medical Facility'} (${place.type})`;
+        item.addEventListener('click', () => {
+            map.setView([place.lat, place.lng], 16);
+            createPlaceMarker(place).addTo(markerClusterGroup).openPopup();
+            list.innerHTML = '';
+        });
+        list.appendChild(item);
+    });
+}
+
 // 필터 버튼 텍스트 업데이트
 function updateFilterButtonTexts(translations) {
     const filterButtons = {
@@ -338,6 +551,15 @@ function updateFilterButtonTexts(translations) {
     });
 }
 
+// Service Worker 등록 (app/service-worker.js, 사전 캐시 목록은 build_locales.py가 생성)
+if ('serviceWorker' in navigator) {
+    window.addEventListener('load', () => {
+        navigator.serviceWorker.register('/app/service-worker.js', { scope: '/' })
+            .then(registration => console.log('Service Worker 등록 성공:', registration.scope))
+            .catch(error => console.log('Service Worker 등록 실패:', error));
+    });
+}
+
 // 이벤트 리스너
 document.addEventListener('DOMContentLoaded', () => {
     console.log("🌍 Global Dengue Tracker 시작");
@@ -374,4 +596,23 @@ document.addEventListener('DOMContentLoaded', () => {
             filterPlaces(filter);
         });
     });
+    
+    // 이름 검색 (입력이 멈춘 뒤 검색, 늦게 끝난 이전 검색 결과는 버림)
+    const searchInput = document.getElementById('facilitySearch');
+    if (searchInput) {
+        let searchTimer = null;
+        let searchId = 0;
+        searchInput.addEventListener('input', () => {
+            clearTimeout(searchTimer);
+            searchTimer = setTimeout(async () => {
+                const id = ++searchId;
+                try {
+                    const results = await searchPlaces(searchInput.value);
+                    if (id === searchId) renderSearchResults(results);
+                } catch (error) {
+                    console.error('검색 오류:', error);
+                }
+            }, 200);
+        });
+    }
 });
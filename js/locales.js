@@ -0,0 +1,74 @@
+// 자동 생성 파일 — 수정하지 말고 app/locales/*.json을 고친 뒤 python build_locales.py 실행
+// 언어별 번역 번들 (내용 해시 파일명, 언어를 바꿀 때만 로드)
+const LOCALE_BUNDLES = {
+    "bn": "app/locales/build/bn.0b6639a1a2a9.json",
+    "en": "app/locales/build/en.041571caa5ee.json",
+    "es": "app/locales/build/es.ab2358716d07.json",
+    "fj": "app/locales/build/fj.23dc47022329.json",
+    "ha": "app/locales/build/ha.db95f98af901.json",
+    "hi": "app/locales/build/hi.7cdc11f1bfc4.json",
+    "id": "app/locales/build/id.b5b8b435cb2f.json",
+    "km": "app/locales/build/km.02cf66be1011.json",
+    "ko": "app/locales/build/ko.b62e68df7c85.json",
+    "lg": "app/locales/build/lg.9ee266a8ea3f.json",
+    "lo": "app/locales/build/lo.aff3dcab3eba.json",
+    "ms": "app/locales/build/ms.ac1644656bb8.json",
+    "my": "app/locales/build/my.de9b14992d46.json",
+    "pt": "app/locales/build/pt.e80d7ae7c9ba.json",
+    "si": "app/locales/build/si.5e8475cba8a9.json",
+    "sw": "app/locales/build/sw.64fc3059e5ec.json",
+    "th": "app/locales/build/th.c41b435b3773.json",
+    "tl": "app/locales/build/tl.20c9672141a8.json",
+    "tpi": "app/locales/build/tpi.5cc8bdbd7f9d.json",
+    "ur": "app/locales/build/ur.171474f98aaa.json",
+    "vi": "app/locales/build/vi.212b5f7b8f38.json",
+    "zh": "app/locales/build/zh.2954a1d60ab8.json"
+};
+
+// 기본 언어는 첫 화면에서 바로 쓰도록 포함
+const DEFAULT_LANG = "en";
+const DEFAULT_LOCALE = {
+    "app_title": "Global Dengue Tracker",
+    "attachment": "Attachment",
+    "country": "Country",
+    "country_desc": "Dengue fever prevention facilities",
+    "description": "Description",
+    "description_placeholder": "Please describe the location, address, and services...",
+    "email": "Email",
+    "facility_type": "Facility Type",
+    "filter_aid": "Free Clinic",
+    "filter_all": "All",
+    "filter_blood": "Blood Test",
+    "filter_center": "Dengue Center",
+    "filter_vaccine": "Vaccination",
+    "loading": "Loading facilities...",
+    "report_title": "Share Dengue-Related Location",
+    "select_country": "Select Country",
+    "submit_report": "Submit Report"
+};
+
+const localeCache = {};
+
+// 언어 코드 → 번역 dict (빠진 키는 기본 언어, 없는 언어는 기본 언어)
+function loadLocale(lang) {
+    if (lang === DEFAULT_LANG || !LOCALE_BUNDLES[lang]) {
+        return Promise.resolve(DEFAULT_LOCALE);
+    }
+    if (!localeCache[lang]) {
+        localeCache[lang] = fetch(LOCALE_BUNDLES[lang])
+            .then(response => {
+                if (!response.ok) throw new Error(`번역 파일 로드 실패: ${response.status}`);
+                return response.json();
+            })
+            .then(strings => Object.assign({}, DEFAULT_LOCALE, strings))
+            .catch(error => {
+                delete localeCache[lang];
+                throw error;
+            });
+    }
+    return localeCache[lang];
+}
+
+if (typeof module !== 'undefined') {
+    module.exports = { LOCALE_BUNDLES, DEFAULT_LANG, DEFAULT_LOCALE, loadLocale };
+}
@@ -0,0 +1,89 @@
+// 시설 전송 포맷(.fwire) 디코더 — wire_format.py의 decode_facilities와 같은 결과
+// 사용: decodeFacilities(new Uint8Array(await response.arrayBuffer()))
+
+const WIRE_MAGIC = [0x46, 0x57, 0x52, 0x01];   // 'FWR\x01'
+const WIRE_COORD_SCALE = 1000000;
+const WIRE_RAW_ID_PREFIX = '=';                 // 종류 표에서 '종류/번호'로 나눌 수 없는 osm_id 원문 표시
+
+function decodeFacilities(bytes) {
+    WIRE_MAGIC.forEach((byte, i) => {
+        if (bytes[i] !== byte) throw new Error('시설 전송 포맷(.fwire) 데이터가 아닙니다');
+    });
+
+    const textDecoder = new TextDecoder();
+    let pos = WIRE_MAGIC.length;
+
+    // OSM id(최대 2^53)까지 다루기 위해 비트 연산 대신 곱셈 사용
+    function readVarint() {
+        let result = 0;
+        let scale = 1;
+        while (true) {
+            const byte = bytes[pos++];
+            result += (byte & 0x7f) * scale;
+            if (byte < 0x80) return result;
+            scale *= 128;
+        }
+    }
+
+    function unzigzag(value) {
+        return value % 2 === 0 ? value / 2 : -(value + 1) / 2;
+    }
+
+    function readTable() {
+        const count = readVarint();
+        const values = new Array(count);
+        for (let i = 0; i < count; i++) {
+            const length = readVarint();
+            values[i] = textDecoder.decode(bytes.subarray(pos, pos + length));
+            pos += length;
+        }
+        return values;
+    }
+
+    function readColumn(count, delta) {
+        const values = new Array(count);
+        let previous = 0;
+        for (let i = 0; i < count; i++) {
+            let value = readVarint();
+            if (delta) {
+                previous += unzigzag(value);
+                value = previous;
+            }
+            values[i] = value;
+        }
+        return values;
+    }
+
+    const count = readVarint();
+    const types = readTable();
+    const countries = readTable();
+    const names = readTable();
+    const kinds = readTable();
+
+    const lats = readColumn(count, true);
+    const lngs = readColumn(count, true);
+    const typeCodes = readColumn(count, false);
+    const countryCodes = readColumn(count, false);
+    const nameCodes = readColumn(count, false);
+    const kindCodes = readColumn(count, false);
+    const numbers = readColumn(count, true);
+
+    const facilities = new Array(count);
+    for (let i = 0; i < count; i++) {
+        const kind = kinds[kindCodes[i]];
+        facilities[i] = {
+            name: names[nameCodes[i]],
+            lat: lats[i] / WIRE_COORD_SCALE,
+            lng: lngs[i] / WIRE_COORD_SCALE,
+            type: types[typeCodes[i]],
+            country: countries[countryCodes[i]],
+            osm_id: kind.startsWith(WIRE_RAW_ID_PREFIX) ? kind.slice(WIRE_RAW_ID_PREFIX.length)
+                : kind ? `${kind}/${numbers[i]}` : ''
+        };
+    }
+    return facilities;
+}
+
+if (typeof module !== 'undefined') {
+    module.exports = { decodeFacilities };
+}
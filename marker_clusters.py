@@ -0,0 +1,135 @@
+"""
+마커 클러스터 사전 계산 (supercluster 방식)
+
+브라우저에서 L.markerClusterGroup()이 모든 시설을 매번 클러스터링하지 않도록,
+빌드 시점에 줌 레벨별 / 타입 필터별 클러스터를 미리 계산한다.
+
+- 가장 높은 줌(max_zoom)부터 한 단계씩 내려가며, 화면 기준 radius 픽셀 안의 점들을 하나로 합침
+- 이웃 검색은 격자 해시(셀 크기 = 반경)로 3x3 셀만 확인
+- 클러스터 중심은 개수 가중 평균, expand_zoom은 클릭 시 클러스터가 풀리는 줌
+"""
+
+import math
+
+CLUSTER_MIN_ZOOM = 0
+CLUSTER_MAX_ZOOM = 14           # 이보다 확대하면 원본 데이터 샤드를 그대로 표시
+CLUSTER_RADIUS = 60             # 픽셀 (leaflet.markercluster 기본값 80, 기존 설정 50)
+TILE_EXTENT = 256
+CLUSTER_FIELDS = ['lat', 'lng', 'count', 'expand_zoom', 'name', 'type', 'osm_id']
+MAX_LAT = 85.05112878
+
+
+def project(lat, lng):
+    """위경도 → 웹 메르카토르 [0, 1] 좌표"""
+    sin = math.sin(math.radians(max(-MAX_LAT, min(MAX_LAT, lat))))
+    y = 0.5 - 0.25 * math.log((1 + sin) / (1 - sin)) / math.pi
+    return lng / 360.0 + 0.5, min(max(y, 0.0), 1.0)
+
+
+def unproject(x, y):
+    """웹 메르카토르 [0, 1] 좌표 → 위경도"""
+    lat = math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * y))))
+    return lat, (x - 0.5) * 360.0
+
+
+def lat_lng_to_tile(lat, lng, zoom):
+    """위경도 → 웹 메르카토르 타일 (x, y) (Leaflet/OSM 타일과 같은 규칙)"""
+    n = 2 ** zoom
+    x, y = project(lat, lng)
+    return min(max(int(x * n), 0), n - 1), min(max(int(y * n), 0), n - 1)
+
+
+class _Point:
+    __slots__ = ('x', 'y', 'count', 'facility', 'created')
+
+    def __init__(self, x, y, count, facility=None, created=None):
+        self.x = x
+        self.y = y
+        self.count = count
+        self.facility = facility    # 단일 시설일 때만
+        self.created = created      # 클러스터가 만들어진 줌
+
+
+class MarkerClusterer:
+    def __init__(self, min_zoom=CLUSTER_MIN_ZOOM, max_zoom=CLUSTER_MAX_ZOOM, radius=CLUSTER_RADIUS,
+                 extent=TILE_EXTENT):
+        self.min_zoom = min_zoom
+        self.max_zoom = max_zoom
+        self.radius = radius
+        self.extent = extent
+
+    def _cluster(self, points, zoom):
+        """zoom + 1 단계의 점 목록 → zoom 단계의 점 목록"""
+        r = self.radius / (self.extent * 2 ** zoom)
+        grid = {}
+        for i, point in enumerate(points):
+            grid.setdefault((int(point.x / r), int(point.y / r)), []).append(i)
+
+        visited = [False] * len(points)
+        r2 = r * r
+        result = []
+
+        for i, point in enumerate(points):
+            if visited[i]:
+                continue
+            visited[i] = True
+
+            cx, cy = int(point.x / r), int(point.y / r)
+            neighbors = []
+            for gx in (cx - 1, cx, cx + 1):
+                for gy in (cy - 1, cy, cy + 1):
+                    for j in grid.get((gx, gy), ()):
+                        if visited[j]:
+                            continue
+                        other = points[j]
+                        dx, dy = other.x - point.x, other.y - point.y
+                        if dx * dx + dy * dy <= r2:
+                            neighbors.append(j)
+
+            if not neighbors:
+                result.append(point)
+                continue
+
+            count = point.count
+            wx, wy = point.x * point.count, point.y * point.count
+            for j in neighbors:
+                visited[j] = True
+                other = points[j]
+                count += other.count
+                wx += other.x * other.count
+                wy += other.y * other.count
+            result.append(_Point(wx / count, wy / count, count, created=zoom))
+
+        return result
+
+    def build(self, facilities):
+        """시설 목록 → {줌: [클러스터 행, ...]} (행 형식은 CLUSTER_FIELDS)"""
+        points = []
+        for facility in facilities:
+            x, y = project(float(facility['lat']), float(facility['lng']))
+            points.append(_Point(x, y, 1, facility=facility))
+
+        levels = {}
+        for zoom in range(self.max_zoom, self.min_zoom - 1, -1):
+            points = self._cluster(points, zoom)
+            levels[zoom] = [self.cluster_row(point) for point in points]
+        return levels
+
+    def cluster_row(self, point):
+        if point.facility is not None:
+            facility = point.facility
+            return [round(float(facility['lat']), 6), round(float(facility['lng']), 6), 1, None,
+                    facility.get('name') or '', facility.get('type') or '', facility.get('osm_id') or '']
+        lat, lng = unproject(point.x, point.y)
+        return [round(lat, 6), round(lng, 6), point.count, min(point.created + 1, self.max_zoom + 1), '', '', '']
+
+
+def cluster_tiles(levels, max_tile_zoom):
+    """{줌: 행 목록} → {'z/x/y': 행 목록} (타일 좌표는 min(줌, max_tile_zoom) 기준)"""
+    tiles = {}
+    for zoom, rows in levels.items():
+        tile_zoom = min(zoom, max_tile_zoom)
+        for row in rows:
+            x, y = lat_lng_to_tile(row[0], row[1], tile_zoom)
+            tiles.setdefault(f"{zoom}/{x}/{y}", []).append(row)
+    return tiles
@@ -1,267 +1,518 @@
 import requests
 import json
 import csv
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack
+
+from atomic_io import atomic_open
+from collector_metrics import RunMetrics
+from country_registry import COUNTRIES, CountryLocator
+from dataset_versions import DatasetStore
+from facility_classifier import DISEASES, MultiDiseaseClassifier
+from facility_store import FacilityStoreWriter, iter_facility_file
+from overpass_cache import CacheMiss, OverpassCache, ResponseTooLarge
+from overpass_query import build_filtered_query
+from overpass_stream import ElementStream, iter_chunks
+from overpass_tiles import plan_tiles, subdivide_tile, tile_key, tile_size
+from run_journal import DEFAULT_JOURNAL_PATH, RunJournal
+
+
+class TileRetry(Exception):
+    """타일을 더 잘게 나눠 다시 요청해야 하는 경우 (타임아웃/데이터 과다)"""
+
+
+class OverpassRateLimiter:
+    """엔드포인트 하나에 대한 동시 요청 수 제한 + 요청 간 최소 간격 유지"""
+
+    def __init__(self, max_concurrent=2, min_interval=1.0):
+        self.semaphore = threading.BoundedSemaphore(max_concurrent)
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def __enter__(self):
+        self.semaphore.acquire()
+        # 다음 요청 가능 시각을 예약하고, 예약 시각까지 대기
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_slot)
+            self._next_slot = start + self.min_interval
+        if start > now:
+            time.sleep(start - now)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.semaphore.release()
+        return False
+
+
+# 온라인 수집에서 캐시 응답을 그대로 쓰는 기간(초)
+# 매일 밤 수집 주기(24시간)보다 짧게 → 야간 수집은 항상 새로 받고, 같은 날 다시 돌리면 캐시 재사용
+DEFAULT_CACHE_TTL = 12 * 3600
+
+# 수집 결과 CSV 컬럼
+CSV_FIELDS = ['name', 'lat', 'lng', 'type', 'country', 'osm_id']
+
+
+def output_paths(country_code, disease='dengue'):
+    """질병/국가별 출력 파일 (CSV, 컬럼형) — 뎅기열은 기존처럼 data/ 바로 아래, 나머지는 data/{질병}/"""
+    directory = 'data' if disease == 'dengue' else os.path.join('data', disease)
+    base = os.path.join(directory, f"{country_code}_facilities")
+    return f"{base}.csv", f"{base}.fcol"
+
 
 class OSMDengueCollector:
-    def __init__(self):
+    def __init__(self, offline=False, metrics=None, journal=None, diseases=None, versions=None,
+                 cache_ttl=DEFAULT_CACHE_TTL):
         self.overpass_url = "http://overpass-api.de/api/interpreter"
-        self.countries = {
-            'bangladesh': {
-                'name': 'Bangladesh',
-                'bbox': [88.0, 20.0, 92.1, 26.6],
-                'country_code': 'BD'
-            },
-            'thailand': {
-                'name': 'Thailand',
-                'bbox': [97.3, 5.6, 105.6, 20.5],
-                'country_code': 'TH'
-            },
-            'vietnam': {
-                'name': 'Vietnam',
-                'bbox': [102.14, 8.18, 109.46, 23.39],
-                'country_code': 'VN'
-            },
-            'indonesia': {
-                'name': 'Indonesia',
-                'bbox': [95.0, -11.0, 141.0, 6.0],
-                'country_code': 'ID'
-            },
-            'philippines': {
-                'name': 'Philippines',
-                'bbox': [116.0, 4.0, 126.0, 21.0],
-                'country_code': 'PH'
-            },
-            'malaysia': {
-                'name': 'Malaysia',
-                'bbox': [100.0, 0.5, 120.0, 7.5],
-                'country_code': 'MY'
-            },
-            'singapore': {
-                'name': 'Singapore',
-                'bbox': [103.6, 1.2, 104.1, 1.5],
-                'country_code': 'SG'
-            },
-            'laos': {
-                'name': 'Laos',
-                'bbox': [100.1, 13.9, 107.7, 22.5],
-                'country_code': 'LA'
-            },
-            'cambodia': {
-                'name': 'Cambodia',
-                'bbox': [102.3, 10.4, 107.6, 14.7],
-                'country_code': 'KH'
-            },
-            'myanmar': {
-                'name': 'Myanmar',
-                'bbox': [92.2, 9.5, 101.2, 28.5],
-                'country_code': 'MM'
-            },
-            'india': {
-                'name': 'India',
-                'bbox': [68.7, 6.7, 97.25, 35.5],
-                'country_code': 'IN'
-            },
-            'sri_lanka': {
-                'name': 'Sri Lanka',
-                'bbox': [79.6, 5.9, 81.9, 9.8],
-                'country_code': 'LK'
-            },
-            'pakistan': {
-                'name': 'Pakistan',
-                'bbox': [60.9, 23.6, 77.0, 37.0],
-                'country_code': 'PK'
-            },
-            'brazil': {
-                'name': 'Brazil',
-                'bbox': [-74.0, -33.0, -34.0, 5.3],
-                'country_code': 'BR'
-            },
-            'colombia': {
-                'name': 'Colombia',
-                'bbox': [-79.0, -4.2, -66.9, 13.4],
-                'country_code': 'CO'
-            },
-            'venezuela': {
-                'name': 'Venezuela',
-                'bbox': [-73.4, 0.6, -59.8, 12.2],
-                'country_code': 'VE'
-            },
-            'peru': {
-                'name': 'Peru',
-                'bbox': [-84.0, -18.3, -68.6, 0.2],
-                'country_code': 'PE'
-            },
-            'ecuador': {
-                'name': 'Ecuador',
-                'bbox': [-92.0, -5.0, -75.2, 2.3],
-                'country_code': 'EC'
-            },
-            'mexico': {
-                'name': 'Mexico',
-                'bbox': [-118.5, 14.5, -86.7, 32.7],
-                'country_code': 'MX'
-            },
-            'argentina': {
-                'name': 'Argentina',
-                'bbox': [-73.6, -55.1, -53.6, -21.8],
-                'country_code': 'AR'
-            },
-            'nigeria': {
-                'name': 'Nigeria',
-                'bbox': [2.7, 4.3, 14.7, 13.9],
-                'country_code': 'NG'
-            },
-            'kenya': {
-                'name': 'Kenya',
-                'bbox': [33.8, -4.7, 41.9, 5.0],
-                'country_code': 'KE'
-            },
-            'tanzania': {
-                'name': 'Tanzania',
-                'bbox': [29.3, -11.7, 40.4, 0.9],
-                'country_code': 'TZ'
-            },
-            'uganda': {
-                'name': 'Uganda',
-                'bbox': [29.6, -1.5, 35.0, 4.2],
-                'country_code': 'UG'
-            },
-            'australia': {
-                'name': 'Australia',
-                'bbox': [113.3, -43.7, 153.6, -10.7],
-                'country_code': 'AU'
-            },
-            'fiji': {
-                'name': 'Fiji',
-                'bbox': [177.9, -19.5, -178.4, -16.0],
-                'country_code': 'FJ'
-            },
-            'papua_new_guinea': {
-                'name': 'Papua New Guinea',
-                'bbox': [140.8, -11.6, 156.0, -1.0],
-                'country_code': 'PG'
-            }
-        }
+        
+        # 단계별 시간/카운터/예외 계측 (실행 후 data/metrics에 JSON + Prometheus 파일로 저장)
+        self.metrics = metrics or RunMetrics()
+        
+        # 국가/타일별 진행 상태 기록 (중단된 실행을 --resume으로 이어서 수집)
+        self.journal = journal or RunJournal()
+        
+        # 실행마다 뎅기열 데이터셋 버전 + 직전 버전과의 패치 기록 (오프라인 클라이언트 동기화용)
+        self.versions = versions or DatasetStore()
+        
+        # Overpass 원본 응답 캐시 (offline=True면 네트워크 없이 캐시만 재생, 만료 여부 무관)
+        # cache_ttl=0이면 온라인 수집은 항상 새로 받음 (받은 응답은 오프라인 재생/--resume용으로 저장)
+        self.cache = OverpassCache('data/raw', ttl=cache_ttl)
+        self.offline = offline
+        
+        # 질병별 언어별 키워드를 합친 분류기 (쿼리 한 번 + element당 스캔 한 번으로 모든 질병 분류)
+        # 뎅기열만 수집할 때의 키워드/결과는 기존 determine_facility_type과 동일
+        self.diseases = list(diseases or ['dengue'])
+        self.classifier = MultiDiseaseClassifier(self.diseases)
+
+        # 전체 국가 수집 시 동시 실행 설정 (Overpass 서버 예의 지키기)
+        self.max_workers = 4            # 동시에 처리할 국가 수
+        self.endpoint_concurrency = 2   # 엔드포인트당 동시 요청 수
+        self.request_interval = 1.0     # 엔드포인트당 요청 간 최소 간격(초)
+        self.max_retries = 3            # 429/504 응답 시 재시도 횟수
+        
+        # bbox 타일 분할 설정 (큰 국가의 타임아웃/대용량 응답 방지)
+        self.max_tile_size = 5.0              # 초기 타일 최대 크기(도)
+        self.min_tile_size = 0.25             # 이보다 작게는 분할하지 않음
+        self.max_tile_elements = 20000        # 타일당 허용 element 수
+        self.max_tile_bytes = 50 * 1024 * 1024  # 타일당 허용 응답 크기
+        self._rate_limiters = {}
+        self._rate_limiters_lock = threading.Lock()
+        # 국가 목록/bbox는 country_registry.COUNTRIES 공용 (웹/합성 데이터와 같은 출처)
+        self.countries = COUNTRIES
+        
+        # 국경 폴리곤(data/boundaries)이 있으면 이웃 국가 bbox와 겹치는 부분의 시설은 실제 소속 국가에서만 수집
+        self.locator = CountryLocator()
     
     def build_overpass_query(self, bbox, country_code):
-        query = f"""
-        [out:json][timeout:60];
-        (
-          node["amenity"="clinic"]({bbox[1]},{bbox[0]},{bbox[3]},{bbox[2]});
-          node["amenity"="hospital"]({bbox[1]},{bbox[0]},{bbox[3]},{bbox[2]});
-        );
-        out center meta;
-        """
-        return query
+        # 키워드 필터를 Overpass 쪽에서 적용 → 관련 시설만 전송 (way/relation은 중심 좌표로)
+        return build_filtered_query(bbox, self.classifier.keywords)
     
     def process_facility(self, element, country_code):
+        """element → 뎅기열 시설 dict (관련 없으면 None)"""
+        return self.process_element(element, country_code).get('dengue')
+    
+    def process_element(self, element, country_code):
+        """element → {질병: 시설 dict} (관련 질병이 없으면 빈 dict)"""
         try:
-            # 좌표 추출
+            # 좌표 추출 (way/relation은 out center의 중심 좌표 사용)
             if element['type'] == 'node':
                 lat = element['lat']
                 lng = element['lon']
+            elif 'center' in element:
+                lat = element['center']['lat']
+                lng = element['center']['lon']
             else:
-                return None
+                return {}
             
             tags = element.get('tags', {})
             name = tags.get('name', 'Unknown Facility')
+            osm_id = f"{element['type']}/{element['id']}"
             
-            # 뎅기열 관련 시설 판별
-            facility_type = self.determine_facility_type(tags)
-            if not facility_type:
-                return None
-            
+            # 질병별 관련 시설 판별 (태그 텍스트는 한 번만 스캔)
             return {
-                'name': name,
-                'lat': lat,
-                'lng': lng,
-                'type': facility_type,
-                'country': country_code
+                disease: {
+                    'name': name,
+                    'lat': lat,
+                    'lng': lng,
+                    'type': facility_type,
+                    'country': country_code,
+                    'osm_id': osm_id
+                }
+                for disease, facility_type in self.classifier.classify(tags).items()
             }
-        except:
-            return None
+        except (KeyError, TypeError, ValueError) as e:
+            # 형식이 잘못된 element만 건너뛰고, 종류별로 집계
+            self.metrics.exception(e, 'process_facility', country_code)
+            return {}
     
     def determine_facility_type(self, tags):
-        name = tags.get('name', '').lower()
-        description = tags.get('description', '').lower()
-        healthcare = tags.get('healthcare', '').lower()
+        # 뎅기열 관련 키워드(언어별 표)를 컴파일한 분류기로 한 번에 판별, 관련 없으면 None
+        return self.classifier.classify(tags).get('dengue')
     
-         # 뎅기열 관련 키워드만 허용
-        dengue_keywords = [
-           'dengue', 'aedes', 'mosquito', 'fever clinic',
-           'vaccination center', 'immunization', 
-           'blood test', 'diagnostic lab', 'rapid test',
-           'free medicine', 'free clinic dengue', 'prevention center'
-        ]
+    def save_outputs(self, facilities, country_code, disease='dengue'):
+        """한 질병의 시설 이터러블을 CSV와 컬럼형(.fcol) 파일로 저장하고 저장 개수 반환"""
+        records = ((disease, facility) for facility in facilities)
+        return self.save_disease_outputs(records, country_code, [disease])[disease]
     
-        text_to_check = f"{name} {description} {healthcare}"
+    def save_disease_outputs(self, records, country_code, diseases=None):
+        """(질병, 시설) 이터러블을 질병별 CSV + 컬럼형 파일에 한 번의 스트리밍으로 저장 → {질병: 개수}
+        
+        수집 도중 실패해도 기존 파일이 깨지지 않도록 모두 임시 파일에 쓴 뒤 교체
+        """
+        diseases = diseases or self.diseases
+        counts = dict.fromkeys(diseases, 0)
+        started = time.perf_counter()
+        upstream = 0.0
+        
+        with ExitStack() as stack:
+            writers = {}
+            for disease in diseases:
+                csv_path, store_path = output_paths(country_code, disease)
+                os.makedirs(os.path.dirname(csv_path), exist_ok=True)
+                csvfile = stack.enter_context(atomic_open(csv_path, 'w', newline='', encoding='utf-8'))
+                writer = csv.DictWriter(csvfile, fieldnames=CSV_FIELDS)
+                writer.writeheader()
+                store = FacilityStoreWriter(store_path, meta={'country': country_code, 'disease': disease})
+                stack.callback(store.abort)  # 도중에 실패하면 컬럼 임시 파일 삭제 (close 뒤에는 아무것도 안 함)
+                writers[disease] = (writer, store)
+            
+            iterator = iter(records)
+            while True:
+                # 앞 단계(다운로드/파싱/필터)에서 기다린 시간은 쓰기 시간에서 제외
+                pulled = time.perf_counter()
+                record = next(iterator, None)
+                upstream += time.perf_counter() - pulled
+                if record is None:
+                    break
+                disease, facility = record
+                writer, store = writers[disease]
+                writer.writerow(facility)
+                store.append(facility)
+                counts[disease] += 1
+            
+            # 컬럼형 파일을 먼저 교체하고, CSV는 with 블록을 빠져나갈 때 교체
+            for _, store in writers.values():
+                store.close()
+        
+        self.metrics.add_time('write', time.perf_counter() - started - upstream, country_code)
+        for disease, count in counts.items():
+            csv_path, store_path = output_paths(country_code, disease)
+            self.metrics.add('facilities_written', count, country_code)
+            print(f"💾 {csv_path} / {store_path}에 {count}개 시설 저장 완료")
+        if 'dengue' in counts:
+            self.record_version(country_code)
+        return counts
     
-        for keyword in dengue_keywords:
-            if keyword in text_to_check:
-                if 'vaccin' in keyword or 'immuniz' in keyword:
-                    return 'vaccine'
-                elif 'blood' in keyword or 'test' in keyword or 'lab' in keyword:
-                    return 'blood_test'
-                elif 'free' in keyword or 'medicine' in keyword:
-                    return 'aid'
-                else:
-                    return 'dengue_center'
+    def record_version(self, country_code):
+        """뎅기열 출력 파일로 데이터셋 버전 기록 → 버전 항목 (실패해도 저장한 수집 결과는 유지)"""
+        _, store_path = output_paths(country_code)
+        try:
+            entry, created = self.versions.commit(country_code, iter_facility_file(store_path), source='collector')
+        except (OSError, ValueError) as e:
+            print(f"⚠️ 데이터 버전 기록 실패: {e}")
+            self.metrics.exception(e, 'record_version', country_code)
+            return None
+        if created:
+            patch = f", 패치 {entry['patch_bytes']:,} bytes" if entry['patch'] else ""
+            print(f"🏷️ {country_code} 데이터 버전 v{entry['version']} ({entry['count']}개 시설{patch})")
+        return entry
     
-        return None  # 뎅기열 관련 없으면 제외
+    def get_rate_limiter(self, url):
+        """엔드포인트별 rate limiter 반환 (없으면 생성)"""
+        with self._rate_limiters_lock:
+            limiter = self._rate_limiters.get(url)
+            if limiter is None:
+                limiter = OverpassRateLimiter(self.endpoint_concurrency, self.request_interval)
+                self._rate_limiters[url] = limiter
+            return limiter
     
-    def save_to_csv(self, facilities, country_code):
-        filename = f"data/{country_code}_facilities.csv"
+    def post_overpass(self, query, stream=False):
+        """rate limit을 지키며 Overpass에 쿼리 전송 (429/504는 백오프 후 재시도)"""
+        limiter = self.get_rate_limiter(self.overpass_url)
         
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['name', 'lat', 'lng', 'type', 'country']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        for attempt in range(self.max_retries + 1):
+            self.metrics.add('http_requests')
+            with limiter:
+                response = requests.post(
+                    self.overpass_url,
+                    data=query,
+                    timeout=120,
+                    stream=stream
+                )
             
-            writer.writeheader()
-            for facility in facilities:
-                writer.writerow(facility)
+            if response.status_code not in (429, 504) or attempt == self.max_retries:
+                return response
+            
+            response.close()
+            self.metrics.add('http_retries')
+            retry_after = response.headers.get('Retry-After', '')
+            delay = float(retry_after) if retry_after.isdigit() else 2 ** (attempt + 1)
+            print(f"⏳ Overpass {response.status_code} 응답, {delay:.0f}초 후 재시도")
+            time.sleep(delay)
+    
+    def fetch_tile(self, tile, country_code, summary=None, query=None):
+        """타일 하나의 응답 → (열린 캐시 파일 또는 임시 파일 경로, 캐시 키) (분할이 필요하면 TileRetry)
+        
+        캐시에서 찾았으면 열린 파일과 None (evict가 지워도 끝까지 읽을 수 있음),
+        새로 받은 응답은 아직 캐시에 넣지 않은 임시 파일 경로와 캐시 키
+        (iter_tile이 파싱하면서 검사한 뒤 저장). query를 주면 수집 쿼리 대신 사용 (delta_sync)
+        """
+        if query is None:
+            with self.metrics.timer('query_build', country_code):
+                query = self.build_overpass_query(tile, country_code)
+        can_split = tile_size(tile) / 2 >= self.min_tile_size
+        
+        # 캐시 우선 (오프라인 모드와 이어서 수집할 때 이미 끝난 타일은 만료된 캐시도 사용)
+        cache_key = self.cache.make_key(query, tile)
+        allow_expired = self.offline or self.journal.tile_status(country_code, tile) == 'done'
+        cached = self.cache.open(cache_key, allow_expired=allow_expired)
+        if cached is not None:
+            if summary is not None:
+                summary['cache_hits'] += 1
+            self.metrics.add('cache_hits', 1, country_code)
+            self.metrics.add('bytes_cached', os.fstat(cached.fileno()).st_size, country_code)
+            return cached, None
+        if self.offline:
+            raise CacheMiss(f"캐시 없음: 타일 {tile_key(tile)}")
+        
+        # 응답은 메모리에 올리지 않고 바로 임시 파일로 스트리밍
+        try:
+            with self.metrics.timer('http', country_code), self.post_overpass(query, stream=True) as response:
+                if response.status_code == 504:
+                    raise TileRetry("HTTP 504")
+                if response.status_code != 200:
+                    raise RuntimeError(f"HTTP {response.status_code}")
+                
+                tmp_path = self.cache.spool(
+                    response.iter_content(chunk_size=64 * 1024),
+                    max_size=self.max_tile_bytes if can_split else None
+                )
+        except requests.exceptions.Timeout:
+            raise TileRetry("요청 타임아웃")
+        except ResponseTooLarge as e:
+            raise TileRetry(str(e))
+        self.metrics.add('bytes_downloaded', os.path.getsize(tmp_path), country_code)
+        return tmp_path, cache_key
+    
+    def iter_tile(self, tile, country_code, summary=None, query=None):
+        """타일 하나의 element 제너레이터 (분할이 필요하면 도중에 TileRetry, 끝나면 ElementStream 반환)
         
-        print(f"💾 {filename}에 {len(facilities)}개 시설 저장 완료")
+        새로 받은 응답은 element를 내보내는 한 번의 파싱에서 element 수와 remark를 확인하고,
+        끝까지 정상일 때만 캐시에 저장한다. 도중에 분할하게 되면 이미 내보낸 element는 유효한 데이터이고,
+        하위 타일에서 다시 내려오는 같은 element는 호출하는 쪽에서 (type, id)로 걸러낸다.
+        """
+        source, cache_key = self.fetch_tile(tile, country_code, summary, query)
+        check = cache_key is not None and tile_size(tile) / 2 >= self.min_tile_size
+        try:
+            with (source if cache_key is None else open(source, 'rb')) as f:
+                stream = ElementStream(iter_chunks(f))
+                for element in self.metrics.iter_timed(stream, 'parse', country_code):
+                    if check and stream.count > self.max_tile_elements:
+                        raise TileRetry(f"element {self.max_tile_elements}개 초과")
+                    yield element
+            # Overpass는 서버 타임아웃/메모리 초과를 200 + remark로 알려줌
+            if cache_key is not None and 'runtime error' in stream.remark:
+                raise TileRetry(stream.remark)
+        except BaseException:
+            # 분할 대상/오류 응답/중간에 멈춘 응답은 캐시에 저장하지 않음
+            if cache_key is not None:
+                self.cache.discard(source)
+            raise
+        if cache_key is not None:
+            self.cache.commit(cache_key, source)
+        return stream
+    
+    def iter_tile_elements(self, country_code, summary):
+        """국가 bbox를 타일로 나눠 수집하고 element를 하나씩 내보냄"""
+        bbox = self.countries[country_code]['bbox']
+        pending = plan_tiles(bbox, self.max_tile_size)
+        seen = set()
+        
+        while pending:
+            tile = pending.pop()
+            
+            # 이전 실행에서 분할된 타일은 다시 요청하지 않고 바로 분할
+            if self.journal.tile_status(country_code, tile) == 'split':
+                pending.extend(subdivide_tile(tile))
+                continue
+            
+            before, duplicates = summary['elements'], 0
+            try:
+                for element in self.iter_tile(tile, country_code, summary):
+                    # 타일 경계에 걸친 element는 중복으로 내려오므로 (type, id)로 한 번만 처리
+                    key = (element['type'], element['id'])
+                    if key in seen:
+                        duplicates += 1
+                        continue
+                    seen.add(key)
+                    summary['elements'] += 1
+                    yield element
+            except (TileRetry, CacheMiss) as e:
+                self.metrics.exception(e, 'fetch_tile', country_code)
+                # 오프라인 재생 시 캐시 miss는 원래 실행에서 분할된 타일일 수 있으므로 동일하게 분할
+                if tile_size(tile) / 2 < self.min_tile_size:
+                    raise RuntimeError(f"타일 {tile_key(tile)} 분할 한계 도달: {e}")
+                print(f"✂️ 타일 {tile_key(tile)} 4분할 ({e})")
+                pending.extend(subdivide_tile(tile))
+                self.metrics.add('tile_splits', 1, country_code)
+                # 캐시 miss는 실제로 분할이 필요한지 모르므로 split으로 남기지 않음 (온라인 --resume에서 다시 요청)
+                self.journal.mark_tile(country_code, tile, 'pending' if isinstance(e, CacheMiss) else 'split')
+                continue
+            finally:
+                self.metrics.add('elements', summary['elements'] - before, country_code)
+                self.metrics.add('duplicate_elements', duplicates, country_code)
+            
+            summary['tiles'] += 1
+            self.metrics.add('tiles', 1, country_code)
+            self.journal.mark_tile(country_code, tile, 'done')
+    
+    def iter_facilities(self, elements, country_code):
+        """element 이터러블 → (질병, 시설 dict) 제너레이터 (element 하나가 여러 질병에 해당할 수 있음)"""
+        shown = kept = dropped = outside = 0
+        seconds = 0.0
+        locator = self.locator if self.locator.has_boundaries else None
+        try:
+            for element in elements:
+                started = time.perf_counter()
+                facilities = self.process_element(element, country_code)
+                if facilities and locator:
+                    first = next(iter(facilities.values()))
+                    located = locator.locate(first['lat'], first['lng'], fallback=False)
+                    if located is not None and located != country_code:
+                        outside += 1
+                        facilities = {}
+                seconds += time.perf_counter() - started
+                if not facilities:
+                    dropped += 1
+                    continue
+                kept += 1
+                for disease, facility in facilities.items():
+                    if shown < 5:  # 처음 5개만 출력
+                        print(f"  - {facility['name']} ({disease}: {facility['type']})")
+                        shown += 1
+                    yield disease, facility
+        finally:
+            self.metrics.add_time('filter', seconds, country_code, kept + dropped)
+            self.metrics.add('kept', kept, country_code)
+            self.metrics.add('dropped', dropped, country_code)
+            self.metrics.add('outside_country', outside, country_code)
     
     def collect_country_data(self, country_code):
         print(f"🚀 {country_code} 데이터 수집 시작")
         
-        country_info = self.countries[country_code]
-        bbox = country_info['bbox']
-        
-        query = self.build_overpass_query(bbox, country_code)
+        started = time.monotonic()
+        summary = {
+            'country': country_code,
+            'status': 'failed',
+            'tiles': 0,
+            'cache_hits': 0,
+            'elements': 0,
+            'facilities': 0,
+            'seconds': 0.0,
+            'error': None
+        }
         
+        self.journal.start_country(country_code)
         try:
-            response = requests.post(
-                self.overpass_url,
-                data=query,
-                timeout=120
-            )
+            # 다운로드 → 파싱 → 필터링 → CSV/컬럼형 저장을 제너레이터로 연결 (전체 목록을 메모리에 두지 않음)
+            with self.metrics.profile(f"collector_{country_code}"):
+                elements = self.iter_tile_elements(country_code, summary)
+                records = self.iter_facilities(elements, country_code)
+                summary['diseases'] = self.save_disease_outputs(records, country_code)
+            summary['facilities'] = sum(summary['diseases'].values())
+            summary['status'] = 'ok'
+            self.journal.finish_country(country_code, summary['facilities'], [
+                path for disease in self.diseases for path in output_paths(country_code, disease)
+            ])
             
-            if response.status_code == 200:
-                data = response.json()
-                print(f"✅ {len(data['elements'])}개 시설 발견")
-                
-                # 뎅기열 관련 시설 필터링
-                filtered_facilities = []
-                for element in data['elements']:
-                    facility = self.process_facility(element, country_code)
-                    if facility:
-                        filtered_facilities.append(facility)
-                
-                print(f"🔍 뎅기열 관련 시설: {len(filtered_facilities)}개")
-                
-                for facility in filtered_facilities[:5]:  # 처음 5개만 출력
-                    print(f"  - {facility['name']} ({facility['type']})")
-                
-                # CSV 파일로 저장
-                self.save_to_csv(filtered_facilities, country_code)
-                    
-            else:
-                print(f"❌ 오류: {response.status_code}")
+            counts = ', '.join(f"{disease} {count}" for disease, count in summary['diseases'].items())
+            print(f"✅ {summary['elements']}개 시설 중 관련 시설 {counts} (타일 {summary['tiles']}개)")
                 
         except Exception as e:
             print(f"❌ 데이터 수집 실패: {e}")
+            summary['error'] = str(e)
+            self.metrics.exception(e, 'collect_country_data', country_code)
+            self.journal.fail_country(country_code, e)
+        
+        summary['seconds'] = round(time.monotonic() - started, 2)
+        return summary
+    
+    def collect_all_countries(self, country_codes=None, max_workers=None, resume=False):
+        """여러 국가를 동시에 수집하고 국가별 요약 목록 반환 (resume=True면 저널에서 성공한 국가는 건너뜀)"""
+        country_codes = list(country_codes or self.countries.keys())
+        max_workers = max_workers or self.max_workers
+        
+        if resume:
+            remaining = self.journal.unfinished(country_codes)
+            print(f"⏩ 이전 실행에서 완료된 {len(country_codes) - len(remaining)}개국 건너뜀")
+            country_codes = remaining
+        
+        print(f"🌍 {len(country_codes)}개국 동시 수집 시작 (workers={max_workers})")
+        started = time.monotonic()
+        
+        summaries = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.collect_country_data, code): code
+                for code in country_codes
+            }
+            for future in as_completed(futures):
+                summaries[futures[future]] = future.result()
+        
+        ordered = [summaries[code] for code in country_codes]
+        self.print_run_summary(ordered, time.monotonic() - started)
+        return ordered
+    
+    def print_run_summary(self, summaries, total_seconds):
+        """국가별 소요 시간/개수 요약 출력"""
+        print("\n📊 수집 요약")
+        print(f"{'country':<18}{'status':<8}{'tiles':>7}{'cached':>8}{'elements':>10}{'facilities':>12}{'seconds':>10}")
+        for s in summaries:
+            print(f"{s['country']:<18}{s['status']:<8}{s['tiles']:>7}{s['cache_hits']:>8}{s['elements']:>10}{s['facilities']:>12}{s['seconds']:>10.2f}")
+        
+        ok = sum(1 for s in summaries if s['status'] == 'ok')
+        facilities = sum(s['facilities'] for s in summaries)
+        print(f"✅ {ok}/{len(summaries)}개국 성공, 시설 {facilities}개, 총 {total_seconds:.1f}초")
 
 if __name__ == "__main__":
-    collector = OSMDengueCollector()
-    collector.collect_country_data('papua_new_guinea')
\ No newline at end of file
+    # python osm_data_collector.py --all            → 전체 국가 동시 수집
+    # python osm_data_collector.py --all --offline  → data/raw 캐시만으로 재분류
+    # python osm_data_collector.py --all --profile  → 국가별 cProfile 결과(.prof)도 저장 (순차 수집)
+    # python osm_data_collector.py --all --resume   → data/runs/journal.json 기준으로 실패/미완료 국가만 이어서 수집
+    # python osm_data_collector.py --all --diseases=dengue,malaria  → 한 번의 다운로드로 여러 질병 분류 (--diseases=all 가능)
+    # python osm_data_collector.py --all --refresh  → 캐시를 쓰지 않고 모든 타일을 새로 받음 (--cache-ttl=0과 같음)
+    # python osm_data_collector.py --all --cache-ttl=3600  → 1시간 안에 받은 응답만 재사용 (기본 12시간)
+    #   (--resume은 이미 끝난 타일을 만료와 무관하게 캐시에서 재생, --offline은 항상 캐시만 사용)
+    options = dict(arg[2:].partition('=')[::2] for arg in sys.argv[1:] if arg.startswith('--'))
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    profile = '--profile' in sys.argv
+    resume = '--resume' in sys.argv
+    diseases = None
+    for arg in sys.argv[1:]:
+        if arg.startswith('--diseases='):
+            value = arg.split('=', 1)[1]
+            diseases = list(DISEASES) if value == 'all' else value.split(',')
+    collector = OSMDengueCollector(
+        offline='--offline' in sys.argv,
+        metrics=RunMetrics(profile=profile),
+        # 오프라인 재생은 온라인 수집 저널과 따로 기록 (캐시 miss 타일 상태가 온라인 --resume에 섞이지 않게)
+        journal=RunJournal('data/runs/journal_offline.json' if '--offline' in sys.argv else DEFAULT_JOURNAL_PATH,
+                           resume=resume),
+        diseases=diseases,
+        cache_ttl=0 if 'refresh' in options else float(options.get('cache-ttl') or DEFAULT_CACHE_TTL)
+    )
+    
+    if '--all' in sys.argv:
+        collector.collect_all_countries(max_workers=1 if profile else None, resume=resume)
+    else:
+        collector.collect_country_data(args[0] if args else 'papua_new_guinea')
+    
+    collector.journal.print_summary()
+    collector.metrics.print_stage_summary()
+    json_path, prom_path = collector.metrics.write()
+    print(f"📈 계측 결과: {json_path}, {prom_path}")
\ No newline at end of file
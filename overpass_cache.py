@@ -0,0 +1,162 @@
+"""
+Overpass 원본 응답 디스크 캐시 (data/raw/)
+쿼리 텍스트 + bbox 해시를 키로 저장 → 분류 로직만 바꿨을 때 네트워크 없이 재실행
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+
+class CacheMiss(Exception):
+    """오프라인(cache-only) 모드에서 캐시에 없는 요청"""
+
+
+class ResponseTooLarge(Exception):
+    """스트리밍 저장 중 응답이 허용 크기를 넘음"""
+
+
+class OverpassCache:
+    def __init__(self, cache_dir='data/raw', ttl=7 * 24 * 3600, max_bytes=2 * 1024 ** 3):
+        self.cache_dir = cache_dir
+        self.ttl = ttl                # 초 단위, None이면 만료 없음
+        self.max_bytes = max_bytes    # 캐시 전체 크기 상한, 초과 시 오래된 것부터 삭제
+        self._total_bytes = None      # 첫 put 때 한 번만 디렉터리를 스캔해 계산
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def make_key(self, query, bbox):
+        """쿼리 텍스트와 bbox로 만든 내용 주소(sha256)"""
+        payload = json.dumps({'query': query.strip(), 'bbox': list(bbox)}, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def path_for(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get_path(self, key, allow_expired=False):
+        """캐시 파일 경로 반환 (없거나 만료되면 None)"""
+        path = self.path_for(key)
+        try:
+            stat = os.stat(path)
+            if not allow_expired and self.ttl is not None and time.time() - stat.st_mtime > self.ttl:
+                return None
+            # 최근 사용 시각 갱신 (LRU 삭제 기준), 만료 기준인 mtime은 유지
+            os.utime(path, (time.time(), stat.st_mtime))
+        except FileNotFoundError:
+            # 다른 스레드의 evict가 방금 지운 경우도 miss
+            return None
+        return path
+
+    def open(self, key, allow_expired=False):
+        """캐시 파일을 열어 바이너리 파일 객체로 반환 (없거나 만료되면 None)
+
+        경로만 받아 나중에 열면 그 사이에 evict가 지울 수 있으므로 읽을 때는 이것을 사용
+        (한 번 연 파일은 지워져도 끝까지 읽을 수 있음)
+        """
+        path = self.get_path(key, allow_expired)
+        if path is None:
+            return None
+        try:
+            return open(path, 'rb')
+        except FileNotFoundError:
+            return None
+
+    def get(self, key, allow_expired=False):
+        """캐시된 응답 바이트 반환 (없거나 만료되면 None)"""
+        f = self.open(key, allow_expired)
+        if f is None:
+            return None
+
+        with f:
+            return f.read()
+
+    def put(self, key, content):
+        """응답 바이트를 원자적으로 저장하고 용량 초과분 정리"""
+        return self.commit(key, self.spool([content]))
+
+    def spool(self, chunks, max_size=None):
+        """응답 스트림을 임시 파일에 기록하고 경로 반환 (메모리에 전체를 올리지 않음)"""
+        tmp_path = os.path.join(self.cache_dir, f".{os.getpid()}.{threading.get_ident()}.{time.monotonic_ns()}.tmp")
+        size = 0
+
+        try:
+            with open(tmp_path, 'wb') as f:
+                for chunk in chunks:
+                    size += len(chunk)
+                    if max_size is not None and size > max_size:
+                        raise ResponseTooLarge(f"응답 {size} bytes 초과")
+                    f.write(chunk)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+        return tmp_path
+
+    def discard(self, tmp_path):
+        """spool한 임시 파일 폐기"""
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+
+    def commit(self, key, tmp_path):
+        """spool한 임시 파일을 캐시 항목으로 확정하고 용량 초과분 정리"""
+        path = self.path_for(key)
+        size = os.path.getsize(tmp_path)
+
+        if self.max_bytes is None:
+            os.replace(tmp_path, path)
+            return path
+
+        # 매번 디렉터리를 훑지 않도록 누적 크기를 추적하고, 상한을 넘을 때만 정리
+        with self._lock:
+            # 같은 키를 덮어쓰면 이전 파일 크기만큼 빠짐
+            try:
+                replaced = os.path.getsize(path)
+            except FileNotFoundError:
+                replaced = 0
+            os.replace(tmp_path, path)
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_total()
+            else:
+                self._total_bytes += size - replaced
+            if self._total_bytes > self.max_bytes:
+                self.evict()
+
+        return path
+
+    def _scan_total(self):
+        return sum(
+            entry.stat().st_size for entry in os.scandir(self.cache_dir)
+            if entry.is_file() and entry.name.endswith('.json')
+        )
+
+    def evict(self):
+        """전체 크기가 max_bytes를 넘으면 가장 오래 안 쓴 파일부터 삭제"""
+        if self.max_bytes is None:
+            return 0
+
+        entries = []
+        total = 0
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file() and entry.name.endswith('.json'):
+                stat = entry.stat()
+                entries.append((stat.st_atime, stat.st_size, entry.path))
+                total += stat.st_size
+
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except (FileNotFoundError, PermissionError):
+                # 이미 지워졌거나 (Windows에서) 다른 스레드가 읽는 중인 파일
+                continue
+            total -= size
+            removed += 1
+
+        self._total_bytes = total
+        return removed
@@ -0,0 +1,70 @@
+"""
+Overpass 쿼리 생성
+키워드 필터를 서버 쪽 정규식으로 옮겨, 관련 없는 병원/클리닉은 처음부터 내려받지 않음
+"""
+
+# POSIX 확장 정규식 특수문자 (Overpass 정규식 문법)
+_REGEX_SPECIAL = set('.^$*+?()[]{}|\\')
+
+
+def escape_overpass_regex(keyword):
+    """키워드를 Overpass 정규식 리터럴로 이스케이프"""
+    escaped = ''.join(f'\\{char}' if char in _REGEX_SPECIAL else char for char in keyword)
+    # 쿼리 문자열 리터럴 안에 들어가므로 역슬래시/따옴표를 한 번 더 이스케이프
+    return escaped.replace('\\', '\\\\').replace('"', '\\"')
+
+
+def keyword_regex(keywords):
+    """키워드 목록 → 하나의 대안(|) 정규식"""
+    return '|'.join(escape_overpass_regex(keyword) for keyword in keywords)
+
+
+def _facility_statements(bbox, keywords, amenities, tag_keys):
+    """키워드 태그를 가진 병원/클리닉을 .facilities 집합에 모으는 union 문"""
+    west, south, east, north = bbox
+    area = f"{south},{west},{north},{east}"
+    amenity_regex = '^(' + '|'.join(amenities) + ')$'
+    pattern = keyword_regex(keywords)
+
+    statements = '\n'.join(
+        f'  nwr["amenity"~"{amenity_regex}"]["{key}"~"{pattern}",i]({area});'
+        for key in tag_keys
+    )
+    return f"(\n{statements}\n)->.facilities;"
+
+
+def build_filtered_query(bbox, keywords, amenities=('clinic', 'hospital'),
+                         tag_keys=('name', 'description', 'healthcare'), timeout=60):
+    """name/description/healthcare 태그에 키워드가 있는 시설만 받는 쿼리
+
+    - node뿐 아니라 건물 폴리곤(way)/relation도 포함 (out center로 중심 좌표만 받음)
+    - meta(버전/작성자/시각)와 way의 노드 목록은 받지 않음
+      (node는 좌표+태그만 있는 out body, way/relation은 out tags center)
+    """
+    return f"""
+[out:json][timeout:{timeout}];
+{_facility_statements(bbox, keywords, amenities, tag_keys)}
+node.facilities;
+out body;
+(way.facilities; relation.facilities;);
+out tags center;
+"""
+
+
+def build_delta_query(bbox, keywords, since=None, amenities=('clinic', 'hospital'),
+                      tag_keys=('name', 'description', 'healthcare'), timeout=60):
+    """증분 동기화 쿼리: 현재 조건에 맞는 전체 id 목록 + since 이후 바뀐 element만 본문 포함
+
+    - 첫 번째 out ids: 태그 없이 type/id만 → 스냅샷과 비교해 삭제(또는 조건에서 빠짐) 감지
+    - 두 번째 출력: newer:since 필터로 새로 생기거나 수정된 element만 (since가 없으면 전체)
+    """
+    newer = f'(newer:"{since}")' if since else ''
+    return f"""
+[out:json][timeout:{timeout}];
+{_facility_statements(bbox, keywords, amenities, tag_keys)}
+.facilities out ids;
+node.facilities{newer};
+out body;
+(way.facilities{newer}; relation.facilities{newer};);
+out tags center;
+"""
@@ -0,0 +1,116 @@
+"""
+Overpass JSON 응답의 elements 배열을 스트리밍으로 파싱
+응답 전체를 json.loads 하지 않고 element를 하나씩 꺼내므로 메모리 사용량이 응답 크기와 무관
+"""
+
+import codecs
+import json
+import re
+
+_ELEMENTS_KEY = re.compile(r'"elements"\s*:\s*\[')
+_REMARK = re.compile(r'"remark"\s*:\s*"((?:[^"\\]|\\.)*)"')
+_TIMESTAMP = re.compile(r'"timestamp_osm_base"\s*:\s*"([^"]*)"')
+_WHITESPACE = ' \t\r\n,'
+
+
+class ElementStream:
+    """바이트 청크 이터러블 → element dict 이터레이터
+
+    순회가 끝나면 elements 뒤에 붙는 remark(서버 타임아웃 등)를 self.remark로,
+    응답 앞부분 osm3s의 데이터 기준 시각을 self.timestamp로 확인 가능
+    """
+
+    def __init__(self, chunks, compact_at=1024 * 1024):
+        self.chunks = iter(chunks)
+        self.compact_at = compact_at
+        self.remark = ''
+        self.timestamp = ''
+        self.count = 0
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._json = json.JSONDecoder()
+        self._buf = ''
+        self._eof = False
+
+    def _read_more(self):
+        """청크를 하나 더 읽어 버퍼에 추가 (더 없으면 False)"""
+        for chunk in self.chunks:
+            if chunk:
+                self._buf += self._decoder.decode(chunk)
+                return True
+        if not self._eof:
+            self._buf += self._decoder.decode(b'', final=True)
+            self._eof = True
+        return False
+
+    def __iter__(self):
+        # "elements": [ 위치 찾기 (그 앞의 osm3s 헤더에서 데이터 기준 시각 확인)
+        while True:
+            match = _ELEMENTS_KEY.search(self._buf)
+            timestamp = _TIMESTAMP.search(self._buf, 0, match.start() if match else len(self._buf))
+            if timestamp:
+                self.timestamp = timestamp.group(1)
+            if match:
+                pos = match.end()
+                break
+            # 키/시각이 청크 경계에 걸칠 수 있으므로 끝부분은 남겨둠
+            self._buf = self._buf[-128:]
+            if not self._read_more():
+                self._read_tail()
+                return
+
+        while True:
+            # 구분자/공백 건너뛰기
+            while True:
+                while pos < len(self._buf) and self._buf[pos] in _WHITESPACE:
+                    pos += 1
+                if pos < len(self._buf) or not self._read_more():
+                    break
+
+            if pos >= len(self._buf):
+                raise ValueError("Overpass 응답이 elements 배열 도중에 끝났습니다")
+
+            if self._buf[pos] == ']':
+                self._buf = self._buf[pos + 1:]
+                self._read_tail()
+                return
+
+            try:
+                element, end = self._json.raw_decode(self._buf, pos)
+            except json.JSONDecodeError:
+                # element가 청크 경계에 걸침 → 더 읽고 재시도
+                if not self._read_more():
+                    raise
+                continue
+
+            self.count += 1
+            yield element
+            pos = end
+
+            # 소비한 앞부분은 주기적으로 버려 버퍼 크기를 일정하게 유지
+            if pos > self.compact_at:
+                self._buf = self._buf[pos:]
+                pos = 0
+
+    def _read_tail(self):
+        """elements 이후의 나머지(remark 등) 확인"""
+        while self._read_more():
+            pass
+        match = _REMARK.search(self._buf)
+        if match:
+            self.remark = json.loads(f'"{match.group(1)}"')
+        self._buf = ''
+
+
+def iter_chunks(f, chunk_size=64 * 1024):
+    """열린 바이너리 파일을 청크 단위로 읽기 (닫지 않음)"""
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_file_chunks(path, chunk_size=64 * 1024):
+    """파일을 청크 단위로 읽기"""
+    with open(path, 'rb') as f:
+        yield from iter_chunks(f, chunk_size)
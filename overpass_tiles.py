@@ -0,0 +1,66 @@
+"""
+Overpass 쿼리용 bbox 타일 분할
+bbox 형식: [west, south, east, north] (country_registry.COUNTRIES와 동일)
+"""
+
+import math
+
+
+def split_antimeridian(bbox):
+    """±180° 경계를 넘는 bbox(west > east)를 두 개의 정상 bbox로 분리"""
+    west, south, east, north = bbox
+
+    if west <= east:
+        return [[west, south, east, north]]
+
+    # 예: 피지 [177.9, -19.5, -178.4, -16.0] → 동쪽 끝 + 서쪽 끝
+    return [
+        [west, south, 180.0, north],
+        [-180.0, south, east, north]
+    ]
+
+
+def plan_tiles(bbox, max_tile_size=5.0):
+    """국가 bbox를 한 변이 max_tile_size(도) 이하인 타일 목록으로 분할"""
+    tiles = []
+
+    for west, south, east, north in split_antimeridian(bbox):
+        cols = max(1, math.ceil((east - west) / max_tile_size))
+        rows = max(1, math.ceil((north - south) / max_tile_size))
+        width = (east - west) / cols
+        height = (north - south) / rows
+
+        for row in range(rows):
+            for col in range(cols):
+                tiles.append([
+                    round(west + col * width, 6),
+                    round(south + row * height, 6),
+                    round(west + (col + 1) * width, 6) if col < cols - 1 else east,
+                    round(south + (row + 1) * height, 6) if row < rows - 1 else north
+                ])
+
+    return tiles
+
+
+def subdivide_tile(tile):
+    """타일을 4등분 (타임아웃/데이터 과다 시 재시도용)"""
+    west, south, east, north = tile
+    mid_lng = round((west + east) / 2, 6)
+    mid_lat = round((south + north) / 2, 6)
+
+    return [
+        [west, south, mid_lng, mid_lat],
+        [mid_lng, south, east, mid_lat],
+        [west, mid_lat, mid_lng, north],
+        [mid_lng, mid_lat, east, north]
+    ]
+
+
+def tile_size(tile):
+    """타일의 긴 변 길이(도)"""
+    return max(tile[2] - tile[0], tile[3] - tile[1])
+
+
+def tile_key(tile):
+    """로그/저널용 타일 식별 문자열"""
+    return ','.join(f"{v:g}" for v in tile)
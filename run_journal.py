@@ -0,0 +1,146 @@
+"""
+수집 실행 저널 (data/runs/journal.json)
+
+국가별 상태(pending/running/ok/failed)와 오류, 타일별 상태(done/split/pending), 저장된 출력 파일을 기록한다.
+실행이 중간에 죽거나 429로 실패해도 --resume으로 다시 실행하면 끝나지 않은 국가만 수집하고,
+이미 끝난 타일은 (만료됐더라도) data/raw 캐시에서 재생, 분할됐던 타일은 다시 요청하지 않고 바로 분할한다.
+
+- 국가 상태가 바뀔 때(체크포인트)만 저널 전체를 원자적으로 교체 저장 (fsync)
+- 타일 상태는 {저널}.tiles 파일에 한 줄씩 덧붙이고, 다음 체크포인트에서 저널에 합친 뒤 비움
+  → 타일 수가 많은 국가에서도 타일마다 전체를 다시 쓰지 않음, 다시 읽을 때는 저널 + 덧붙인 줄을 함께 적용
+- --resume 없이 새로 시작할 때 이전 저널이 있으면 덮어쓰지 않고 journal.{시작 시각}.json으로 옮겨 둠
+  (처음 기록할 때 옮기므로 저널을 읽기만 하는 실행은 건드리지 않음)
+"""
+
+import json
+import os
+import threading
+import time
+
+from atomic_io import write_json_atomic
+from overpass_tiles import tile_key
+
+DEFAULT_JOURNAL_PATH = 'data/runs/journal.json'
+
+
+def _now():
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+
+
+class RunJournal:
+    def __init__(self, path=DEFAULT_JOURNAL_PATH, resume=False):
+        self.path = path
+        self.tiles_path = path + '.tiles'
+        self._lock = threading.Lock()
+        self._tile_log = None
+        self.data = None
+        if resume and os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                self.data = json.load(f)
+            self.data['resumed'] = self.data.get('resumed', 0) + 1
+            self._replay_tiles()
+        # 새 실행은 처음 저장할 때 이전 저널을 보관하고 시작
+        self._claimed = self.data is not None
+        if self.data is None:
+            self.data = {'started': _now(), 'resumed': 0, 'countries': {}}
+
+    def _replay_tiles(self):
+        """마지막 체크포인트 이후 덧붙인 타일 상태 적용 (마지막 줄이 잘렸으면 무시)"""
+        if not os.path.exists(self.tiles_path):
+            return
+        with open(self.tiles_path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    country_code, key, status = json.loads(line)
+                except ValueError:
+                    break
+                self._country(country_code)['tiles'][key] = status
+
+    def _claim(self):
+        """--resume 없는 실행의 첫 기록: 이전 저널(과 타일 로그)을 덮어쓰지 않고 옮겨 둠"""
+        if self._claimed:
+            return
+        self._claimed = True
+        if os.path.exists(self.path):
+            with open(self.path, encoding='utf-8') as f:
+                try:
+                    started = json.load(f).get('started') or _now()
+                except ValueError:
+                    started = _now()
+            stamp = started.replace('-', '').replace(':', '')
+            base, ext = os.path.splitext(self.path)
+            archived = f"{base}.{stamp}{ext}"
+            os.replace(self.path, archived)
+            if os.path.exists(self.tiles_path):
+                os.replace(self.tiles_path, archived + '.tiles')
+            print(f"📒 이전 저널을 {archived}로 옮김 (이어서 수집하려면 --resume)")
+        elif os.path.exists(self.tiles_path):
+            os.remove(self.tiles_path)
+
+    def _country(self, country_code):
+        return self.data['countries'].setdefault(country_code, {
+            'status': 'pending', 'error': None, 'facilities': 0, 'outputs': [], 'tiles': {}
+        })
+
+    def _record(self, country_code, **fields):
+        with self._lock:
+            entry = self._country(country_code)
+            entry.update(fields, updated=_now())
+            self.save()
+            return entry
+
+    def save(self):
+        """체크포인트: 저널 전체 저장 후 타일 로그 비움 (호출하는 쪽에서 잠금)"""
+        self._claim()
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        write_json_atomic(self.path, self.data)
+        if self._tile_log is not None:
+            self._tile_log.close()
+            self._tile_log = None
+        if os.path.exists(self.tiles_path):
+            os.remove(self.tiles_path)
+
+    # ---------- 국가 ----------
+
+    def start_country(self, country_code):
+        """수집 시작 (이전 실행의 타일 기록은 유지)"""
+        self._record(country_code, status='running', error=None)
+
+    def finish_country(self, country_code, facilities, outputs):
+        self._record(country_code, status='ok', facilities=facilities, outputs=list(outputs))
+
+    def fail_country(self, country_code, error):
+        self._record(country_code, status='failed', error=str(error))
+
+    def status(self, country_code):
+        return self.data['countries'].get(country_code, {}).get('status', 'pending')
+
+    def unfinished(self, country_codes):
+        """아직 성공하지 못한 국가만 (순서 유지)"""
+        return [code for code in country_codes if self.status(code) != 'ok']
+
+    # ---------- 타일 ----------
+
+    def tile_status(self, country_code, tile):
+        return self.data['countries'].get(country_code, {}).get('tiles', {}).get(tile_key(tile))
+
+    def mark_tile(self, country_code, tile, status):
+        """타일 상태 기록 (타일 로그에 한 줄 덧붙임, fsync는 다음 체크포인트에서)"""
+        key = tile_key(tile)
+        with self._lock:
+            self._country(country_code)['tiles'][key] = status
+            if self._tile_log is None:
+                self._claim()
+                os.makedirs(os.path.dirname(self.tiles_path) or '.', exist_ok=True)
+                self._tile_log = open(self.tiles_path, 'a', encoding='utf-8')
+            self._tile_log.write(json.dumps([country_code, key, status], ensure_ascii=False) + '\n')
+            self._tile_log.flush()
+
+    def print_summary(self):
+        counts = {}
+        for entry in self.data['countries'].values():
+            counts[entry['status']] = counts.get(entry['status'], 0) + 1
+        failed = [code for code, entry in self.data['countries'].items() if entry['status'] == 'failed']
+        print(f"📒 저널 {self.path}: " + ', '.join(f"{status} {count}" for status, count in sorted(counts.items())))
+        for code in failed:
+            print(f"  ❌ {code}: {self.data['countries'][code]['error']}")
@@ -1,10 +1,17 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from country_registry import COUNTRIES
+
+
 class GlobalDengueSystem:
     def __init__(self):
+        # 국가 정보는 country_registry 공용 (지도 중심/줌만 사용)
         self.countries = {
-            'bangladesh': {'center': [23.6850, 90.3563], 'zoom': 7},
-            'nigeria': {'center': [9.0820, 8.6753], 'zoom': 6},
-            'brazil': {'center': [-14.2350, -51.9253], 'zoom': 4},
-            'thailand': {'center': [15.8700, 100.9925], 'zoom': 6}
+            code: {'center': info['center'], 'zoom': info['zoom']}
+            for code, info in COUNTRIES.items()
         }
         
         self.diseases = ['dengue', 'malaria', 'zika', 'chikungunya']
@@ -0,0 +1,35 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from collector_metrics import METRIC_PREFIX, RunMetrics
+
+
+def sample(text, name):
+    for line in text.splitlines():
+        if line.startswith(f"{METRIC_PREFIX}_{name}"):
+            return line.rsplit(' ', 1)[1]
+    raise AssertionError(f"{name} 샘플 없음")
+
+
+def test_large_counter_keeps_every_digit():
+    metrics = RunMetrics()
+    metrics.add('bytes_downloaded', 123456789, 'bangladesh')
+    text = metrics.to_prometheus()
+    assert sample(text, 'bytes_downloaded_total') == '123456789'
+
+
+def test_timestamp_is_not_rounded():
+    metrics = RunMetrics()
+    before = time.time()
+    value = float(sample(metrics.to_prometheus(), 'last_run_timestamp_seconds'))
+    assert before <= value <= time.time()
+    assert value > 1.7e9
+
+
+def test_float_seconds_round_trip():
+    metrics = RunMetrics()
+    metrics.add_time('http', 1234567.123456, 'laos')
+    assert float(sample(metrics.to_prometheus(), 'stage_seconds_total')) == 1234567.123456
@@ -0,0 +1,65 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from wire_format import check_round_trip, decode_facilities, encode_facilities, sample_facilities, size_report
+
+ODD_IDS = ['gov-123', 'node/007', '=x', '/5', 'way/12/3', 'node/', 'node/²', 'relation/9', 'node/5', '']
+
+
+def odd_facilities():
+    facilities = sample_facilities(200, seed=3)
+    for facility, osm_id in zip(facilities, ODD_IDS):
+        facility['osm_id'] = osm_id
+    return facilities
+
+
+def test_round_trip_keeps_raw_ids():
+    facilities = odd_facilities()
+    assert check_round_trip(facilities) == []
+    decoded = decode_facilities(encode_facilities(facilities))
+    assert [facility['osm_id'] for facility in decoded[:len(ODD_IDS)]] == ODD_IDS
+
+
+def test_round_trip_empty():
+    assert decode_facilities(encode_facilities([])) == []
+    assert check_round_trip([]) == []
+
+
+def test_coordinates_within_quantization():
+    facilities = sample_facilities(1000)
+    for original, decoded in zip(facilities, decode_facilities(encode_facilities(facilities))):
+        assert abs(decoded['lat'] - original['lat']) <= 0.5e-6 + 1e-9
+        assert abs(decoded['lng'] - original['lng']) <= 0.5e-6 + 1e-9
+
+
+def test_smaller_than_json_and_gzip_json():
+    sizes = size_report(sample_facilities(10000))
+    assert sizes['wire'] < sizes['json'] / 4
+    assert sizes['wire_gzip'] < sizes['json_gzip']
+
+
+@pytest.mark.skipif(shutil.which('node') is None, reason="node 없음")
+def test_js_decoder_matches_python(tmp_path):
+    facilities = odd_facilities()
+    payload = encode_facilities(facilities)
+    wire_path = tmp_path / 'facilities.fwire'
+    wire_path.write_bytes(payload)
+
+    script = (
+        "const { decodeFacilities } = require(process.argv[1]);"
+        "const bytes = new Uint8Array(require('fs').readFileSync(process.argv[2]));"
+        "process.stdout.write(JSON.stringify(decodeFacilities(bytes)));"
+    )
+    output = subprocess.run(
+        ['node', '-e', script, os.path.join(ROOT, 'js', 'wire-decoder.js'), str(wire_path)],
+        check=True, capture_output=True
+    ).stdout
+    assert json.loads(output) == decode_facilities(payload)
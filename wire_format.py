@@ -0,0 +1,267 @@
+"""
+시설 데이터 압축 전송 포맷 (.fwire)
+
+JSON은 행마다 키 이름이 반복되고 좌표가 긴 문자열로 들어가므로, 저사양 기기/불안정한 네트워크에서
+전송량이 크다. 이 포맷은 컬럼 단위로 다음과 같이 저장한다. (디코더: js/wire-decoder.js, 스냅샷: dataset_versions)
+
+- lat/lng: 1e-6도(약 0.1m) 단위 정수로 양자화 → 이전 행과의 차이 → zigzag varint
+- type/country: 값 사전 + 행별 코드(varint)
+- name: 중복 없는 문자열 표 + 행별 인덱스(varint)
+- osm_id: 종류(node/way/relation) 코드 + 번호 차이(zigzag varint)
+  '종류/번호' 형식이 아닌 id는 종류 표에 '=' + 원문 그대로 넣고 번호는 0
+
+구조:
+    MAGIC(4) | 행 수 | 사전(type) | 사전(country) | 문자열 표(name) | 사전(osm 종류)
+    | lat 차이들 | lng 차이들 | type 코드들 | country 코드들 | name 인덱스들 | osm 종류 코드들 | osm 번호 차이들
+    (모든 정수는 LEB128 varint, 문자열은 길이 varint + UTF-8)
+"""
+
+import gzip
+import json
+import random
+import sys
+
+MAGIC = b'FWR\x01'
+COORD_SCALE = 1000000
+WIRE_FIELDS = ['name', 'lat', 'lng', 'type', 'country', 'osm_id']
+# 종류 표에서 '종류/번호'로 나눌 수 없는 osm_id 원문 표시
+RAW_ID_PREFIX = '='
+
+
+def write_varint(out, value):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data, pos):
+    result = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def zigzag(value):
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def unzigzag(value):
+    return value // 2 if value % 2 == 0 else -(value + 1) // 2
+
+
+def write_string(out, text):
+    encoded = text.encode('utf-8')
+    write_varint(out, len(encoded))
+    out += encoded
+
+
+def read_string(data, pos):
+    length, pos = read_varint(data, pos)
+    return data[pos:pos + length].decode('utf-8'), pos + length
+
+
+def write_table(out, values):
+    write_varint(out, len(values))
+    for value in values:
+        write_string(out, value)
+
+
+def read_table(data, pos):
+    count, pos = read_varint(data, pos)
+    values = []
+    for _ in range(count):
+        value, pos = read_string(data, pos)
+        values.append(value)
+    return values, pos
+
+
+def _interned(values):
+    """값 목록 → (중복 없는 값 표, 행별 코드)"""
+    table, index, codes = [], {}, []
+    for value in values:
+        code = index.get(value)
+        if code is None:
+            code = index[value] = len(table)
+            table.append(value)
+        codes.append(code)
+    return table, codes
+
+
+def _split_osm_id(osm_id):
+    """'node/123' → ('node', 123), 없으면 ('', 0), 형식이 다르면 ('=' + 원문, 0) (디코딩하면 원문 그대로)"""
+    if not osm_id:
+        return '', 0
+    kind, _, number = osm_id.partition('/')
+    # 번호를 int로 바꿨다 되돌려도 같은 문자열일 때만 분리 ('node/007'은 원문 보존)
+    # isdigit()은 '²' 같은 ASCII 밖 숫자도 참 → ASCII 숫자만 번호로 인정
+    if (not kind or kind.startswith(RAW_ID_PREFIX) or not (number.isascii() and number.isdigit())
+            or str(int(number)) != number):
+        return RAW_ID_PREFIX + osm_id, 0
+    return kind, int(number)
+
+
+def _join_osm_id(kind, number):
+    if kind.startswith(RAW_ID_PREFIX):
+        return kind[len(RAW_ID_PREFIX):]
+    return f"{kind}/{number}" if kind else ''
+
+
+def encode_facilities(facilities):
+    """시설 dict 목록 → bytes"""
+    rows = [[
+        '' if facility.get(field) is None else str(facility.get(field))
+        for field in ('name', 'type', 'country', 'osm_id')
+    ] + [float(facility['lat']), float(facility['lng'])] for facility in facilities]
+
+    names, name_codes = _interned(row[0] for row in rows)
+    types, type_codes = _interned(row[1] for row in rows)
+    countries, country_codes = _interned(row[2] for row in rows)
+    osm_ids = [_split_osm_id(row[3]) for row in rows]
+    kinds, kind_codes = _interned(kind for kind, _ in osm_ids)
+
+    out = bytearray(MAGIC)
+    write_varint(out, len(rows))
+    write_table(out, types)
+    write_table(out, countries)
+    write_table(out, names)
+    write_table(out, kinds)
+
+    for column in (4, 5):
+        previous = 0
+        for row in rows:
+            value = round(row[column] * COORD_SCALE)
+            write_varint(out, zigzag(value - previous))
+            previous = value
+
+    for codes in (type_codes, country_codes, name_codes, kind_codes):
+        for code in codes:
+            write_varint(out, code)
+
+    previous = 0
+    for _, number in osm_ids:
+        write_varint(out, zigzag(number - previous))
+        previous = number
+
+    return bytes(out)
+
+
+def decode_facilities(data):
+    """bytes → 시설 dict 목록 (lat/lng는 1e-6 단위로 반올림된 값)"""
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError("시설 전송 포맷(.fwire) 데이터가 아닙니다")
+
+    pos = len(MAGIC)
+    count, pos = read_varint(data, pos)
+    types, pos = read_table(data, pos)
+    countries, pos = read_table(data, pos)
+    names, pos = read_table(data, pos)
+    kinds, pos = read_table(data, pos)
+
+    def read_column(pos, delta):
+        values, previous = [], 0
+        for _ in range(count):
+            value, pos = read_varint(data, pos)
+            if delta:
+                previous += unzigzag(value)
+                value = previous
+            values.append(value)
+        return values, pos
+
+    lats, pos = read_column(pos, True)
+    lngs, pos = read_column(pos, True)
+    type_codes, pos = read_column(pos, False)
+    country_codes, pos = read_column(pos, False)
+    name_codes, pos = read_column(pos, False)
+    kind_codes, pos = read_column(pos, False)
+    numbers, pos = read_column(pos, True)
+
+    facilities = []
+    for i in range(count):
+        facilities.append({
+            'name': names[name_codes[i]],
+            'lat': lats[i] / COORD_SCALE,
+            'lng': lngs[i] / COORD_SCALE,
+            'type': types[type_codes[i]],
+            'country': countries[country_codes[i]],
+            'osm_id': _join_osm_id(kinds[kind_codes[i]], numbers[i])
+        })
+    return facilities
+
+
+def check_round_trip(facilities):
+    """인코딩 → 디코딩 결과가 원본과 같은지 확인 (좌표는 양자화 오차 허용), 불일치 목록 반환"""
+    decoded = decode_facilities(encode_facilities(facilities))
+    if len(decoded) != len(facilities):
+        return [f"행 수 불일치: {len(facilities)} → {len(decoded)}"]
+
+    errors = []
+    for i, (original, result) in enumerate(zip(facilities, decoded)):
+        for field in ('name', 'type', 'country', 'osm_id'):
+            expected = '' if original.get(field) is None else str(original.get(field))
+            if result[field] != expected:
+                errors.append(f"{i}행 {field}: {expected!r} → {result[field]!r}")
+        for field in ('lat', 'lng'):
+            if abs(result[field] - float(original[field])) > 0.5 / COORD_SCALE + 1e-9:
+                errors.append(f"{i}행 {field}: {original[field]} → {result[field]}")
+    return errors
+
+
+def size_report(facilities):
+    """JSON / gzip JSON / 전송 포맷 / gzip 전송 포맷 크기 비교 (바이트)"""
+    json_payload = json.dumps([
+        {field: facility.get(field) for field in WIRE_FIELDS} for facility in facilities
+    ], ensure_ascii=False).encode('utf-8')
+    wire_payload = encode_facilities(facilities)
+    return {
+        'json': len(json_payload),
+        'json_gzip': len(gzip.compress(json_payload, mtime=0)),
+        'wire': len(wire_payload),
+        'wire_gzip': len(gzip.compress(wire_payload, mtime=0))
+    }
+
+
+def sample_facilities(count, seed=0):
+    """확인용 임의 시설 (한 국가 안에 모인 좌표, 반복되는 타입/국가)"""
+    rng = random.Random(seed)
+    types = ['dengue_center', 'vaccine', 'blood_test', 'aid']
+    return [{
+        'name': rng.choice(['', f"Clinic {rng.randrange(count)}", f"ডেঙ্গু কেন্দ্র {i}", 'Unknown Facility']),
+        'lat': round(rng.uniform(20.5, 26.5), 7),
+        'lng': round(rng.uniform(88.0, 92.7), 7),
+        'type': rng.choice(types),
+        'country': 'bangladesh',
+        'osm_id': rng.choice(['', f"node/{rng.randrange(10 ** 10)}", f"way/{rng.randrange(10 ** 9)}"])
+    } for i in range(count)]
+
+
+if __name__ == "__main__":
+    # python wire_format.py --check [시설 파일]  → 왕복 검사 + 크기 비교
+    # python wire_format.py 입력(.fcol/.csv) 출력.fwire
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+
+    if '--check' in sys.argv:
+        if args:
+            from facility_store import iter_facility_file
+            facilities = list(iter_facility_file(args[0]))
+        else:
+            facilities = sample_facilities(10000)
+
+        errors = check_round_trip(facilities) + check_round_trip([]) + check_round_trip(sample_facilities(1, seed=1))
+        for error in errors[:10]:
+            print(f"❌ {error}")
+        if errors:
+            sys.exit(1)
+
+        sizes = size_report(facilities)
+        print(f"✅ 왕복 검사 통과 ({len(facilities)}개 시설)")
+        for label, size in sizes.items():
+            print(f"  {label:10} {size:>12,} bytes  ({size / sizes['json'] * 100:5.1f}%)")
+    else:
+        from facility_store import iter_facility_file
+        with open(args[1], 'wb') as f:
+            f.write(encode_facilities(list(iter_facility_file(args[0]))))